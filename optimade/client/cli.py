@@ -8,6 +8,7 @@ import rich
 
 from optimade import __api_version__, __version__
 from optimade.client.client import OptimadeClient
+from optimade.client.utils import get_results_sink
 
 if TYPE_CHECKING:  # pragma: no cover
     from typing import Union
@@ -43,7 +44,7 @@ __all__ = ("_get",)
 @click.option(
     "--output-file",
     default=None,
-    help="Write the results to a JSON file at this location.",
+    help="Write the results to a JSON file at this location, or to a JSON Lines file with one entry per line if the filename ends with `.jsonl`. Downloaded entries are streamed to disk rather than held in memory.",
 )
 @click.option(
     "--count/--no-count",
@@ -112,6 +113,11 @@ __all__ = ("_get",)
     type=float,
     help="The timeout to use for each HTTP request.",
 )
+@click.option(
+    "--prefetch-pages",
+    default=0,
+    help="The number of pages to request from each provider ahead of the page being processed, when using asyncio.",
+)
 def get(
     use_async,
     filter,
@@ -132,6 +138,7 @@ def get(
     verbosity,
     skip_ssl,
     http_timeout,
+    prefetch_pages,
 ):
     return _get(
         use_async,
@@ -153,6 +160,7 @@ def get(
         verbosity,
         skip_ssl,
         http_timeout,
+        prefetch_pages=prefetch_pages,
     )
 
 
@@ -176,6 +184,7 @@ def _get(
     verbosity,
     skip_ssl,
     http_timeout,
+    prefetch_pages=0,
     **kwargs,
 ):
     if output_file:
@@ -202,6 +211,7 @@ def _get(
         else None,
         "silent": silent,
         "skip_ssl": skip_ssl,
+        "prefetch_pages": prefetch_pages,
     }
 
     # Only set http timeout if its not null to avoid overwriting or duplicating the
@@ -231,6 +241,18 @@ def _get(
                 results = client.search_property(
                     entry_type=list_properties, query=search_property
                 )
+        elif output_file:
+            # Stream the pages of results to disk as they are received
+            with get_results_sink(output_file) as sink:
+                for f in filter:
+                    client.stream_to(
+                        sink,
+                        f,
+                        endpoint=endpoint,
+                        sort=sort,
+                        response_fields=response_fields,
+                    )
+            return
         else:
             for f in filter:
                 client.get(
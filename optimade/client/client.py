@@ -9,10 +9,20 @@ import asyncio
 import functools
 import json
 import math
-import time
+import threading
+import weakref
 from collections import defaultdict
-from collections.abc import Callable, Iterable
-from typing import Any
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Generator,
+    Iterable,
+    Iterator,
+)
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from typing import Any, TypeVar
 from urllib.parse import urlparse
 
 # External deps that are only used in the client code
@@ -34,7 +44,10 @@ from optimade.client.utils import (
     OptimadeClientProgress,
     QueryResults,
     RecoverableHTTPError,
+    ResultsSink,
+    TokenBucket,
     TooManyRequestsException,
+    backoff_delay,
     silent_raise,
 )
 from optimade.exceptions import BadRequest
@@ -45,6 +58,8 @@ ENDPOINTS = ("structures", "references", "calculations", "info", "extensions", "
 
 __all__ = ("OptimadeClient",)
 
+T = TypeVar("T")
+
 
 class OptimadeClient:
     """This class implemements a client for executing the same queries
@@ -56,10 +71,25 @@ class OptimadeClient:
     into the `all_results` attribute, keyed by endpoint, filter
     and provider.
 
+    For result sets too large to hold in memory, the pages of results
+    can instead be consumed as they arrive with
+    [`stream_async`][optimade.client.client.OptimadeClient.stream_async],
+    or written incrementally to a file with
+    [`stream_to`][optimade.client.client.OptimadeClient.stream_to].
+
+    HTTP connections are pooled and kept alive across queries for the
+    lifetime of the client, which can be used as a context manager
+    (or closed with [`close`][optimade.client.client.OptimadeClient.close])
+    to release them.
+
     """
 
-    base_urls: str | Iterable[str]
-    """A list (or any iterable) of OPTIMADE base URLs to query."""
+    base_urls: list[str]
+    """The OPTIMADE base URLs to query.
+
+    If not provided, this list is filled in with the databases of the registered
+    providers as they are discovered, which continues while the first queries run.
+    """
 
     all_results: dict[str, dict[str, dict[str, QueryResults]]] = defaultdict(dict)
     """A nested dictionary keyed by endpoint and OPTIMADE filter string that contains
@@ -115,6 +145,13 @@ class OptimadeClient:
 
     """
 
+    prefetch_pages: int = 0
+    """The number of pages to request from each API ahead of the page currently
+    being processed in asynchronous mode, overlapping the requests with the
+    decoding of previous pages and the execution of callbacks.
+    If zero, each page is only requested once the previous one has been processed.
+    """
+
     count_binary_search: bool = True
     """Enable binary search count for databases that do not support `meta->data_returned`."""
 
@@ -137,9 +174,43 @@ class OptimadeClient:
     """Used internally when querying via `client.structures.get()` to set the
     chosen endpoint. Should be reset to `None` outside of all `get()` calls."""
 
+    http2: bool = False
+    """Whether to use HTTP/2 for asynchronous requests, where supported by the API."""
+
+    max_connections_per_host: int | None = None
+    """The maximum number of simultaneous requests, and hence connections, to each
+    queried host in asynchronous mode. If None, only `max_concurrent_requests` applies.
+    """
+
+    max_concurrent_requests: int | None = 16
+    """The maximum number of requests in flight at any time across all APIs, in
+    asynchronous mode. If None, requests are only limited per API.
+    """
+
     _http_client: type[httpx.AsyncClient] | type[requests.Session] | None = None
     """Override the HTTP client class, primarily used for testing."""
 
+    _rate_limiters: dict[str, TokenBucket]
+    """The token buckets pacing the requests to each host, following the
+    `meta->request_delay` advertised by its APIs."""
+
+    _request_semaphores: weakref.WeakKeyDictionary
+    """The semaphores limiting the number of concurrent requests in each event loop,
+    overall and per host."""
+
+    _discovery: Generator[str, None, None] | None = None
+    """The pending discovery of the databases of the registered providers, if any."""
+
+    _event_loop: asyncio.AbstractEventLoop | None = None
+    """The event loop owned by this client, used to run its asynchronous queries
+    from synchronous methods, so that its pooled HTTP client can be reused."""
+
+    _pooled_async_client: httpx.AsyncClient | None = None
+    """The HTTP client shared by all asynchronous queries run in `_event_loop`."""
+
+    _pooled_client: requests.Session | None = None
+    """The HTTP session shared by all synchronous queries."""
+
     __strict_async: bool = False
     """Whether or not to fallover if `use_async` is true yet asynchronous mode
     is impossible due to, e.g., a running event loop.
@@ -166,6 +237,10 @@ class OptimadeClient:
         verbosity: int = 0,
         callbacks: list[Callable[[str, dict], None | dict]] | None = None,
         skip_ssl: bool = False,
+        prefetch_pages: int = 0,
+        http2: bool = False,
+        max_connections_per_host: int | None = None,
+        max_concurrent_requests: int | None = 16,
     ):
         """Create the OPTIMADE client object.
 
@@ -186,6 +261,14 @@ class OptimadeClient:
             callbacks: A list of functions to call after each successful response, see the
                 attribute [`OptimadeClient.callbacks`][optimade.client.client.OptimadeClient.callbacks] docstring for more details.
             verbosity: The verbosity level of the client.
+            prefetch_pages: The number of pages to request from each API ahead of
+                the page being processed, in asynchronous mode.
+            http2: Whether to use HTTP/2 for asynchronous requests (requires the
+                `h2` package).
+            max_connections_per_host: The maximum number of simultaneous
+                connections to each queried host, in asynchronous mode.
+            max_concurrent_requests: The maximum number of requests in flight
+                across all APIs, in asynchronous mode (None for no limit).
 
         """
 
@@ -201,6 +284,12 @@ class OptimadeClient:
         self.silent = silent
         self.verbosity = verbosity
         self.skip_ssl = skip_ssl
+        self.prefetch_pages = prefetch_pages
+        self.http2 = http2
+        self.max_connections_per_host = max_connections_per_host
+        self.max_concurrent_requests = max_concurrent_requests
+        self._rate_limiters = {}
+        self._request_semaphores = weakref.WeakKeyDictionary()
 
         self._progress = OptimadeClientProgress()
         if self.silent:
@@ -209,30 +298,30 @@ class OptimadeClient:
         if headers:
             self.headers.update(headers)
 
+        self._discovery = None
+        self._discovery_lock = threading.Lock()
+
         if not base_urls:
-            progress = None
-            if not self.silent:
-                progress = OptimadeClientProgress()
-            self.base_urls = list(
-                get_all_databases(
-                    exclude_providers=self._excluded_providers,
-                    include_providers=self._included_providers,
-                    exclude_databases=self._excluded_databases,
-                    progress=progress,
-                    skip_ssl=self.skip_ssl,
-                )
+            # Discover the databases of the registered providers in the background,
+            # such that queries can start on the first ones found while slower
+            # providers are still responding
+            self.base_urls = []
+            self._discovery = get_all_databases(
+                exclude_providers=self._excluded_providers,
+                include_providers=self._included_providers,
+                exclude_databases=self._excluded_databases,
+                skip_ssl=self.skip_ssl,
             )
+            self._discover_next_url()
         else:
             if exclude_providers or include_providers or exclude_databases:
                 raise RuntimeError(
                     "Cannot provide both a list of base URLs and included/excluded databases."
                 )
 
-            self.base_urls = base_urls
-
-            if isinstance(self.base_urls, str):
-                self.base_urls = [self.base_urls]
-            self.base_urls = list(self.base_urls)
+            self.base_urls = (
+                [base_urls] if isinstance(base_urls, str) else list(base_urls)
+            )
 
         if not self.base_urls:
             raise SystemExit(
@@ -299,6 +388,46 @@ class OptimadeClient:
 
         return super().__getattribute__(name)
 
+    def __enter__(self) -> "OptimadeClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the pooled HTTP connections and the event loop of the client,
+        and stops any pending discovery of the databases of the registered providers.
+
+        The client can still be used afterwards, in which case new connections
+        are opened.
+
+        """
+        with self._discovery_lock:
+            discovery, self._discovery = self._discovery, None
+        if discovery is not None:
+            discovery.close()
+
+        event_loop, async_client = self._event_loop, self._pooled_async_client
+        self._event_loop = None
+        self._pooled_async_client = None
+        if event_loop is not None and not event_loop.is_closed():
+            try:
+                if async_client is not None:
+                    event_loop.run_until_complete(async_client.aclose())
+                event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+            finally:
+                event_loop.close()
+
+        if self._pooled_client is not None:
+            self._pooled_client.close()
+            self._pooled_client = None
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def get(
         self,
         filter: str | None = None,
@@ -337,13 +466,7 @@ class OptimadeClient:
         self._check_filter(filter, endpoint)
 
         with self._progress:
-            if not self.silent:
-                self._progress.print(
-                    Panel(
-                        f"Performing query [bold yellow]{endpoint}[/bold yellow]/?filter=[bold magenta][i]{filter}[/i][/bold magenta]",
-                        expand=False,
-                    )
-                )
+            self._print_query_panel(filter, endpoint)
             results = self._execute_queries(
                 filter,
                 endpoint,
@@ -355,6 +478,149 @@ class OptimadeClient:
             self.all_results[endpoint][filter] = results
             return {endpoint: {filter: {k: results[k].asdict() for k in results}}}
 
+    async def stream_async(
+        self,
+        filter: str | None = None,
+        endpoint: str | None = None,
+        response_fields: list[str] | None = None,
+        sort: str | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Streams the results from the endpoint and filter across the
+        defined OPTIMADE APIs, yielding each page of results as soon as it
+        has been received, rather than collecting all results in memory
+        as [`get`][optimade.client.client.OptimadeClient.get] does.
+
+        The APIs are queried concurrently, and the received pages of all APIs
+        wait to be consumed in a single queue of at most `max_concurrent_requests`
+        pages (or of one page per initially configured API, if that is unlimited),
+        which a fast API may fill on its own. Each API also requests at most
+        `prefetch_pages` pages ahead. Memory usage is thus bounded by the page
+        size rather than by the total number of results.
+
+        !!! example
+            ```python
+            async for base_url, page in client.stream_async('elements HAS "Ag"'):
+                for structure in page["data"]:
+                    ...
+            ```
+
+        Parameters:
+            filter: The OPTIMADE filter string for the query.
+            endpoint: The endpoint to query.
+            response_fields: A list of response fields to request
+                from the server.
+            sort: The field by which to sort the results.
+
+        Raises:
+            RuntimeError: If the filter could not be parsed.
+
+        Yields:
+            The base URL and the results of one page from that API, with keys
+            'data', 'meta', 'links', 'errors' and 'included'. If querying an API
+            fails, a page with an empty 'data' list and the error is yielded.
+
+        """
+        if endpoint is None:
+            if self.__current_endpoint is not None:
+                endpoint = self.__current_endpoint
+                self.__current_endpoint = None
+            else:
+                endpoint = "structures"
+
+        if filter is None:
+            filter = ""
+
+        self._check_filter(filter, endpoint)
+
+        with self._progress:
+            self._print_query_panel(filter, endpoint)
+            if self.use_async:
+                async for base_url, page_results in self._stream_pages_async(
+                    endpoint, filter, response_fields=response_fields, sort=sort
+                ):
+                    yield base_url, page_results
+            else:
+                for base_url, page_results in self._stream_pages(
+                    endpoint, filter, response_fields=response_fields, sort=sort
+                ):
+                    yield base_url, page_results
+
+    def stream_to(
+        self,
+        sink: ResultsSink,
+        filter: str | None = None,
+        endpoint: str | None = None,
+        response_fields: list[str] | None = None,
+        sort: str | None = None,
+    ) -> dict[str, int]:
+        """Writes the results from the endpoint and filter across the
+        defined OPTIMADE APIs to the sink, one page at a time, such that
+        arbitrarily large result sets can be downloaded without being held
+        in memory.
+
+        !!! example
+            ```python
+            from optimade.client.utils import JSONLinesSink
+
+            with JSONLinesSink("structures.jsonl") as sink:
+                client.stream_to(sink, 'elements HAS "Ag"')
+            ```
+
+        Parameters:
+            sink: The sink to write the pages of results to, e.g., a
+                [`JSONLinesSink`][optimade.client.utils.JSONLinesSink].
+            filter: The OPTIMADE filter string for the query.
+            endpoint: The endpoint to query.
+            response_fields: A list of response fields to request
+                from the server.
+            sort: The field by which to sort the results.
+
+        Raises:
+            RuntimeError: If the filter could not be parsed.
+
+        Returns:
+            A mapping from base URL to the number of entries written.
+
+        """
+        if endpoint is None:
+            if self.__current_endpoint is not None:
+                endpoint = self.__current_endpoint
+                self.__current_endpoint = None
+            else:
+                endpoint = "structures"
+
+        if filter is None:
+            filter = ""
+
+        self._check_filter(filter, endpoint)
+
+        num_results: dict[str, int] = {}
+
+        def _write(base_url: str, page_results: dict[str, Any]) -> None:
+            sink.write(endpoint, filter, base_url, page_results)
+            num_results.setdefault(base_url, 0)
+            if isinstance(page_results["data"], list):
+                num_results[base_url] += len(page_results["data"])
+
+        with self._progress:
+            self._print_query_panel(filter, endpoint)
+            if self._check_event_loop():
+
+                async def _consume() -> None:
+                    async for base_url, page_results in self._stream_pages_async(
+                        endpoint, filter, response_fields=response_fields, sort=sort
+                    ):
+                        _write(base_url, page_results)
+
+                self._run(_consume())
+            else:
+                for base_url, page_results in self._stream_pages(
+                    endpoint, filter, response_fields=response_fields, sort=sort
+                ):
+                    _write(base_url, page_results)
+
+        return num_results
+
     def count(
         self, filter: str | None = None, endpoint: str | None = None
     ) -> dict[str, dict[str, dict[str, int | None]]]:
@@ -474,7 +740,7 @@ class OptimadeClient:
         """
         if result is None:
             # first a check that there are any results at all
-            result = asyncio.run(
+            result = self._run(
                 self.get_one_async(
                     endpoint,
                     filter,
@@ -498,7 +764,7 @@ class OptimadeClient:
         while attempts < max_attempts:
             self._progress.disable = True
 
-            result = asyncio.run(
+            result = self._run(
                 self.get_one_async(
                     endpoint,
                     filter,
@@ -648,6 +914,44 @@ class OptimadeClient:
                         matching_properties[entry_type][database].append(property)
         return matching_properties[entry_type]
 
+    def _check_event_loop(self) -> bool:
+        """Checks whether the queries can be run in a new event loop, switching
+        to synchronous mode if there is already a running event loop.
+
+        Returns:
+            Whether to run the queries asynchronously.
+
+        """
+        if self.use_async:
+            # Check for a pre-existing event loop (e.g. within a Jupyter notebook)
+            # and use it if present
+            try:
+                event_loop = asyncio.get_running_loop()
+                if event_loop:
+                    if self.__strict_async:
+                        raise RuntimeError(
+                            "Detected a running event loop, cannot run in async mode."
+                        )
+                    self._progress.print(
+                        "Detected a running event loop (e.g., Jupyter). Attempting to switch to synchronous mode."
+                    )
+                    self.use_async = False
+                    self._http_client = requests.Session
+            except RuntimeError:
+                event_loop = None
+
+        return self.use_async and not event_loop
+
+    def _print_query_panel(self, filter: str, endpoint: str) -> None:
+        """Prints the query being performed, unless in silent mode."""
+        if not self.silent:
+            self._progress.print(
+                Panel(
+                    f"Performing query [bold yellow]{endpoint}[/bold yellow]/?filter=[bold magenta][i]{filter}[/i][/bold magenta]",
+                    expand=False,
+                )
+            )
+
     def _execute_queries(
         self,
         filter: str,
@@ -676,26 +980,8 @@ class OptimadeClient:
             A mapping from base URL to `QueryResults` for each queried API.
 
         """
-        if self.use_async:
-            # Check for a pre-existing event loop (e.g. within a Jupyter notebook)
-            # and use it if present
-            try:
-                event_loop = asyncio.get_running_loop()
-                if event_loop:
-                    if self.__strict_async:
-                        raise RuntimeError(
-                            "Detected a running event loop, cannot run in async mode."
-                        )
-                    self._progress.print(
-                        "Detected a running event loop (e.g., Jupyter). Attempting to switch to synchronous mode."
-                    )
-                    self.use_async = False
-                    self._http_client = requests.Session
-            except RuntimeError:
-                event_loop = None
-
-        if self.use_async and not event_loop:
-            return asyncio.run(
+        if self._check_event_loop():
+            return self._run(
                 self._get_all_async(
                     endpoint,
                     filter,
@@ -801,24 +1087,25 @@ class OptimadeClient:
             A dictionary mapping from base URL to the results of the query.
 
         """
-        if not base_urls:
-            base_urls = self.base_urls
-
-        results = await asyncio.gather(
-            *[
-                self.get_one_async(
-                    endpoint,
-                    filter,
-                    base_url,
-                    page_limit=page_limit,
-                    paginate=paginate,
-                    response_fields=response_fields,
-                    sort=sort,
-                    other_params=other_params,
+        # Start querying each API as soon as it has been discovered
+        tasks = []
+        async for base_url in self._iter_base_urls_async(base_urls):
+            tasks.append(
+                asyncio.create_task(
+                    self.get_one_async(
+                        endpoint,
+                        filter,
+                        base_url,
+                        page_limit=page_limit,
+                        paginate=paginate,
+                        response_fields=response_fields,
+                        sort=sort,
+                        other_params=other_params,
+                    )
                 )
-                for base_url in base_urls
-            ]
-        )
+            )
+
+        results = await asyncio.gather(*tasks)
         return functools.reduce(lambda r1, r2: {**r1, **r2}, results)
 
     def _get_all(
@@ -852,8 +1139,6 @@ class OptimadeClient:
             A dictionary mapping from base URL to the results of the query.
 
         """
-        if not base_urls:
-            base_urls = self.base_urls
         results = [
             self.get_one(
                 endpoint,
@@ -865,13 +1150,207 @@ class OptimadeClient:
                 sort=sort,
                 other_params=other_params,
             )
-            for base_url in base_urls
+            for base_url in self._iter_base_urls(base_urls)
         ]
         if results:
             return functools.reduce(lambda r1, r2: {**r1, **r2}, results)
 
         return {}
 
+    def _discover_next_url(self) -> None:
+        """Adds the next database discovered from the registered providers to
+        `base_urls`, blocking until one is found or the discovery is complete."""
+        with self._discovery_lock:
+            if self._discovery is None:
+                return
+            base_url = next(self._discovery, None)
+            if base_url is None:
+                self._discovery = None
+            else:
+                self.base_urls.append(base_url)
+
+    def _iter_base_urls(self, base_urls: Iterable[str] | None = None) -> Iterator[str]:
+        """Iterates over the given base URLs, or over `base_urls` followed by any
+        databases discovered meanwhile.
+
+        Parameters:
+            base_urls: A list of base URLs to iterate over (defaults to `self.base_urls`).
+
+        Yields:
+            The base URLs to query.
+
+        """
+        if base_urls:
+            yield from base_urls
+            return
+
+        index = 0
+        while True:
+            if index < len(self.base_urls):
+                yield self.base_urls[index]
+                index += 1
+            elif self._discovery is not None:
+                self._discover_next_url()
+            else:
+                return
+
+    async def _iter_base_urls_async(
+        self, base_urls: Iterable[str] | None = None
+    ) -> AsyncIterator[str]:
+        """Iterates over the given base URLs, or over `base_urls` followed by any
+        databases discovered meanwhile, without blocking the event loop while
+        waiting for the discovery.
+
+        Parameters:
+            base_urls: A list of base URLs to iterate over (defaults to `self.base_urls`).
+
+        Yields:
+            The base URLs to query.
+
+        """
+        if base_urls:
+            for base_url in base_urls:
+                yield base_url
+            return
+
+        index = 0
+        while True:
+            if index < len(self.base_urls):
+                yield self.base_urls[index]
+                index += 1
+            elif self._discovery is not None:
+                await asyncio.to_thread(self._discover_next_url)
+            else:
+                return
+
+    async def _stream_pages_async(
+        self,
+        endpoint: str,
+        filter: str,
+        response_fields: list[str] | None = None,
+        sort: str | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Executes the query concurrently across all defined APIs, yielding
+        the pages of results in the order they are received.
+
+        Each API is paginated by its own task, started as soon as the API has
+        been discovered, which waits for its previous page to be consumed before
+        requesting the next one once the queue of received pages is full.
+
+        Parameters:
+            endpoint: The OPTIMADE endpoint to query.
+            filter: The OPTIMADE filter string.
+            response_fields: A list of response fields to request
+                from the server.
+            sort: The field by which to sort the results.
+
+        Yields:
+            The base URL and the results of one page from that API.
+
+        """
+        queue: asyncio.Queue[tuple[str, dict[str, Any] | None]] = asyncio.Queue(
+            maxsize=self.max_concurrent_requests or max(len(self.base_urls), 1)
+        )
+        tasks: list[asyncio.Task] = []
+        # The number of producers (APIs and the discovery of APIs) not yet exhausted
+        remaining = 1
+
+        async def _produce(base_url: str) -> None:
+            try:
+                async for page_results in self._iter_pages_async(
+                    endpoint,
+                    filter,
+                    base_url,
+                    response_fields=response_fields,
+                    sort=sort,
+                ):
+                    await queue.put((base_url, page_results))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                await queue.put((base_url, self._error_page(base_url, exc)))
+            # Signal that this API has been exhausted
+            await queue.put((base_url, None))
+
+        async def _discover() -> None:
+            nonlocal remaining
+            try:
+                async for base_url in self._iter_base_urls_async():
+                    remaining += 1
+                    tasks.append(asyncio.create_task(_produce(base_url)))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._progress.print(
+                    f"[red]Error[/red]: Unable to discover further databases: [red i]{exc}[/red i]"
+                )
+            await queue.put(("", None))
+
+        tasks.append(asyncio.create_task(_discover()))
+        try:
+            while remaining:
+                base_url, page_results = await queue.get()
+                if page_results is None:
+                    remaining -= 1
+                    continue
+                yield base_url, page_results
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _stream_pages(
+        self,
+        endpoint: str,
+        filter: str,
+        response_fields: list[str] | None = None,
+        sort: str | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Executes the query serially across all defined APIs, yielding the
+        pages of results as they are received.
+
+        Parameters:
+            endpoint: The OPTIMADE endpoint to query.
+            filter: The OPTIMADE filter string.
+            response_fields: A list of response fields to request
+                from the server.
+            sort: The field by which to sort the results.
+
+        Yields:
+            The base URL and the results of one page from that API.
+
+        """
+        for base_url in self._iter_base_urls():
+            try:
+                for page_results in self._iter_pages(
+                    endpoint,
+                    filter,
+                    base_url,
+                    response_fields=response_fields,
+                    sort=sort,
+                ):
+                    yield base_url, page_results
+            except Exception as exc:
+                yield base_url, self._error_page(base_url, exc)
+
+    def _error_page(self, base_url: str, exc: Exception) -> dict[str, Any]:
+        """Reports an error raised while querying an API and wraps it as a page
+        of results without any data.
+
+        Parameters:
+            base_url: The base URL of the API.
+            exc: The raised exception.
+
+        Returns:
+            The results for a page containing only the error.
+
+        """
+        error = f"{exc.__class__.__name__}: {exc}"
+        self._progress.print(
+            f"[red]Error[/red]: Provider {str(base_url)!r} returned: [red i]{error}[/red i]"
+        )
+        return {"data": [], "meta": {}, "links": {}, "included": [], "errors": [error]}
+
     async def get_one_async(
         self,
         endpoint: str,
@@ -890,8 +1369,9 @@ class OptimadeClient:
             This method currently makes non-blocking requests
             to a single API, but these requests are executed
             serially on that API, i.e., results are pulled one
-            page at a time, but requests will not block other
-            async requests to other APIs.
+            page at a time (or up to `prefetch_pages` ahead),
+            but requests will not block other async requests
+            to other APIs.
 
         Parameters:
             endpoint: The OPTIMADE endpoint to query.
@@ -947,6 +1427,76 @@ class OptimadeClient:
         override_url: str | None = None,
     ) -> dict[str, QueryResults]:
         """See [`OptimadeClient.get_one_async`][optimade.client.OptimadeClient.get_one_async]."""
+        results = QueryResults()
+        async for page_results in self._iter_pages_async(
+            endpoint,
+            filter,
+            base_url,
+            page_limit=page_limit,
+            paginate=paginate,
+            response_fields=response_fields,
+            sort=sort,
+            other_params=other_params,
+            override_url=override_url,
+        ):
+            results.update(page_results)
+        return {str(base_url): results}
+
+    def _get_one(
+        self,
+        endpoint: str,
+        filter: str,
+        base_url: str,
+        sort: str | None = None,
+        page_limit: int | None = None,
+        response_fields: list[str] | None = None,
+        paginate: bool = True,
+        other_params: dict[str, Any] | None = None,
+        override_url: str | None = None,
+    ) -> dict[str, QueryResults]:
+        """See [`OptimadeClient.get_one`][optimade.client.OptimadeClient.get_one]."""
+        results = QueryResults()
+        for page_results in self._iter_pages(
+            endpoint,
+            filter,
+            base_url,
+            page_limit=page_limit,
+            paginate=paginate,
+            response_fields=response_fields,
+            sort=sort,
+            other_params=other_params,
+            override_url=override_url,
+        ):
+            results.update(page_results)
+        return {str(base_url): results}
+
+    async def _iter_pages_async(
+        self,
+        endpoint: str,
+        filter: str,
+        base_url: str,
+        response_fields: list[str] | None = None,
+        sort: str | None = None,
+        page_limit: int | None = None,
+        paginate: bool = True,
+        other_params: dict[str, Any] | None = None,
+        override_url: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Executes the query asynchronously on one API, yielding the results
+        of each page as soon as it has been received.
+
+        If `prefetch_pages` is set, the following pages are requested while
+        the current one is being processed.
+
+        Takes the same parameters as
+        [`OptimadeClient.get_one_async`][optimade.client.OptimadeClient.get_one_async].
+
+        Yields:
+            The results of each page, with keys 'data', 'meta', 'links', 'errors'
+            and 'included'.
+
+        """
+        next_url: str | None
         next_url, _task = self._setup(
             endpoint=endpoint,
             base_url=base_url,
@@ -960,86 +1510,168 @@ class OptimadeClient:
         if override_url:
             next_url = override_url
 
-        request_delay: float | None = None
-
-        results = QueryResults()
+        num_results = 0
         number_of_requests = 0
         total_data_available: int | None = None
+        stop = False
         try:
-            async with self._http_client(headers=self.headers) as client:  # type: ignore[union-attr,call-arg,misc]
-                while next_url:
-                    number_of_requests += 1
-
-                    attempts = 0
+            async with self._async_session() as client:
+                while next_url and not stop:
+                    pages = self._fetch_pages_async(
+                        client,
+                        next_url,
+                        prefetch=self.prefetch_pages if paginate else 0,
+                    )
                     try:
-                        if self.verbosity:
-                            self._progress.print(
-                                f"Making request to {next_url!r} {attempts=}"
+                        async for response, page_results, link_next in pages:
+                            number_of_requests += 1
+                            page_results, next_url = self._process_page(
+                                page_results, response, _task
                             )
-                        r = await client.get(
-                            next_url, follow_redirects=True, timeout=self.http_timeout
-                        )
-                        page_results, next_url = self._handle_response(r, _task)
-                        request_delay = page_results["meta"].get("request_delay", None)
-                        # Don't wait any longer than 5 seconds
-                        if request_delay:
-                            request_delay = min(request_delay, 5)
 
-                        # Compute the upper limit guard rail on pagination requests based on the number of entries in the entire db
-                        # and the chosen page limit
-                        if total_data_available is None:
-                            total_data_available = page_results["meta"].get(
-                                "data_available", 0
-                            )
-                            page_limit = len(page_results["data"])
-                            if page_limit == 0:
-                                page_limit = 1
-                            if total_data_available and total_data_available > 0:
-                                stopping_criteria = min(
-                                    math.ceil(total_data_available / page_limit),
-                                    self.max_requests_per_provider,
+                            # Compute the upper limit guard rail on pagination requests based on the number of entries in the entire db
+                            # and the chosen page limit
+                            if total_data_available is None:
+                                total_data_available = page_results["meta"].get(
+                                    "data_available", 0
                                 )
-                            else:
-                                stopping_criteria = self.max_results_per_provider
-
-                    except RecoverableHTTPError:
-                        attempts += 1
-                        if attempts > self.max_attempts:
-                            raise RuntimeError(
-                                f"Exceeded maximum number of retries for {next_url}"
+                                page_limit = len(page_results["data"])
+                                if page_limit == 0:
+                                    page_limit = 1
+                                if total_data_available and total_data_available > 0:
+                                    stopping_criteria = min(
+                                        math.ceil(total_data_available / page_limit),
+                                        self.max_requests_per_provider,
+                                    )
+                                else:
+                                    stopping_criteria = self.max_results_per_provider
+
+                            num_results += len(page_results["data"] or [])
+                            stop = not paginate or self._stop_paginating(
+                                page_results,
+                                base_url,
+                                next_url,
+                                num_results,
+                                number_of_requests,
+                                stopping_criteria,
                             )
-                        await asyncio.sleep(request_delay or 1)
-                        continue
 
-                    results.update(page_results)
+                            yield page_results
 
-                    if not paginate:
-                        break
+                            # If a callback has changed the next page, any pages
+                            # fetched from the original link are discarded
+                            if stop or next_url != link_next:
+                                break
+                    finally:
+                        await pages.aclose()
 
-                    if len(results.data) == 0 or number_of_requests > stopping_criteria:
-                        if next_url:
-                            message = f"Detected potential infinite loop for {base_url} (more than {stopping_criteria=} requests made). Stopping download."
-                            results.errors.append(message)
-                            if not self.silent:
-                                self._progress.print(message)
-                        break
+        finally:
+            self._teardown(_task, num_results)
 
-                    if (
-                        self.max_results_per_provider
-                        and len(results.data) >= self.max_results_per_provider
-                    ):
-                        if not self.silent:
+    async def _fetch_pages_async(
+        self, client: httpx.AsyncClient, url: str, prefetch: int = 0
+    ) -> AsyncGenerator[tuple[httpx.Response, dict[str, Any], str | None], None]:
+        """Requests the pages of results from one API, starting at `url` and
+        following the `links->next` of each page.
+
+        Parameters:
+            client: The HTTP client to make the requests with.
+            url: The URL of the first page.
+            prefetch: The number of pages to request ahead of the page being
+                consumed, by a background task. If zero, each page is only
+                requested once the previous one has been consumed.
+
+        Yields:
+            The response, the results decoded from it and the link to the next
+            page, if any.
+
+        """
+        if prefetch <= 0:
+            async for page in self._request_pages_async(client, url):
+                yield page
+            return
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+
+        async def _prefetch() -> None:
+            try:
+                async for page in self._request_pages_async(client, url):
+                    await queue.put(page)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                await queue.put(exc)
+                return
+            await queue.put(None)
+
+        task = asyncio.create_task(_prefetch())
+        try:
+            while True:
+                page = await queue.get()
+                if page is None:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _request_pages_async(
+        self, client: httpx.AsyncClient, url: str
+    ) -> AsyncIterator[tuple[httpx.Response, dict[str, Any], str | None]]:
+        """Requests the pages of results from one API in turn, starting at `url`
+        and following the `links->next` of each page.
+
+        Requests are paced per host according to the `meta->request_delay`
+        advertised by the API, bounded overall by `max_concurrent_requests`,
+        and retried after recoverable errors with exponential backoff.
+
+        Parameters:
+            client: The HTTP client to make the requests with.
+            url: The URL of the first page.
+
+        Yields:
+            The response, the results decoded from it and the link to the next
+            page, if any.
+
+        """
+        next_url: str | None = url
+
+        while next_url:
+            rate_limiter = self._rate_limiter(next_url)
+            attempts = 0
+            while True:
+                try:
+                    # Wait on the host's pacing only once a slot is held, so that
+                    # requests queued on the slot are still spaced out
+                    async with self._request_slot(next_url):
+                        await rate_limiter.wait()
+                        if self.verbosity:
                             self._progress.print(
-                                f"Reached {len(results.data)} results for {base_url}, exceeding `max_results_per_provider` parameter ({self.max_results_per_provider}). Stopping download."
+                                f"Making request to {next_url!r} {attempts=}"
                             )
-                        break
+                        response = await client.get(
+                            next_url, follow_redirects=True, timeout=self.http_timeout
+                        )
+                    page_results = self._decode_response(response)
+                    break
+                except RecoverableHTTPError:
+                    attempts += 1
+                    if attempts > self.max_attempts:
+                        raise RuntimeError(
+                            f"Exceeded maximum number of retries for {next_url}"
+                        )
+                    rate_limiter.pause(
+                        backoff_delay(attempts, base=rate_limiter.delay or 1)
+                    )
 
-            return {str(base_url): results}
+            self._update_rate_limiter(rate_limiter, page_results)
 
-        finally:
-            self._teardown(_task, len(results.data))
+            next_url = self._next_link(page_results)
+            yield response, page_results, next_url
 
-    def _get_one(
+    def _iter_pages(
         self,
         endpoint: str,
         filter: str,
@@ -1050,8 +1682,19 @@ class OptimadeClient:
         paginate: bool = True,
         other_params: dict[str, Any] | None = None,
         override_url: str | None = None,
-    ) -> dict[str, QueryResults]:
-        """See [`OptimadeClient.get_one`][optimade.client.OptimadeClient.get_one]."""
+    ) -> Iterator[dict[str, Any]]:
+        """Executes the query synchronously on one API, yielding the results
+        of each page as soon as it has been received.
+
+        Takes the same parameters as
+        [`OptimadeClient.get_one`][optimade.client.OptimadeClient.get_one].
+
+        Yields:
+            The results of each page, with keys 'data', 'meta', 'links', 'errors'
+            and 'included'.
+
+        """
+        next_url: str | None
         next_url, _task = self._setup(
             endpoint=endpoint,
             base_url=base_url,
@@ -1065,29 +1708,28 @@ class OptimadeClient:
         if override_url:
             next_url = override_url
 
-        request_delay: float | None = None
-
-        results = QueryResults()
+        num_results = 0
         number_of_requests: int = 0
         total_data_available: int | None = None
         try:
-            with self._http_client() as client:  # type: ignore[misc]
-                client.headers.update(self.headers)
-
+            with self._session() as client:
                 if isinstance(client, requests.Session):
                     # Convert configured httpx timeout to requests-style tuple
                     timeout = (self.http_timeout.connect, self.http_timeout.read)
 
+                attempts = 0
                 while next_url:
                     number_of_requests += 1
-                    attempts = 0
+                    rate_limiter = self._rate_limiter(next_url)
                     try:
+                        rate_limiter.wait_sync()
                         if self.verbosity:
                             self._progress.print(
                                 f"Making request to {next_url!r} {attempts=}"
                             )
                         r = client.get(next_url, timeout=timeout)
                         page_results, next_url = self._handle_response(r, _task)
+                        attempts = 0
 
                         # Compute the upper limit guard rail on pagination requests based on the number of entries in the entire db
                         # and the chosen page limit
@@ -1106,10 +1748,7 @@ class OptimadeClient:
                             else:
                                 stopping_criteria = self.max_results_per_provider
 
-                        request_delay = page_results["meta"].get("request_delay", None)
-                        # Don't wait any longer than 5 seconds
-                        if request_delay:
-                            request_delay = min(request_delay, 5)
+                        self._update_rate_limiter(rate_limiter, page_results)
 
                     except RecoverableHTTPError:
                         attempts += 1
@@ -1117,36 +1756,166 @@ class OptimadeClient:
                             raise RuntimeError(
                                 f"Exceeded maximum number of retries for {next_url}"
                             )
-                        time.sleep(request_delay or 1)
+                        rate_limiter.pause(
+                            backoff_delay(attempts, base=rate_limiter.delay or 1)
+                        )
                         continue
 
-                    results.update(page_results)
+                    num_results += len(page_results["data"] or [])
+                    stop = (
+                        self._stop_paginating(
+                            page_results,
+                            base_url,
+                            next_url,
+                            num_results,
+                            number_of_requests,
+                            stopping_criteria,
+                        )
+                        or not paginate
+                    )
 
-                    if len(results.data) == 0 or number_of_requests > stopping_criteria:
-                        if next_url:
-                            message = f"Detected potential infinite loop for {base_url} (more than {stopping_criteria=} requests made). Stopping download."
-                            results.errors.append(message)
-                            if not self.silent:
-                                self._progress.print(message)
-                        break
+                    yield page_results
 
-                    if (
-                        self.max_results_per_provider
-                        and len(results.data) >= self.max_results_per_provider
-                    ):
-                        if not self.silent:
-                            self._progress.print(
-                                f"Reached {len(results.data)} results for {base_url}, exceeding `max_results_per_provider` parameter ({self.max_results_per_provider}). Stopping download."
-                            )
+                    if stop:
                         break
 
-                    if not paginate:
-                        break
+        finally:
+            self._teardown(_task, num_results)
 
-            return {str(base_url): results}
+    def _stop_paginating(
+        self,
+        page_results: dict[str, Any],
+        base_url: str,
+        next_url: str | None,
+        num_results: int,
+        number_of_requests: int,
+        stopping_criteria: int | None,
+    ) -> bool:
+        """Checks whether to stop requesting further pages from an API, either because
+        no results were returned, the guard rail on the number of requests was hit
+        (in which case an error is added to the page results), or enough results
+        have been downloaded.
 
-        finally:
-            self._teardown(_task, len(results.data))
+        Parameters:
+            page_results: The results of the last page.
+            base_url: The base URL of the API.
+            next_url: The URL of the next page, if any.
+            num_results: The number of results downloaded so far.
+            number_of_requests: The number of requests made so far.
+            stopping_criteria: The maximum number of requests to make.
+
+        Returns:
+            Whether to stop paginating.
+
+        """
+        if num_results == 0 or number_of_requests > stopping_criteria:  # type: ignore[operator]
+            if next_url:
+                message = f"Detected potential infinite loop for {base_url} (more than {stopping_criteria=} requests made). Stopping download."
+                page_results["errors"].append(message)
+                if not self.silent:
+                    self._progress.print(message)
+            return True
+
+        if (
+            self.max_results_per_provider
+            and num_results >= self.max_results_per_provider
+        ):
+            if not self.silent:
+                self._progress.print(
+                    f"Reached {num_results} results for {base_url}, exceeding `max_results_per_provider` parameter ({self.max_results_per_provider}). Stopping download."
+                )
+            return True
+
+        return False
+
+    def _run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Runs the coroutine to completion in the event loop owned by this
+        client, in which its pooled asynchronous HTTP client lives.
+
+        Parameters:
+            coroutine: The coroutine to run.
+
+        Returns:
+            The result of the coroutine.
+
+        """
+        if self._event_loop is None or self._event_loop.is_closed():
+            self._event_loop = asyncio.new_event_loop()
+            self._pooled_async_client = None
+        return self._event_loop.run_until_complete(coroutine)
+
+    @asynccontextmanager
+    async def _async_session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Provides the asynchronous HTTP client to make requests with.
+
+        Within the event loop owned by this client, the pooled HTTP client is
+        reused across queries and providers, so that connections are kept alive
+        between calls. In any other event loop, e.g., when awaiting
+        [`stream_async`][optimade.client.client.OptimadeClient.stream_async],
+        a new HTTP client is opened for the duration of the block.
+
+        """
+        event_loop = asyncio.get_running_loop()
+        if self._event_loop is not None and event_loop is self._event_loop:
+            if self._pooled_async_client is None:
+                self._pooled_async_client = self._create_async_client()
+            yield self._pooled_async_client
+        else:
+            async with self._create_async_client() as client:
+                yield client
+
+    def _create_async_client(self) -> httpx.AsyncClient:
+        """Creates an asynchronous HTTP client, using HTTP/2 if enabled."""
+        kwargs: dict[str, Any] = {"headers": self.headers}
+        if self.http2:
+            kwargs["http2"] = True
+        return self._http_client(**kwargs)  # type: ignore[call-arg,misc,return-value]
+
+    @contextmanager
+    def _session(self) -> Iterator[requests.Session]:
+        """Provides the pooled synchronous HTTP session, which is reused across
+        queries and providers until the client is closed."""
+        if self._pooled_client is None:
+            self._pooled_client = self._http_client()  # type: ignore[misc,assignment]
+            self._pooled_client.headers.update(self.headers)  # type: ignore[union-attr]
+        yield self._pooled_client  # type: ignore[misc]
+
+    def _rate_limiter(self, url: str) -> TokenBucket:
+        """Returns the token bucket pacing the requests to the host of the URL."""
+        host = urlparse(url).netloc
+        if host not in self._rate_limiters:
+            self._rate_limiters[host] = TokenBucket()
+        return self._rate_limiters[host]
+
+    @staticmethod
+    def _update_rate_limiter(
+        rate_limiter: TokenBucket, page_results: dict[str, Any]
+    ) -> None:
+        """Paces further requests to a host according to the `meta->request_delay`
+        of its latest response."""
+        request_delay = page_results["meta"].get("request_delay", None)
+        # Don't wait any longer than 5 seconds
+        if request_delay:
+            request_delay = min(request_delay, 5)
+        rate_limiter.delay = request_delay or None
+
+    @asynccontextmanager
+    async def _request_slot(self, url: str) -> AsyncIterator[None]:
+        """Holds one of the `max_connections_per_host` slots of the host of the URL
+        and one of the `max_concurrent_requests` slots shared by all hosts, in the
+        running event loop, for the duration of the block."""
+        semaphores = self._request_semaphores.setdefault(asyncio.get_running_loop(), {})
+        async with AsyncExitStack() as stack:
+            # Wait for the host before taking one of the slots shared by all hosts
+            for key, limit in (
+                (urlparse(url).netloc, self.max_connections_per_host),
+                ("", self.max_concurrent_requests),
+            ):
+                if limit:
+                    if key not in semaphores:
+                        semaphores[key] = asyncio.Semaphore(limit)
+                    await stack.enter_async_context(semaphores[key])
+            yield
 
     def _setup(
         self,
@@ -1270,7 +2039,7 @@ class OptimadeClient:
 
     def _handle_response(
         self, response: httpx.Response | requests.Response, _task: TaskID
-    ) -> tuple[dict[str, Any], str]:
+    ) -> tuple[dict[str, Any], str | None]:
         """Handle the response from the server.
 
         Parameters:
@@ -1282,7 +2051,26 @@ class OptimadeClient:
             if it exists.
 
         """
+        return self._process_page(self._decode_response(response), response, _task)
 
+    def _decode_response(
+        self, response: httpx.Response | requests.Response
+    ) -> dict[str, Any]:
+        """Check the status of the response from the server and decode its results.
+
+        Parameters:
+            response: The response from the server.
+
+        Raises:
+            TooManyRequestsException: If the server returned 429: Too Many Requests.
+            RuntimeError: If the server returned any other error, or the response
+                could not be decoded.
+
+        Returns:
+            A dictionary containing the results, with keys 'data', 'meta', 'links',
+            'errors' and 'included'.
+
+        """
         # Handle error statuses
         if response.status_code == 429:
             raise TooManyRequestsException(response.content)
@@ -1315,6 +2103,27 @@ class OptimadeClient:
             "errors": r.get("errors", []),
         }
 
+        return results
+
+    def _process_page(
+        self,
+        results: dict[str, Any],
+        response: httpx.Response | requests.Response,
+        _task: TaskID,
+    ) -> tuple[dict[str, Any], str | None]:
+        """Execute any callbacks on the decoded results of a page and advance
+        the progress bar.
+
+        Parameters:
+            results: The results decoded from the response.
+            response: The response from the server.
+            _task: The Rich TaskID for this task's progressbar.
+
+        Returns:
+            A dictionary containing the results, and a link to the next page,
+            if it exists.
+
+        """
         callback_response = None
         if self.callbacks:
             callback_response = self._execute_callbacks(results, response)
@@ -1327,12 +2136,18 @@ class OptimadeClient:
             total=results["meta"].get("data_returned", None),
         )
 
-        next_url = callback_response.get("next") or results["links"].get("next", None)
-        if isinstance(next_url, dict):
-            next_url = next_url["href"]
+        next_url = callback_response.get("next") or self._next_link(results)
 
         return results, next_url
 
+    @staticmethod
+    def _next_link(results: dict[str, Any]) -> str | None:
+        """Return the link to the next page of results, if any."""
+        next_url = results["links"].get("next", None)
+        if isinstance(next_url, dict):
+            next_url = next_url["href"]
+        return next_url
+
     def _teardown(self, _task: TaskID, num_results: int) -> None:
         """Update the finished status of the progress bar depending on the number of results.
 
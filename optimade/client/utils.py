@@ -1,6 +1,14 @@
+import asyncio
+import json
+import random
 import sys
+import tempfile
+import time
+from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, Any
 
 from rich.console import Console
 from rich.progress import (
@@ -16,6 +24,12 @@ __all__ = (
     "RecoverableHTTPError",
     "TooManyRequestsException",
     "QueryResults",
+    "TokenBucket",
+    "backoff_delay",
+    "ResultsSink",
+    "JSONSink",
+    "JSONLinesSink",
+    "get_results_sink",
     "OptimadeClientProgress",
 )
 
@@ -97,6 +111,234 @@ class QueryResults:
                 self.included.append(d)
 
 
+class TokenBucket:
+    """Paces the requests made to one host, allowing bursts of at most `burst`
+    requests, replenished at one request per `delay` seconds, e.g., the
+    `meta->request_delay` advertised by the OPTIMADE API, and holding back all
+    requests while the host is paused after an error.
+
+    Slots are reserved when a request is about to be made, so concurrent
+    requests to the same host are spaced out rather than released together.
+
+    """
+
+    def __init__(self, delay: float | None = None, burst: int = 1) -> None:
+        self.delay = delay
+        self.burst = burst
+        self._theoretical_arrival = 0.0
+        self._paused_until = 0.0
+
+    def reserve(self) -> float:
+        """Reserve the next slot for a request.
+
+        Returns:
+            The number of seconds to wait before making the request.
+
+        """
+        now = time.monotonic()
+        interval = self.delay or 0.0
+        arrival = max(self._theoretical_arrival, now)
+        start = max(now, arrival - (self.burst - 1) * interval, self._paused_until)
+        self._theoretical_arrival = max(arrival, start) + interval
+        return start - now
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests to the host for (at least) the given time."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def wait(self) -> None:
+        """Wait asynchronously for the next slot."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def wait_sync(self) -> None:
+        """Wait for the next slot, blocking."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Return the time to wait before retrying a failed request, growing
+    exponentially with the number of attempts, with random jitter to avoid
+    retrying in lockstep with other clients.
+
+    Parameters:
+        attempt: The number of failed attempts so far (starting at 1).
+        base: The delay for the first retry, before jitter.
+        cap: The maximum delay, before jitter.
+
+    Returns:
+        A delay between half and all of `min(cap, base * 2 ** (attempt - 1))` seconds.
+
+    """
+    delay = min(cap, base * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class ResultsSink(ABC):
+    """Base class for the destinations that the pages of results streamed by
+    [`OptimadeClient.stream_to`][optimade.client.client.OptimadeClient.stream_to]
+    are written to, one page at a time.
+
+    Sinks can be used as context managers, which close them on exit.
+
+    """
+
+    @abstractmethod
+    def write(
+        self, endpoint: str, filter: str, base_url: str, page_results: dict
+    ) -> None:
+        """Write the results of one page.
+
+        Parameters:
+            endpoint: The queried endpoint.
+            filter: The OPTIMADE filter string of the query.
+            base_url: The base URL of the API that returned the page.
+            page_results: The results for the page, with keys 'data', 'meta',
+                'links', 'errors' and 'included'.
+
+        """
+
+    def close(self) -> None:
+        """Flush and close the sink."""
+
+    def __enter__(self) -> "ResultsSink":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class JSONLinesSink(ResultsSink):
+    """Writes each entry, included resource and error as soon as it is received,
+    as one line of JSON with the keys `endpoint`, `filter` and `base_url`, and
+    one of `data`, `included` or `errors`.
+
+    Included resources are deduplicated per query and API.
+
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._file = open(path, "w")
+        self._included_index: dict[tuple[str, str, str], set[str]] = {}
+
+    def write(
+        self, endpoint: str, filter: str, base_url: str, page_results: dict
+    ) -> None:
+        query = {"endpoint": endpoint, "filter": filter, "base_url": base_url}
+
+        data = page_results.get("data")
+        for entry in data if isinstance(data, list) else [data]:
+            if entry is not None:
+                self._write_line({**query, "data": entry})
+
+        included_index = self._included_index.setdefault(
+            (endpoint, filter, base_url), set()
+        )
+        for resource in page_results.get("included", []):
+            typed_id = f"{resource['type']}/{resource['id']}"
+            if typed_id not in included_index:
+                included_index.add(typed_id)
+                self._write_line({**query, "included": resource})
+
+        if page_results.get("errors"):
+            self._write_line({**query, "errors": page_results["errors"]})
+
+    def _write_line(self, line: dict[str, Any]) -> None:
+        self._file.write(json.dumps(line) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JSONSink(ResultsSink):
+    """Writes the results as a single JSON document, nested by endpoint, filter
+    and base URL in the same format as
+    [`OptimadeClient.get`][optimade.client.client.OptimadeClient.get].
+
+    To keep memory usage bounded, the entries of each query and API are spooled
+    to temporary files as they are received, and the document is only assembled
+    when the sink is closed.
+
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._results: dict[str, dict[str, dict[str, QueryResults]]] = {}
+        self._spools: dict[tuple[str, str, str], IO[str]] = {}
+
+    def write(
+        self, endpoint: str, filter: str, base_url: str, page_results: dict
+    ) -> None:
+        results = (
+            self._results.setdefault(endpoint, {})
+            .setdefault(filter, {})
+            .setdefault(base_url, QueryResults())
+        )
+        data = page_results.get("data")
+        if isinstance(data, list):
+            page_results = {k: v for k, v in page_results.items() if k != "data"}
+            key = (endpoint, filter, base_url)
+            if key not in self._spools:
+                self._spools[key] = tempfile.TemporaryFile("w+")
+            for entry in data:
+                self._spools[key].write(json.dumps(entry) + "\n")
+        results.update(page_results)
+
+    def close(self) -> None:
+        try:
+            with open(self.path, "w") as f:
+                f.write("{")
+                for i, (endpoint, filters) in enumerate(self._results.items()):
+                    f.write(f"{', ' if i else ''}{json.dumps(endpoint)}: {{")
+                    for j, (filter, providers) in enumerate(filters.items()):
+                        f.write(f"{', ' if j else ''}{json.dumps(filter)}: {{")
+                        for k, (base_url, results) in enumerate(providers.items()):
+                            f.write(f"{', ' if k else ''}{json.dumps(base_url)}: ")
+                            spool = self._spools.get((endpoint, filter, base_url))
+                            self._write_results(f, results, spool)
+                        f.write("}")
+                    f.write("}")
+                f.write("}")
+        finally:
+            for spool in self._spools.values():
+                spool.close()
+            self._spools = {}
+
+    @staticmethod
+    def _write_results(
+        f: IO[str], results: QueryResults, spool: IO[str] | None
+    ) -> None:
+        """Write the results of one query and API, streaming the entries
+        back from their spool file, if any."""
+        if spool is None:
+            f.write(json.dumps(results.asdict()))
+            return
+
+        f.write('{"data": [')
+        spool.seek(0)
+        for n, line in enumerate(spool):
+            f.write(f"{', ' if n else ''}{line.rstrip()}")
+        f.write("]")
+        for key, value in results.asdict().items():
+            if key != "data":
+                f.write(f", {json.dumps(key)}: {json.dumps(value)}")
+        f.write("}")
+
+
+def get_results_sink(path: str | Path) -> ResultsSink:
+    """Return the sink for writing streamed results to the given file, according
+    to its extension: a [`JSONLinesSink`][optimade.client.utils.JSONLinesSink] for
+    `.jsonl` files and a [`JSONSink`][optimade.client.utils.JSONSink] otherwise.
+
+    """
+    if Path(path).suffix == ".jsonl":
+        return JSONLinesSink(path)
+    return JSONSink(path)
+
+
 class OptimadeClientProgress(Progress):
     """A wrapper around `Rich.Progress` that defines the OPTIMADE client progressbars."""
 
@@ -4,7 +4,9 @@ into `Lark.Tree` objects for use by the filter transformers.
 
 """
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
 from lark import Lark, Tree
 
@@ -42,6 +44,33 @@ def get_versions() -> dict[tuple[int, int, int], dict[str, Path]]:
 AVAILABLE_PARSERS = get_versions()
 
 
+@lru_cache(maxsize=None)
+def get_lark(
+    version: tuple[int, int, int],
+    variant: str = "default",
+    parser: Literal["lalr", "earley"] = "lalr",
+) -> Lark:
+    """Compile the requested grammar into a `Lark` parser, caching the result for the
+    lifetime of the process.
+
+    All [`LarkParser`][optimade.filterparser.lark_parser.LarkParser] instances (e.g.,
+    one per entry collection) share the same compiled `Lark` object for a given
+    version, variant and parsing algorithm.
+    A `Lark` object does not hold any state between calls to `parse()`, so this is safe.
+
+    Parameters:
+        version: The grammar version number to use (e.g., `(1, 0, 1)` for v1.0.1).
+        variant: The grammar variant to employ.
+        parser: The lark parsing algorithm to use.
+
+    Returns:
+        The compiled `Lark` parser.
+
+    """
+    with open(AVAILABLE_PARSERS[version][variant]) as f:
+        return Lark(f, maybe_placeholders=False, parser=parser)
+
+
 class LarkParser:
     """This class wraps a versioned OPTIMADE grammar and allows
     it to be parsed into Lark tree objects.
@@ -49,13 +78,22 @@ class LarkParser:
     """
 
     def __init__(
-        self, version: tuple[int, int, int] | None = None, variant: str = "default"
+        self,
+        version: tuple[int, int, int] | None = None,
+        variant: str = "default",
+        parser: Literal["lalr", "earley"] = "lalr",
     ):
         """For a given version and variant, try to load the corresponding grammar.
 
+        The compiled grammar is retrieved from a process-wide cache, see
+        [`get_lark()`][optimade.filterparser.lark_parser.get_lark].
+
         Parameters:
             version: The grammar version number to use (e.g., `(1, 0, 1)` for v1.0.1).
             variant: The grammar variant to employ.
+            parser: The lark parsing algorithm to use.
+                The OPTIMADE v1.x grammars are LALR(1), for which the `"lalr"` parser
+                produces the same trees as the (much slower) `"earley"` parser.
 
         Raises:
             ParserError: If the requested version/variant of the
@@ -74,11 +112,14 @@ class LarkParser:
         if variant not in AVAILABLE_PARSERS[version]:
             raise ParserError(f"Unknown variant of the parser: {variant}")
 
+        if parser not in ("lalr", "earley"):
+            raise ParserError(f"Unknown parsing algorithm: {parser}")
+
         self.version = version
         self.variant = variant
+        self.parser = parser
 
-        with open(AVAILABLE_PARSERS[version][variant]) as f:
-            self.lark = Lark(f, maybe_placeholders=False)
+        self.lark = get_lark(version, variant, parser)
 
         self.tree: Tree | None = None
         self.filter: str | None = None
@@ -7,13 +7,16 @@ for turning filters parsed by lark into backend-specific queries.
 
 import abc
 import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Optional
 
 from lark import Transformer, Tree, v_args
 
 from optimade.exceptions import BadRequest
 from optimade.server.mappers import BaseResourceMapper
-from optimade.warnings import UnknownProviderProperty
+from optimade.warnings import OptimadeWarning, UnknownProviderProperty
 
 if TYPE_CHECKING:  # pragma: no cover
     pass
@@ -21,9 +24,46 @@ if TYPE_CHECKING:  # pragma: no cover
 __all__ = (
     "BaseTransformer",
     "Quantity",
+    "record_transformer_warnings",
 )
 
 
+_RECORDED_WARNINGS: ContextVar[list[OptimadeWarning] | None] = ContextVar(
+    "optimade_recorded_transformer_warnings", default=None
+)
+
+
+@contextmanager
+def record_transformer_warnings() -> Iterator[list[OptimadeWarning]]:
+    """Record, rather than emit, the warnings raised by transformers in this context.
+
+    This allows callers that cache transformed filters to re-emit the same warnings
+    every time the cached result is used.
+
+    Yields:
+        The list that the warnings will be appended to.
+
+    """
+    recorded: list[OptimadeWarning] = []
+    token = _RECORDED_WARNINGS.set(recorded)
+    try:
+        yield recorded
+    finally:
+        _RECORDED_WARNINGS.reset(token)
+
+
+def _warn(warning: OptimadeWarning) -> None:
+    """Emit a transformer warning, or record it if inside
+    [`record_transformer_warnings()`][optimade.filtertransformers.base_transformer.record_transformer_warnings].
+
+    """
+    recorded = _RECORDED_WARNINGS.get()
+    if recorded is None:
+        warnings.warn(warning, stacklevel=2)
+    else:
+        recorded.append(warning)
+
+
 class Quantity:
     """Class to provide information about available quantities to the transformer.
 
@@ -256,7 +296,7 @@ class BaseTransformer(Transformer, abc.ABC):
                 prefix = quantity_name.split("_")[1]
                 if prefix not in self.mapper.SUPPORTED_PREFIXES:
                     if prefix not in self.mapper.KNOWN_PROVIDER_PREFIXES:
-                        warnings.warn(
+                        _warn(
                             UnknownProviderProperty(
                                 f"Field {quantity_name!r} has an unrecognised prefix: this property has been treated as UNKNOWN."
                             )
@@ -5,18 +5,25 @@ which takes the parsed filter and converts it to a valid pymongo/BSON query.
 
 import copy
 import itertools
-import warnings
 from collections.abc import Callable
 from typing import Any
 
 from lark import Token, v_args
 
 from optimade.exceptions import BadRequest
-from optimade.filtertransformers.base_transformer import BaseTransformer, Quantity
+from optimade.filtertransformers.base_transformer import (
+    BaseTransformer,
+    Quantity,
+    _warn,
+)
 from optimade.warnings import TimestampNotRFCCompliant
 
 __all__ = ("MongoTransformer",)
 
+PostprocessingRule = tuple[Callable[[str, Any], bool], Callable[[dict, str, Any], dict]]
+"""A `(condition, replacement)` pair, as taken by
+[`apply_postprocessing_rules()`][optimade.filtertransformers.mongo.apply_postprocessing_rules]."""
+
 
 class MongoTransformer(BaseTransformer):
     """A filter transformer for the MongoDB backend.
@@ -57,14 +64,29 @@ class MongoTransformer(BaseTransformer):
     }
 
     def postprocess(self, query: dict[str, Any]):
-        """Used to post-process the nested dictionary of the parsed query."""
-        query = self._apply_relationship_filtering(query)
-        query = self._apply_length_operators(query)
-        query = self._apply_unknown_or_null_filter(query)
-        query = self._apply_has_only_filter(query)
-        query = self._apply_mongo_id_filter(query)
-        query = self._apply_mongo_date_filter(query)
-        return query
+        """Used to post-process the nested dictionary of the parsed query.
+
+        All [`postprocessing_rules`][optimade.filtertransformers.mongo.MongoTransformer.postprocessing_rules]
+        are applied in a single traversal of the query, modifying it in place.
+
+        """
+        return apply_postprocessing_rules(query, self.postprocessing_rules)
+
+    @property
+    def postprocessing_rules(self) -> list[PostprocessingRule]:
+        """The ordered list of `(condition, replacement)` rules applied to the query
+        during post-processing, see
+        [`apply_postprocessing_rules()`][optimade.filtertransformers.mongo.apply_postprocessing_rules].
+
+        """
+        return [
+            self._relationship_filtering_rule(),
+            self._length_operators_rule(),
+            self._unknown_or_null_filter_rule(),
+            self._has_only_filter_rule(),
+            self._mongo_id_filter_rule(),
+            self._mongo_date_filter_rule(),
+        ]
 
     def value_list(self, arg):
         # value_list: [ OPERATOR ] value ( "," [ OPERATOR ] value )*
@@ -321,9 +343,9 @@ class MongoTransformer(BaseTransformer):
             return filter_
         return {"$and": [filter_, {prop: {"$ne": None}}]}
 
-    def _apply_length_operators(self, filter_: dict) -> dict:
-        """Check for any invalid pymongo queries that involve applying a
-        comparison operator to the length of a field, and transform
+    def _length_operators_rule(self) -> PostprocessingRule:
+        """Rule that checks for any invalid pymongo queries that involve applying a
+        comparison operator to the length of a field, and transforms
         them into a test for existence of the relevant entry, e.g.
         "list LENGTH > 3" becomes "does the 4th list entry exist?".
 
@@ -362,15 +384,11 @@ class MongoTransformer(BaseTransformer):
 
             return subdict
 
-        return recursive_postprocessing(
-            filter_,
-            check_for_length_op_filter,
-            apply_length_op,
-        )
+        return check_for_length_op_filter, apply_length_op
 
-    def _apply_relationship_filtering(self, filter_: dict) -> dict:
-        """Check query for property names that match the entry
-        types, and transform them as relationship filters rather than
+    def _relationship_filtering_rule(self) -> PostprocessingRule:
+        """Rule that checks the query for property names that match the entry
+        types, and transforms them as relationship filters rather than
         property filters.
 
         """
@@ -392,14 +410,10 @@ class MongoTransformer(BaseTransformer):
             subdict.pop(prop)
             return subdict
 
-        return recursive_postprocessing(
-            filter_, check_for_entry_type, replace_with_relationship
-        )
+        return check_for_entry_type, replace_with_relationship
 
-    def _apply_has_only_filter(self, filter_: dict) -> dict:
-        """This method loops through the query and replaces the magic key `"#only"`
-        with the proper 'HAS ONLY' query.
-        """
+    def _has_only_filter_rule(self) -> PostprocessingRule:
+        """Rule that replaces the magic key `"#only"` with the proper 'HAS ONLY' query."""
 
         def check_for_only_filter(_, expr):
             """Find cases where the magic key `"#only"` is in the query."""
@@ -446,14 +460,11 @@ class MongoTransformer(BaseTransformer):
             subdict.pop(prop)
             return subdict
 
-        return recursive_postprocessing(
-            filter_, check_for_only_filter, replace_only_filter
-        )
+        return check_for_only_filter, replace_only_filter
 
-    def _apply_unknown_or_null_filter(self, filter_: dict) -> dict:
-        """This method loops through the query and replaces the check for
-        KNOWN with a check for existence and a check for not null, and the
-        inverse for UNKNOWN.
+    def _unknown_or_null_filter_rule(self) -> PostprocessingRule:
+        """Rule that replaces the check for KNOWN with a check for existence and a
+        check for not null, and the inverse for UNKNOWN.
 
         """
 
@@ -496,14 +507,11 @@ class MongoTransformer(BaseTransformer):
 
             return subdict
 
-        return recursive_postprocessing(
-            filter_, check_for_known_filter, replace_known_filter_with_or
-        )
+        return check_for_known_filter, replace_known_filter_with_or
 
-    def _apply_mongo_id_filter(self, filter_: dict) -> dict:
-        """This method loops through the query and replaces any operations
-        on the special Mongodb `_id` key with the corresponding operation
-        on a BSON `ObjectId` type.
+    def _mongo_id_filter_rule(self) -> PostprocessingRule:
+        """Rule that replaces any operations on the special Mongodb `_id` key
+        with the corresponding operation on a BSON `ObjectId` type.
         """
 
         def check_for_id_key(prop, _):
@@ -525,14 +533,11 @@ class MongoTransformer(BaseTransformer):
                     subdict[prop][operator] = ObjectId(val)
             return subdict
 
-        return recursive_postprocessing(
-            filter_, check_for_id_key, replace_str_id_with_objectid
-        )
+        return check_for_id_key, replace_str_id_with_objectid
 
-    def _apply_mongo_date_filter(self, filter_: dict) -> dict:
-        """This method loops through the query and replaces any operations
-        on suspected timestamp properties with the corresponding operation
-        on a BSON `DateTime` type.
+    def _mongo_date_filter_rule(self) -> PostprocessingRule:
+        """Rule that replaces any operations on suspected timestamp properties
+        with the corresponding operation on a BSON `DateTime` type.
         """
 
         def check_for_timestamp_field(prop, _):
@@ -553,19 +558,57 @@ class MongoTransformer(BaseTransformer):
                     ),
                 )
                 if query_datetime.microsecond != 0:
-                    warnings.warn(
-                        f"Query for timestamp {subdict[prop][operator]!r} for field {prop!r} contained microseconds, which is not RFC3339 compliant. "
-                        "This may cause undefined behaviour for the underlying database.",
-                        TimestampNotRFCCompliant,
+                    _warn(
+                        TimestampNotRFCCompliant(
+                            f"Query for timestamp {subdict[prop][operator]!r} for field {prop!r} contained microseconds, which is not RFC3339 compliant. "
+                            "This may cause undefined behaviour for the underlying database."
+                        )
                     )
 
                 subdict[prop][operator] = query_datetime
 
             return subdict
 
-        return recursive_postprocessing(
-            filter_, check_for_timestamp_field, replace_str_date_with_datetime
-        )
+        return check_for_timestamp_field, replace_str_date_with_datetime
+
+
+def apply_postprocessing_rules(
+    filter_: dict | list, rules: list[PostprocessingRule]
+) -> dict | list:
+    """Apply several post-processing rules to the query in a single traversal.
+
+    Each dictionary in the query (contained in a list, or as an entry in another
+    dictionary) is checked against every rule in turn, as in
+    [`recursive_postprocessing()`][optimade.filtertransformers.mongo.recursive_postprocessing],
+    before descending into any lists it contains, including those added by the rules.
+    The result is the same as applying `recursive_postprocessing()` once per rule,
+    but the query is modified in place rather than deep-copied at every level.
+
+    Parameters:
+        filter_: the filter to process (modified in place).
+        rules: the ordered `(condition, replacement)` pairs to apply,
+            with the same signatures as for `recursive_postprocessing()`.
+
+    Returns:
+        The processed filter.
+
+    """
+    if isinstance(filter_, list):
+        for ind, query in enumerate(filter_):
+            filter_[ind] = apply_postprocessing_rules(query, rules)
+        return filter_
+
+    if isinstance(filter_, dict):
+        for condition, replacement in rules:
+            for prop, expr in list(filter_.items()):
+                if condition(prop, expr):
+                    filter_ = replacement(filter_, prop, expr)
+        for prop, expr in filter_.items():
+            if isinstance(expr, list):
+                filter_[prop] = apply_postprocessing_rules(expr, rules)
+        return filter_
+
+    return filter_
 
 
 def recursive_postprocessing(
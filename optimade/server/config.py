@@ -206,6 +206,70 @@ class ServerConfig(BaseSettings):
         ),
     ] = None
 
+    insert_from_jsonl_batch_size: Annotated[
+        int,
+        Field(
+            description=(
+                "The number of lines of the JSONL file that are parsed and inserted "
+                "together, i.e., the maximum number of documents per insert."
+            ),
+            ge=1,
+        ),
+    ] = 1000
+
+    insert_from_jsonl_processes: Annotated[
+        int,
+        Field(
+            description=(
+                "The number of worker processes used to parse the JSONL file. "
+                "Set to 0 to parse the file in the server process."
+            ),
+            ge=0,
+        ),
+    ] = 0
+
+    insert_from_jsonl_writers: Annotated[
+        int,
+        Field(
+            description=(
+                "The number of batches from the JSONL file that are inserted into the "
+                "database concurrently."
+            ),
+            ge=1,
+        ),
+    ] = 1
+
+    insert_from_jsonl_checkpoint: Annotated[
+        Path | None,
+        Field(
+            description=(
+                "An optional path to a checkpoint file recording the progress of inserting "
+                "the JSONL file, such that a failed insert can be resumed rather than "
+                "restarted. The file is removed once the whole JSONL file has been inserted."
+            )
+        ),
+    ] = None
+
+    insert_from_jsonl_validate: Annotated[
+        bool,
+        Field(
+            description=(
+                "Whether to validate the entries of the JSONL file while inserting them. "
+                "Valid entries are stamped in the database, see `trust_validation_stamp`."
+            )
+        ),
+    ] = False
+
+    insert_from_jsonl_validation_report: Annotated[
+        Path | None,
+        Field(
+            description=(
+                "An optional path to a JSON lines file to which the entries of the JSONL "
+                "file that fail validation on insertion are reported."
+            )
+        ),
+    ] = None
+
     exit_after_insert: Annotated[
         bool, Field(description="Exit the API after inserting data")
     ] = False
@@ -257,6 +321,52 @@ class ServerConfig(BaseSettings):
         ),
     ] = 0.5
 
+    mongo_count_cache_ttl: Annotated[
+        NonNegativeFloat,
+        Field(
+            description=(
+                "Number of seconds for which MongoDB counts (of the results matching a "
+                "filter, and of all entries in a collection) are cached per collection. "
+                "Cached counts are invalidated when data is inserted through the server, "
+                "but not when the database is modified externally. "
+                "Set to 0 to disable the cache."
+            ),
+        ),
+    ] = 0.0
+
+    mongo_count_cache_size: Annotated[
+        int,
+        Field(
+            description="Maximum number of filter counts to cache per MongoDB collection.",
+            ge=0,
+        ),
+    ] = 1024
+
+    mongo_skip_count: Annotated[
+        bool,
+        Field(
+            description=(
+                "Determine `more_data_available` by fetching one more result than "
+                "requested, rather than counting all results matching the filter for "
+                "every request. `data_returned` is then only reported when it is known "
+                "without counting, i.e., on the last page of results or if the count "
+                "is cached."
+            ),
+        ),
+    ] = False
+
+    mongo_index_sort_fields: Annotated[
+        list[str],
+        Field(
+            description=(
+                "The OPTIMADE fields by which results are commonly sorted. The indexes "
+                "recommended for MongoDB collections (see `optimade-index`) include "
+                "compound indexes of these fields with `id`, in both sort directions, "
+                "such that sorted (and `page_above`-paginated) queries are served by an index."
+            ),
+        ),
+    ] = ["last_modified"]
+
     mongo_database: Annotated[
         str,
         Field(
@@ -310,6 +420,29 @@ Otherwise, the license will be given as the provided URL and no SPDX identifier
     page_limit_max: Annotated[
         int, Field(description="Max allowed number of resources per page")
     ] = 500
+    filter_cache_size: Annotated[
+        int,
+        Field(
+            description=(
+                "Maximum number of parsed and transformed filters to cache per entry "
+                "collection, such that repeated filters do not need to be re-parsed. "
+                "Set to 0 to disable the cache."
+            ),
+            ge=0,
+        ),
+    ] = 128
+    pagination_mechanism: Annotated[
+        Literal["page_offset", "page_above"],
+        Field(
+            description=(
+                "The pagination mechanism used for `next` links when a client does not "
+                "request one explicitly. `page_above` enables keyset pagination on `id` "
+                "(or on indexed sort fields), which avoids skipping over all previous "
+                "results for every page; it is currently only supported by the MongoDB "
+                "backend, other backends will keep using `page_offset`."
+            ),
+        ),
+    ] = "page_offset"
     default_db: Annotated[
         str,
         Field(
@@ -467,6 +600,53 @@ Otherwise, the license will be given as the provided URL and no SPDX identifier
             description="Folder in which log files will be saved.",
         ),
     ] = Path("/var/log/optimade/")
+    server_timing: Annotated[
+        bool,
+        Field(
+            description=(
+                "If True, the durations of the steps of handling each request (e.g., "
+                "parsing and transforming the filter, querying and counting in the "
+                "database, mapping the results and serializing the response) are "
+                "reported in the `Server-Timing` header of the response and logged "
+                "at the debug level."
+            ),
+        ),
+    ] = False
+    metrics: Annotated[
+        bool,
+        Field(
+            description=(
+                "If True, runtime metrics (e.g., request latencies per endpoint, the "
+                "durations of filter parsing, database queries and serialization, and "
+                "the numbers of documents returned and of count timeouts) are collected "
+                "and served in the Prometheus text format at `/extensions/metrics`."
+            ),
+        ),
+    ] = False
+    slow_query_threshold: Annotated[
+        NonNegativeFloat | None,
+        Field(
+            description=(
+                "The number of seconds above which an entry listing database query is "
+                "considered slow, in which case its OPTIMADE filter, backend query, "
+                "duration and the backend's query plan (e.g., MongoDB's `explain()` "
+                "output, see `slow_query_explain_interval`) are logged as warnings. "
+                "Set to `null` to disable."
+            ),
+        ),
+    ] = None
+    slow_query_explain_interval: Annotated[
+        NonNegativeFloat,
+        Field(
+            description=(
+                "The minimum number of seconds between retrieving the query plans of "
+                "slow queries with the same filter, which are retrieved in the "
+                "background, one at a time. Slow queries are still logged without "
+                "their query plan in the meantime. Set to 0 to retrieve the query plan "
+                "of every slow query."
+            ),
+        ),
+    ] = 60.0
     validate_query_parameters: Annotated[
         bool | None,
         Field(
@@ -492,6 +672,53 @@ Otherwise, the license will be given as the provided URL and no SPDX identifier
             ),
         ),
     ] = True
+    validate_api_response_sample_rate: Annotated[
+        float,
+        Field(
+            ge=0,
+            le=1,
+            description=(
+                "The fraction of entry endpoint responses that are fully validated against "
+                "their response model when `validate_api_response` is True. The remaining "
+                "responses are serialized directly, skipping the cost of validating large "
+                "pages."
+            ),
+        ),
+    ] = 1.0
+    validation_cache_size: Annotated[
+        int,
+        Field(
+            description=(
+                "Maximum number of successfully validated entries to remember per entry "
+                "collection, keyed by their `id` and `last_modified` values, such that "
+                "unchanged entries are validated only once when `validate_api_response` "
+                "is True. Entries without `last_modified` are always validated. "
+                "Set to 0 to disable the cache and validate each response against its "
+                "response model instead."
+            ),
+            ge=0,
+        ),
+    ] = 0
+    trust_validation_stamp: Annotated[
+        bool,
+        Field(
+            description=(
+                "If True, responses in which all entries were stamped as valid on ingestion "
+                "(see `optimade-ingest --validate`) by the same version of "
+                "`optimade-python-tools` are not validated again."
+            ),
+        ),
+    ] = False
+    response_serializer: Annotated[
+        Literal["json", "orjson"],
+        Field(
+            description=(
+                "The JSON serializer used for responses. `orjson` requires the `orjson` "
+                "package and serializes responses directly to bytes, which is "
+                "considerably faster for large pages."
+            ),
+        ),
+    ] = "json"
 
     @field_validator("insert_from_jsonl", mode="before")
     @classmethod
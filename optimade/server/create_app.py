@@ -1,6 +1,7 @@
 import json
 import os
 import warnings
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -8,7 +9,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 
 with warnings.catch_warnings(record=True) as w:
-    from optimade.server.config import DEFAULT_CONFIG_FILE_PATH, ServerConfig
+    from optimade.server.config import (
+        DEFAULT_CONFIG_FILE_PATH,
+        ServerConfig,
+        SupportedBackend,
+    )
 
     config_warnings = w
 
@@ -19,18 +24,25 @@ from optimade.server.entry_collections import EntryCollection, create_entry_coll
 from optimade.server.exception_handlers import OPTIMADE_EXCEPTIONS
 from optimade.server.logger import create_logger, set_logging_context
 from optimade.server.mappers.entries import BaseResourceMapper
-from optimade.server.middleware import OPTIMADE_MIDDLEWARE
+from optimade.server.metrics import Metrics
+from optimade.server.middleware import (
+    OPTIMADE_MIDDLEWARE,
+    AddMetrics,
+    AddServerTiming,
+)
 from optimade.server.routers import (
     files,
     index_info,
     info,
     landing,
     links,
+    metrics,
     references,
     structures,
     versions,
 )
-from optimade.server.routers.utils import BASE_URL_PREFIXES, JSONAPIResponse
+from optimade.server.routers.utils import BASE_URL_PREFIXES, get_response_class
+from optimade.server.schemas import precompute_queryable_properties
 
 MAIN_ENDPOINTS = [info, links, references, structures, files, landing]
 INDEX_ENDPOINTS = [index_info, links]
@@ -117,6 +129,12 @@ def insert_main_data(
             jsonl_path,
             entry_collections,
             create_default_index=config.create_default_index,
+            batch_size=config.insert_from_jsonl_batch_size,
+            processes=config.insert_from_jsonl_processes,
+            writers=config.insert_from_jsonl_writers,
+            checkpoint_path=config.insert_from_jsonl_checkpoint,
+            validate=config.insert_from_jsonl_validate,
+            validation_report_path=config.insert_from_jsonl_validation_report,
         )
 
         logger.debug("Inserted data from JSONL file: %s", jsonl_path)
@@ -237,7 +255,47 @@ def create_app(
     if index:
         config.is_index = True
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Asynchronous MongoDB clients are bound to the event loop that first uses
+        # them, so each app creates (and closes) its own on the loop that serves it
+        app.state.async_mongo_client = None
+        mongo_collections = []
+        if config.database_backend == SupportedBackend.MONGODB:
+            from optimade.server.entry_collections.mongo import (
+                MongoCollection,
+                create_async_mongo_client,
+            )
+
+            app.state.async_mongo_client = create_async_mongo_client(config)
+            mongo_collections = [
+                collection
+                for collection in app.state.entry_collections.values()
+                if isinstance(collection, MongoCollection)
+            ]
+            for collection in mongo_collections:
+                collection.set_async_client(app.state.async_mongo_client)
+
+        try:
+            yield
+        finally:
+            for collection in mongo_collections:
+                collection.set_async_client(None)
+            if app.state.async_mongo_client is not None:
+                from optimade.server.entry_collections.mongo import (
+                    close_async_mongo_client,
+                )
+
+                await close_async_mongo_client(app.state.async_mongo_client)
+                app.state.async_mongo_client = None
+
+            # Close the asynchronous database clients of the collections, which are
+            # not closed at exit
+            for collection in app.state.entry_collections.values():
+                await collection.close_async()
+
     app = FastAPI(
+        lifespan=lifespan,
         root_path=config.root_path,
         title=title,
         description=description,
@@ -245,7 +303,7 @@ def create_app(
         docs_url=f"{BASE_URL_PREFIXES['major']}/extensions/docs",
         redoc_url=f"{BASE_URL_PREFIXES['major']}/extensions/redoc",
         openapi_url=f"{BASE_URL_PREFIXES['major']}/extensions/openapi.json",
-        default_response_class=JSONAPIResponse,
+        default_response_class=get_response_class(config),
         separate_input_output_schemas=False,
     )
 
@@ -259,6 +317,10 @@ def create_app(
     # store also the BaseResourceMapper
     app.state.base_resource_mapper = BaseResourceMapper()
 
+    # Generate the (slow to compute) schemas of the queryable properties up front
+    if not index:
+        precompute_queryable_properties(config)
+
     if not index:
         if config.insert_test_data or config.insert_from_jsonl:
             insert_main_data(config, entry_collections, logger)
@@ -280,6 +342,13 @@ def create_app(
     for middleware in OPTIMADE_MIDDLEWARE:
         app.add_middleware(middleware)
 
+    if config.server_timing:
+        app.add_middleware(AddServerTiming)
+
+    if config.metrics:
+        app.state.metrics = Metrics()
+        app.add_middleware(AddMetrics)
+
     # Enable GZIP after other middleware.
     if config.gzip.enabled:
         app.add_middleware(
@@ -302,4 +371,8 @@ def create_app(
     add_major_version_base_url(app, index=index)
     add_optional_versioned_base_urls(app, index=index)
 
+    if config.metrics:
+        app.include_router(metrics.router)
+        app.include_router(metrics.router, prefix=BASE_URL_PREFIXES["major"])
+
     return app
@@ -1,7 +1,15 @@
 from .entry_collections import (
+    VALIDATION_STAMP_FIELD,
     EntryCollection,
+    FilterCacheInfo,
     PaginationMechanism,
     create_entry_collections,
 )
 
-__all__ = ("EntryCollection", "create_entry_collections", "PaginationMechanism")
+__all__ = (
+    "EntryCollection",
+    "FilterCacheInfo",
+    "create_entry_collections",
+    "PaginationMechanism",
+    "VALIDATION_STAMP_FIELD",
+)
@@ -4,7 +4,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
-    from elasticsearch import Elasticsearch
+    from elasticsearch import AsyncElasticsearch, Elasticsearch
+    from elasticsearch_dsl import Search
 
 from optimade.filtertransformers.elasticsearch import ElasticTransformer
 from optimade.models import EntryResource
@@ -12,6 +13,7 @@ from optimade.server.config import ServerConfig
 from optimade.server.entry_collections import EntryCollection, PaginationMechanism
 from optimade.server.logger import get_logger
 from optimade.server.mappers import BaseResourceMapper
+from optimade.server.timing import timed
 
 
 def get_elastic_client(config: ServerConfig) -> Optional["Elasticsearch"]:
@@ -23,6 +25,25 @@ def get_elastic_client(config: ServerConfig) -> Optional["Elasticsearch"]:
     return None
 
 
+def get_async_elastic_client(config: ServerConfig) -> Optional["AsyncElasticsearch"]:
+    """Return an `AsyncElasticsearch` client for the configured hosts, or `None`
+    if the asynchronous client is not available (it requires `aiohttp`), in which
+    case queries are run in a worker thread instead."""
+    if config.database_backend.value != "elastic":
+        return None
+
+    try:
+        from elasticsearch import AsyncElasticsearch
+    except ImportError:
+        get_logger().warning(
+            "No asynchronous Elasticsearch client available (requires aiohttp), "
+            "database queries will be run in worker threads."
+        )
+        return None
+
+    return AsyncElasticsearch(hosts=config.elastic_hosts)
+
+
 class ElasticCollection(EntryCollection):
     pagination_mechanism = PaginationMechanism("page_offset")
 
@@ -61,6 +82,10 @@ class ElasticCollection(EntryCollection):
             )
 
         self.client: Elasticsearch = tmp_client
+        # Only create an asynchronous client if the synchronous one was not preconfigured
+        self.async_client: AsyncElasticsearch | None = (
+            get_async_elastic_client(config) if client is None else None
+        )
 
         self.name = name
 
@@ -141,6 +166,25 @@ class ElasticCollection(EntryCollection):
             # If the collection does not exist, return 0, behaving similarly to MongoDB
             return 0
 
+    async def close_async(self) -> None:
+        """Close the asynchronous Elasticsearch client of the collection, if any."""
+        if self.async_client is not None:
+            async_client, self.async_client = self.async_client, None
+            await async_client.close()
+
+    async def len_async(self) -> int:
+        """Returns the total number of entries in the collection, without blocking
+        the event loop."""
+        if self.async_client is None:
+            return await super().len_async()
+
+        from elasticsearch.exceptions import NotFoundError
+
+        try:
+            return (await self.async_client.count(index=self.name))["count"]
+        except NotFoundError:
+            return 0
+
     def insert(self, data: list[EntryResource | dict]) -> None:
         """Add the given entries to the underlying database.
 
@@ -180,6 +224,12 @@ class ElasticCollection(EntryCollection):
             ),
         )
 
+    def _get_ids_filter(self, ids: list[str]) -> Any:
+        """Return the Elasticsearch `terms` query matching all entries with the given IDs."""
+        from elasticsearch_dsl import Q
+
+        return Q("terms", **{self.resource_mapper.get_backend_field("id"): ids})
+
     def _run_db_query(
         self, criteria: dict[str, Any], single_entry=False
     ) -> tuple[list[dict[str, Any]], int, bool]:
@@ -193,6 +243,74 @@ class ElasticCollection(EntryCollection):
             The list of entries from the database (without any re-mapping), the total number of
             entries matching the query and a boolean for whether or not there is more data available.
 
+        """
+        search, page_offset, page_above, limit = self._get_search(criteria)
+        with timed("find"):
+            response = search.execute()
+        results = [hit.to_dict() for hit in response.hits]
+
+        return self._handle_search_results(
+            results,
+            response.hits.total.value,
+            page_offset,
+            page_above,
+            limit,
+            single_entry,
+        )
+
+    async def _run_db_query_async(
+        self, criteria: dict[str, Any], single_entry=False
+    ) -> tuple[list[dict[str, Any]], int | None, bool]:
+        """Run the query on the backend with the asynchronous client and collect the results.
+
+        Arguments:
+            criteria: A dictionary representation of the query parameters.
+            single_entry: Whether or not the caller is expecting a single entry response.
+
+        Returns:
+            The list of entries from the database (without any re-mapping), the total number of
+            entries matching the query and a boolean for whether or not there is more data available.
+
+        """
+        if self.async_client is None:
+            return await super()._run_db_query_async(criteria, single_entry)
+
+        search, page_offset, page_above, limit = self._get_search(criteria)
+        with timed("find"):
+            response = await self.async_client.search(
+                index=self.name, body=search.to_dict()
+            )
+        results = [hit["_source"] for hit in response["hits"]["hits"]]
+
+        return self._handle_search_results(
+            results,
+            response["hits"]["total"]["value"],
+            page_offset,
+            page_above,
+            limit,
+            single_entry,
+        )
+
+    def explain(self, criteria: dict[str, Any]) -> Any:
+        """Return the Elasticsearch query DSL and profile of the search for the given criteria.
+
+        Arguments:
+            criteria: A dictionary representation of the query parameters.
+
+        """
+        search, _, _, _ = self._get_search(criteria)
+        response = search.extra(profile=True).execute()
+        return {
+            "query": search.to_dict(),
+            "profile": response.to_dict().get("profile"),
+        }
+
+    def _get_search(self, criteria: dict[str, Any]) -> tuple["Search", int, Any, int]:
+        """Construct the search for the given query criteria.
+
+        Returns:
+            The search, and the page offset, `page_above` value and page limit used.
+
         """
         from elasticsearch_dsl import Search
 
@@ -201,15 +319,12 @@ class ElasticCollection(EntryCollection):
         if criteria.get("filter", False):
             search = search.query(criteria["filter"])
 
-        page_offset = criteria.get("skip", None)
+        page_offset: int = criteria.get("skip") or 0
         page_above = criteria.get("page_above", None)
 
         limit = criteria.get("limit", self.config.page_limit)
 
-        all_aliased_fields = [
-            self.resource_mapper.get_backend_field(field) for field in self.all_fields
-        ]
-        search = search.source(includes=all_aliased_fields)
+        search = search.source(includes=list(criteria["projection"]))
 
         elastic_sort = [
             {field: {"order": "desc" if sort_dir == -1 else "asc"}}
@@ -230,16 +345,24 @@ class ElasticCollection(EntryCollection):
 
         else:
             search = search[0:limit]
-            page_offset = 0
 
         search = search.extra(track_total_hits=True)
-        response = search.execute()
 
-        results = [hit.to_dict() for hit in response.hits]
+        return search, page_offset, page_above, limit
 
+    @staticmethod
+    def _handle_search_results(
+        results: list[dict[str, Any]],
+        total: int,
+        page_offset: int,
+        page_above: Any,
+        limit: int,
+        single_entry: bool,
+    ) -> tuple[list[dict[str, Any]], int, bool]:
+        """Determine `data_returned` and `more_data_available` for the search results."""
         more_data_available = False
         if not single_entry:
-            data_returned = response.hits.total.value
+            data_returned = total
             if page_above is not None:
                 more_data_available = len(results) == limit and data_returned != limit
             else:
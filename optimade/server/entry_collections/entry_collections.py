@@ -1,19 +1,31 @@
+import asyncio
+import copy
 import enum
 import re
+import threading
+import time
 import warnings
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, NamedTuple
 
+from fastapi.concurrency import run_in_threadpool
 from lark import Transformer
+from pydantic import ValidationError
 
 from optimade.exceptions import BadRequest, Forbidden, NotFound
 from optimade.filterparser import LarkParser
+from optimade.filtertransformers.base_transformer import record_transformer_warnings
 from optimade.models import Attributes, EntryResource
 from optimade.models.types import NoneType, _get_origin_type
 from optimade.server.config import ServerConfig, SupportedBackend
+from optimade.server.logger import get_logger
 from optimade.server.mappers import BaseResourceMapper
 from optimade.server.query_params import EntryListingQueryParams, SingleEntryQueryParams
+from optimade.server.timing import timed
 from optimade.warnings import (
     FieldValueNotRecognized,
     QueryParamNotUsed,
@@ -67,6 +79,37 @@ def create_collection(
     )
 
 
+VALIDATION_STAMP_FIELD = "_optimade_validated"
+"""The database field with which entries that were validated on ingestion are stamped,
+holding the version of `optimade` used for the validation
+(see [`insert_from_jsonl()`][optimade.utils.insert_from_jsonl])."""
+
+
+_EXPLAIN_EXECUTOR: ThreadPoolExecutor | None = None
+_EXPLAIN_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_explain_executor() -> ThreadPoolExecutor:
+    """Return the (shared) single background thread that retrieves the query plans of
+    slow queries, such that they are retrieved one at a time."""
+    global _EXPLAIN_EXECUTOR
+    with _EXPLAIN_EXECUTOR_LOCK:
+        if _EXPLAIN_EXECUTOR is None:
+            _EXPLAIN_EXECUTOR = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="optimade-explain"
+            )
+        return _EXPLAIN_EXECUTOR
+
+
+class FilterCacheInfo(NamedTuple):
+    """The statistics of the cache of transformed filters of an entry collection."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
 class PaginationMechanism(enum.Enum):
     """The supported pagination mechanisms."""
 
@@ -119,10 +162,40 @@ class EntryCollection(ABC):
 
         self._all_fields: set[str] = set()
 
+        self._cached_transform_filter = lru_cache(maxsize=config.filter_cache_size)(
+            self._transform_filter
+        )
+
+        # The filters of slow queries by the time their query plan was last retrieved
+        self._explained_filters: OrderedDict[str | None, float] = OrderedDict()
+        self._explained_filters_lock = threading.Lock()
+
+        self._validated_entries: OrderedDict[Hashable, EntryResource | None] = (
+            OrderedDict()
+        )
+        self._validated_entries_lock = threading.Lock()
+
     @abstractmethod
     def __len__(self) -> int:
         """Returns the total number of entries in the collection."""
 
+    async def close_async(self) -> None:
+        """Close the asynchronous database clients of the collection, e.g., when the
+        app shuts down.
+
+        Backends without a native asynchronous client have nothing to close.
+
+        """
+
+    async def len_async(self) -> int:
+        """Returns the total number of entries in the collection, without blocking
+        the event loop.
+
+        Backends without a native asynchronous client run `len()` in a worker thread.
+
+        """
+        return await asyncio.to_thread(len, self)
+
     @abstractmethod
     def insert(self, data: list[EntryResource | dict]) -> None:
         """Add the given entries to the underlying database.
@@ -147,6 +220,18 @@ class EntryCollection(ABC):
 
         """
 
+    async def count_async(self, **kwargs: Any) -> int | None:
+        """Asynchronous version of
+        [`count()`][optimade.server.entry_collections.entry_collections.EntryCollection.count].
+
+        Backends without a native asynchronous client run `count()` in a worker thread.
+
+        Parameters:
+            **kwargs: Query parameters as keyword arguments.
+
+        """
+        return await asyncio.to_thread(self.count, **kwargs)
+
     def find(
         self, params: EntryListingQueryParams | SingleEntryQueryParams
     ) -> tuple[
@@ -179,10 +264,166 @@ class EntryCollection(ABC):
         single_entry = isinstance(params, SingleEntryQueryParams)
         response_fields: set[str] = criteria.pop("fields")
 
+        start = time.perf_counter()
         raw_results, data_returned, more_data_available = self._run_db_query(
             criteria, single_entry
         )
+        duration = time.perf_counter() - start
+        if self._is_slow_query(duration):
+            self._log_slow_query(params, criteria, duration)
+
+        return self._handle_db_results(
+            raw_results,
+            data_returned,
+            more_data_available,
+            response_fields,
+            single_entry,
+        )
+
+    async def find_async(
+        self, params: EntryListingQueryParams | SingleEntryQueryParams
+    ) -> tuple[
+        dict[str, Any] | list[dict[str, Any]] | None,
+        int | None,
+        bool,
+        set[str],
+        set[str],
+    ]:
+        """Asynchronous version of
+        [`find()`][optimade.server.entry_collections.entry_collections.EntryCollection.find],
+        which awaits the database query rather than blocking on it.
+
+        The parsing of the query parameters and the mapping of the results are
+        CPU-bound and run in the threadpool, so as not to stall the event loop.
+
+        Parameters:
+            params: Entry listing URL query params.
+
+        Returns:
+            A tuple of various relevant values:
+            (`results`, `data_returned`, `more_data_available`, `exclude_fields`, `include_fields`).
+
+        """
+        criteria = await run_in_threadpool(self.handle_query_params, params)
+        single_entry = isinstance(params, SingleEntryQueryParams)
+        response_fields: set[str] = criteria.pop("fields")
+
+        start = time.perf_counter()
+        (
+            raw_results,
+            data_returned,
+            more_data_available,
+        ) = await self._run_db_query_async(criteria, single_entry)
+        duration = time.perf_counter() - start
+        if self._is_slow_query(duration):
+            self._log_slow_query(params, criteria, duration)
+
+        return await run_in_threadpool(
+            self._handle_db_results,
+            raw_results,
+            data_returned,
+            more_data_available,
+            response_fields,
+            single_entry,
+        )
+
+    def _is_slow_query(self, duration: float) -> bool:
+        """Whether a database query that took `duration` seconds exceeds the
+        `slow_query_threshold`."""
+        threshold = self.config.slow_query_threshold
+        return threshold is not None and duration > threshold
+
+    def explain(self, criteria: dict[str, Any]) -> Any:
+        """Return the backend's query plan for the given query criteria.
+
+        Arguments:
+            criteria: A dictionary representation of the query parameters.
+
+        Raises:
+            NotImplementedError: If the backend does not support explaining queries.
+
+        """
+        raise NotImplementedError
+
+    def _explain(self, criteria: dict[str, Any]) -> Any:
+        """Return the query plan for the criteria, or a description of why it is not
+        available, never raising."""
+        try:
+            return self.explain(criteria)
+        except NotImplementedError:
+            return "not supported by this backend"
+        except Exception as exc:
+            return f"could not explain query: {exc!r}"
+
+    def _log_slow_query(
+        self,
+        params: EntryListingQueryParams | SingleEntryQueryParams,
+        criteria: dict[str, Any],
+        duration: float,
+    ) -> None:
+        """Log a database query that exceeded the `slow_query_threshold`, and schedule
+        the logging of its query plan.
+
+        Retrieving the query plan may itself take a while, so it is done by a
+        background thread, off the path of the response, and at most once every
+        `slow_query_explain_interval` seconds per filter.
+
+        """
+        filter_ = getattr(params, "filter", None)
+        get_logger().warning(
+            "Slow query on %r (%.3f s) for filter %r: %s",
+            self.resource_mapper.ENDPOINT,
+            duration,
+            filter_,
+            {k: v for k, v in criteria.items() if k != "projection"},
+        )
+
+        now = time.monotonic()
+        interval = self.config.slow_query_explain_interval
+        with self._explained_filters_lock:
+            # Forget the filters explained longer ago than the interval
+            while self._explained_filters:
+                oldest, explained = next(iter(self._explained_filters.items()))
+                if now - explained < interval:
+                    break
+                del self._explained_filters[oldest]
+            if filter_ in self._explained_filters:
+                return
+            self._explained_filters[filter_] = now
+
+        _get_explain_executor().submit(self._log_query_plan, filter_, criteria)
+
+    def _log_query_plan(self, filter_: str | None, criteria: dict[str, Any]) -> None:
+        """Log the query plan of a slow query."""
+        get_logger().warning(
+            "Query plan of slow query on %r for filter %r: %s",
+            self.resource_mapper.ENDPOINT,
+            filter_,
+            self._explain(criteria),
+        )
+
+    def _handle_db_results(
+        self,
+        raw_results: list[dict[str, Any]],
+        data_returned: int | None,
+        more_data_available: bool,
+        response_fields: set[str],
+        single_entry: bool,
+    ) -> tuple[
+        dict[str, Any] | list[dict[str, Any]] | None,
+        int | None,
+        bool,
+        set[str],
+        set[str],
+    ]:
+        """Check the requested response fields and map the raw database results
+        back to the OPTIMADE format.
+
+        Returns:
+            A tuple of various relevant values:
+            (`results`, `data_returned`, `more_data_available`, `exclude_fields`, `include_fields`).
 
+        """
         exclude_fields = self.all_fields - response_fields
         include_fields = (
             response_fields - self.resource_mapper.TOP_LEVEL_NON_ATTRIBUTES_FIELDS
@@ -216,7 +457,8 @@ class EntryCollection(ABC):
         results: list[dict[str, Any]] | dict[str, Any] | None = None
 
         if raw_results:
-            results = [self.resource_mapper.map_back(doc) for doc in raw_results]
+            with timed("map_back"):
+                results = [self.resource_mapper.map_back(doc) for doc in raw_results]
 
             if single_entry:
                 results = results[0]
@@ -240,6 +482,106 @@ class EntryCollection(ABC):
             include_fields,
         )
 
+    def find_by_ids(
+        self, ids: Iterable[str], chunk_size: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch the entries with the given IDs, e.g., to include related resources
+        in a response.
+
+        The entries are queried directly by ID (in chunks of at most `chunk_size` IDs),
+        without parsing and transforming an OPTIMADE filter string.
+
+        Parameters:
+            ids: The IDs of the entries to fetch.
+            chunk_size: The maximum number of IDs to query at once, defaults to
+                the `page_limit_max` server config option.
+
+        Returns:
+            The list of found entries (in no particular order), mapped to the OPTIMADE format.
+
+        """
+        results: list[dict[str, Any]] = []
+        for criteria in self._get_ids_criteria(ids, chunk_size):
+            raw_results, _, _ = self._run_db_query(criteria, single_entry=True)
+            results.extend(self._map_back_all(raw_results))
+        return results
+
+    async def find_by_ids_async(
+        self, ids: Iterable[str], chunk_size: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Asynchronous version of
+        [`find_by_ids()`][optimade.server.entry_collections.entry_collections.EntryCollection.find_by_ids].
+
+        Parameters:
+            ids: The IDs of the entries to fetch.
+            chunk_size: The maximum number of IDs to query at once, defaults to
+                the `page_limit_max` server config option.
+
+        Returns:
+            The list of found entries (in no particular order), mapped to the OPTIMADE format.
+
+        """
+        results: list[dict[str, Any]] = []
+        for criteria in self._get_ids_criteria(ids, chunk_size):
+            raw_results, _, _ = await self._run_db_query_async(
+                criteria, single_entry=True
+            )
+            results.extend(await run_in_threadpool(self._map_back_all, raw_results))
+        return results
+
+    def _map_back_all(self, raw_results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Map back the raw database documents to the OPTIMADE format."""
+        with timed("map_back"):
+            return [self.resource_mapper.map_back(doc) for doc in raw_results]
+
+    def _get_ids_criteria(
+        self, ids: Iterable[str], chunk_size: int | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the query criteria for each chunk of (unique) IDs."""
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids:
+            return
+
+        criteria = self.handle_query_params(
+            EntryListingQueryParams(
+                filter="",
+                response_format="json",
+                response_fields="",
+                sort="",
+                page_limit=0,
+                page_offset=0,
+            )
+        )
+        criteria.pop("fields")
+
+        chunk_size = chunk_size or self.config.page_limit_max
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start : start + chunk_size]
+            yield {
+                **criteria,
+                "filter": self._get_ids_filter(chunk),
+                "limit": len(chunk),
+            }
+
+    def _get_ids_filter(self, ids: list[str]) -> Any:
+        """Return the backend query matching all entries with the given IDs.
+
+        Backends should override this method to construct the query natively;
+        by default, an OPTIMADE filter is constructed and transformed, bypassing the
+        cache of transformed filters, as these one-off filters would only evict
+        the cached filters of actual queries.
+
+        Parameters:
+            ids: The IDs of the entries to match.
+
+        Returns:
+            The backend query.
+
+        """
+        return self.transform_filter(
+            " OR ".join(f'id="{id_}"' for id_ in ids), use_cache=False
+        )
+
     @abstractmethod
     def _run_db_query(
         self, criteria: dict[str, Any], single_entry: bool = False
@@ -256,6 +598,24 @@ class EntryCollection(ABC):
 
         """
 
+    async def _run_db_query_async(
+        self, criteria: dict[str, Any], single_entry: bool = False
+    ) -> tuple[list[dict[str, Any]], int | None, bool]:
+        """Asynchronous version of `_run_db_query()`.
+
+        Backends without a native asynchronous client run `_run_db_query()` in a worker thread.
+
+        Arguments:
+            criteria: A dictionary representation of the query parameters.
+            single_entry: Whether or not the caller is expecting a single entry response.
+
+        Returns:
+            The list of entries from the database (without any re-mapping), the total number of
+            entries matching the query and a boolean for whether or not there is more data available.
+
+        """
+        return await asyncio.to_thread(self._run_db_query, criteria, single_entry)
+
     @property
     def all_fields(self) -> set[str]:
         """Get the set of all fields handled in this collection,
@@ -284,12 +644,15 @@ class EntryCollection(ABC):
 
         return self._all_fields
 
-    def create_index(self, field: str, unique: bool = False) -> None:
+    def create_index(
+        self, field: str | list[tuple[str, int]], unique: bool = False
+    ) -> None:
         """Create an index on the given field, as stored in the database.
 
         Arguments:
             field: The database field to index (i.e., if different from the OPTIMADE field,
-                the mapper should be used to convert between the two).
+                the mapper should be used to convert between the two), or, for a compound
+                index, a list of database fields and their sort directions.
             unique: Whether or not the index should be unique.
 
         """
@@ -334,6 +697,115 @@ class EntryCollection(ABC):
 
         return set(annotation.model_fields)  # type: ignore[attr-defined]
 
+    def _transform_filter(self, filter_: str) -> tuple[Any, tuple[Warning, ...]]:
+        """Parse and transform a filter string into a backend query.
+
+        Any warnings raised by the transformer are recorded and returned,
+        rather than emitted.
+
+        Parameters:
+            filter_: The OPTIMADE filter string.
+
+        Returns:
+            The backend query and the warnings raised while transforming it.
+
+        """
+        with record_transformer_warnings() as transformer_warnings:
+            with timed("parse"):
+                tree = self.parser.parse(filter_)
+            with timed("transform"):
+                query = self.transformer.transform(tree)
+        return query, tuple(transformer_warnings)
+
+    def transform_filter(self, filter_: str, use_cache: bool = True) -> Any:
+        """Parse and transform a filter string into a backend query,
+        using the per-collection LRU cache of transformed filters.
+
+        The size of the cache is set by the `filter_cache_size` server config option.
+        Warnings raised by the transformer are re-emitted for every call,
+        including cache hits.
+
+        Parameters:
+            filter_: The OPTIMADE filter string.
+            use_cache: Whether to use the cache. One-off filters (e.g., on the `id` of
+                a single entry) should bypass it, as they would only evict the cached
+                filters of actual queries.
+
+        Returns:
+            A copy of the (possibly cached) backend query.
+
+        """
+        if not use_cache:
+            query, transformer_warnings = self._transform_filter(filter_)
+        else:
+            query, transformer_warnings = self._cached_transform_filter(filter_)
+        for warning in transformer_warnings:
+            warnings.warn(warning)
+        if use_cache and self.config.filter_cache_size:
+            # Never hand out the cached object itself, as callers may mutate it
+            query = copy.deepcopy(query)
+        return query
+
+    def filter_cache_info(self) -> FilterCacheInfo:
+        """Return the hits, misses, maximum size and current size of the
+        collection's cache of transformed filters."""
+        return FilterCacheInfo(*self._cached_transform_filter.cache_info())
+
+    @staticmethod
+    def _validation_cache_key(entry: dict[str, Any]) -> Hashable | None:
+        """Return the key under which the successful validation of the entry is cached,
+        or `None` if the entry cannot be cached, as it has no `last_modified` value.
+
+        As entries may be pruned according to `response_fields`, the key also includes
+        the attributes present in the entry.
+
+        """
+        attributes = entry.get("attributes") or {}
+        last_modified = attributes.get("last_modified")
+        if last_modified is None:
+            return None
+        return entry.get("id"), last_modified, frozenset(attributes)
+
+    def validate_entry(
+        self, entry: dict[str, Any] | EntryResource
+    ) -> EntryResource | None:
+        """Validate a (mapped) entry against the collection's resource class.
+
+        The outcome is remembered by the entry's `id`, `last_modified` and attributes,
+        for up to `validation_cache_size` entries per collection, such that unchanged
+        entries are only validated once.
+
+        Returns:
+            The validated resource, or `None` if the entry is not a valid resource
+            (e.g., because it has been pruned according to `response_fields`).
+
+        """
+        if isinstance(entry, EntryResource):
+            return entry
+
+        key = None
+        if self.config.validation_cache_size:
+            key = self._validation_cache_key(entry)
+            if key is not None:
+                with self._validated_entries_lock:
+                    if key in self._validated_entries:
+                        self._validated_entries.move_to_end(key)
+                        return self._validated_entries[key]
+
+        resource: EntryResource | None
+        try:
+            resource = self.resource_cls.model_validate(entry)
+        except ValidationError:
+            resource = None
+
+        if key is not None:
+            with self._validated_entries_lock:
+                self._validated_entries[key] = resource
+                while len(self._validated_entries) > self.config.validation_cache_size:
+                    self._validated_entries.popitem(last=False)
+
+        return resource
+
     def handle_query_params(
         self, params: EntryListingQueryParams | SingleEntryQueryParams
     ) -> dict[str, Any]:
@@ -360,8 +832,10 @@ class EntryCollection(ABC):
 
         # filter
         if getattr(params, "filter", False):
-            cursor_kwargs["filter"] = self.transformer.transform(
-                self.parser.parse(params.filter)  # type: ignore[union-attr]
+            # The filter of a single entry is a one-off selection of its `id`
+            cursor_kwargs["filter"] = self.transform_filter(
+                params.filter,  # type: ignore[union-attr]
+                use_cache=not isinstance(params, SingleEntryQueryParams),
             )
         else:
             cursor_kwargs["filter"] = {}
@@ -387,11 +861,6 @@ class EntryCollection(ABC):
             cursor_kwargs["limit"] = self.config.page_limit
 
         # response_fields
-        cursor_kwargs["projection"] = {
-            f"{self.resource_mapper.get_backend_field(f)}": True
-            for f in self.all_fields
-        }
-
         if getattr(params, "response_fields", False):
             response_fields = set(params.response_fields.split(","))
             response_fields |= self.resource_mapper.get_required_fields()
@@ -400,6 +869,14 @@ class EntryCollection(ABC):
 
         cursor_kwargs["fields"] = response_fields
 
+        # Only retrieve the known fields that were requested from the database
+        cursor_kwargs["projection"] = {
+            f"{self.resource_mapper.get_backend_field(f)}": True
+            for f in response_fields & self.all_fields
+        }
+        if self.config.trust_validation_stamp:
+            cursor_kwargs["projection"][VALIDATION_STAMP_FIELD] = True
+
         # sort
         if getattr(params, "sort", False):
             cursor_kwargs["sort"] = self.parse_sort_params(params.sort)  # type: ignore[union-attr]
@@ -408,7 +885,7 @@ class EntryCollection(ABC):
         received_pagination_option = False
         warn_multiple_keys = False
 
-        if getattr(params, "page_offset", False):
+        if getattr(params, "page_offset", None) is not None:
             received_pagination_option = True
             cursor_kwargs["skip"] = params.page_offset  # type: ignore[union-attr]
 
@@ -519,23 +996,56 @@ class EntryCollection(ABC):
         if isinstance(results, list) and results:
             # If a user passed a particular pagination mechanism, keep using it
             # Otherwise, use the default pagination mechanism of the collection
-            pagination_mechanism = PaginationMechanism.OFFSET
-            for pagination_key in (
-                "page_offset",
-                "page_number",
-                "page_above",
-            ):
-                if getattr(params, pagination_key, None) is not None:
-                    pagination_mechanism = PaginationMechanism(pagination_key)
-                    break
-
-            if pagination_mechanism == PaginationMechanism.OFFSET:
+            # (in the same order of precedence as `handle_query_params`)
+            pagination_mechanism = self.pagination_mechanism
+            if getattr(params, "page_offset", None) is not None:
+                pagination_mechanism = PaginationMechanism.OFFSET
+            elif getattr(params, "page_number", None) is not None:
+                pagination_mechanism = PaginationMechanism.NUMBER
+            elif getattr(params, "page_above", None) is not None:
+                pagination_mechanism = PaginationMechanism.ABOVE
+
+            if pagination_mechanism == PaginationMechanism.ABOVE:
+                page_above = self.get_page_above_value(params, results[-1])
+                if page_above is not None:
+                    query["page_above"] = [page_above]
+                    return query
+                # Fall back to offset-based pagination if the value could not be determined
+                pagination_mechanism = PaginationMechanism.OFFSET
+
+            if pagination_mechanism == PaginationMechanism.NUMBER:
+                query["page_number"] = [str(max(params.page_number, 1) + 1)]
+
+            elif pagination_mechanism == PaginationMechanism.OFFSET:
                 query["page_offset"] = [
-                    str(params.page_offset + len(results))  # type: ignore[list-item]
+                    str((getattr(params, "page_offset", None) or 0) + len(results))
                 ]
 
         return query
 
+    def get_page_above_value(
+        self, params: EntryListingQueryParams, last_result: dict[str, Any]
+    ) -> str | None:
+        """Provides the `page_above` value for the next page of results, i.e.,
+        the value of the sort field(s) of the last returned result.
+
+        By default, value-based pagination is only supported for results sorted by
+        `id`, in which case the `id` of the last result is returned. Backends
+        may override this method to support other sort fields.
+
+        Arguments:
+            params: The parsed request params produced by handle_query_params.
+            last_result: The last (mapped) result of the current page.
+
+        Returns:
+            The `page_above` value, or `None` if value-based pagination is not
+            possible for the given params.
+
+        """
+        if getattr(params, "sort", None):
+            return None
+        return str(last_result["id"])
+
 
 from optimade.models import (
     FileResource,
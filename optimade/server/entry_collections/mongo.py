@@ -1,18 +1,29 @@
 import atexit
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
 from typing import Any
 
+from bson import ObjectId, json_util
 from pymongo.errors import ExecutionTimeout
 
+from optimade.exceptions import BadRequest
 from optimade.filtertransformers.mongo import MongoTransformer
 from optimade.models import EntryResource
 from optimade.server.config import ServerConfig, SupportedBackend
-from optimade.server.entry_collections import EntryCollection
+from optimade.server.entry_collections import EntryCollection, PaginationMechanism
 from optimade.server.logger import get_logger
 from optimade.server.mappers import BaseResourceMapper
 from optimade.server.query_params import EntryListingQueryParams, SingleEntryQueryParams
+from optimade.server.timing import count, timed
 
 _CLIENTS: dict[tuple[str, str], Any] = {}
 
+_KEYSET_VALUE_TYPES = (str, int, float, bool, type(None), datetime, ObjectId)
+"""The types of the values of the sort fields that a `page_above` value may contain."""
+
 
 def _close_all_clients(log: bool = True):
     for (backend, uri), client in list(_CLIENTS.items()):
@@ -58,6 +69,99 @@ def get_mongo_client(config: ServerConfig):
     return client
 
 
+def create_async_mongo_client(config: ServerConfig):
+    """Create an asynchronous MongoDB client for the configured backend and URI.
+
+    Unlike synchronous clients, asynchronous clients are bound to the event loop that
+    first uses them, so they are not shared: each app creates its own when it starts
+    (see [`MongoCollection.set_async_client()`][optimade.server.entry_collections.mongo.MongoCollection.set_async_client]).
+
+    The `AsyncMongoClient` of pymongo is used if available, otherwise the client of
+    Motor, if installed. Returns `None` if no asynchronous client is available
+    (e.g., for mongomock), in which case queries are run in a worker thread instead.
+
+    """
+    backend = config.database_backend.value
+    uri = config.mongo_uri
+
+    if backend != "mongodb":
+        return None
+
+    try:
+        from pymongo import AsyncMongoClient
+    except ImportError:
+        try:
+            from motor.motor_asyncio import AsyncIOMotorClient as AsyncMongoClient
+        except ImportError:
+            get_logger().warning(
+                "No asynchronous MongoDB client available (requires pymongo>=4.9 or "
+                "motor), database queries will be run in worker threads."
+            )
+            return None
+
+    get_logger().info(f"Using: Asynchronous MongoDB client @ {uri}")
+    return AsyncMongoClient(uri)
+
+
+async def close_async_mongo_client(client: Any) -> None:
+    """Close an asynchronous MongoDB client created by
+    [`create_async_mongo_client()`][optimade.server.entry_collections.mongo.create_async_mongo_client].
+
+    The `close()` method of pymongo's `AsyncMongoClient` is a coroutine,
+    whereas that of Motor is not.
+
+    """
+    result = client.close()
+    if inspect.isawaitable(result):
+        await result
+    get_logger().debug("Closed asynchronous MongoDB client")
+
+
+class _CountCache:
+    """A thread-safe LRU cache of document counts that expire after a fixed time.
+
+    Attributes:
+        ttl: The number of seconds after which a cached count expires.
+            The cache is disabled if this is 0.
+        maxsize: The maximum number of counts to cache.
+
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._counts: OrderedDict[str | None, tuple[float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str | None) -> int | None:
+        """Return the cached count for `key`, or `None` if it is missing or expired."""
+        with self._lock:
+            cached = self._counts.get(key)
+            if cached is None:
+                return None
+            expires, count = cached
+            if expires < time.monotonic():
+                del self._counts[key]
+                return None
+            self._counts.move_to_end(key)
+            return count
+
+    def set(self, key: str | None, count: int) -> None:
+        """Cache the count for `key`, evicting the least recently used counts if needed."""
+        if not self.ttl or not self.maxsize:
+            return
+        with self._lock:
+            self._counts[key] = (time.monotonic() + self.ttl, count)
+            self._counts.move_to_end(key)
+            while len(self._counts) > self.maxsize:
+                self._counts.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached counts."""
+        with self._lock:
+            self._counts.clear()
+
+
 class MongoCollection(EntryCollection):
     """Class for querying MongoDB collections (implemented by either pymongo or mongomock)
     containing serialized [`EntryResource`][optimade.models.entries.EntryResource]s objects.
@@ -92,19 +196,51 @@ class MongoCollection(EntryCollection):
         client = get_mongo_client(config)
 
         self.collection = client[database][name]
+        # Set by the app while it runs, see `set_async_client()`
+        self.async_collection: Any = None
+
+        self.pagination_mechanism = PaginationMechanism(config.pagination_mechanism)
+        self._indexed_fields: set[str] | None = None
+        self._count_cache = _CountCache(
+            ttl=config.mongo_count_cache_ttl, maxsize=config.mongo_count_cache_size
+        )
 
         # check aliases do not clash with mongo operators
         self._check_aliases(self.resource_mapper.all_aliases)
         self._check_aliases(self.resource_mapper.all_length_aliases)
 
+    def set_async_client(self, async_client: Any) -> None:
+        """Query the collection with the given asynchronous MongoDB client, created by
+        [`create_async_mongo_client()`][optimade.server.entry_collections.mongo.create_async_mongo_client]
+        on the event loop that runs the app.
+
+        If `None`, asynchronous queries are run in a worker thread with the synchronous client.
+
+        """
+        self.async_collection = (
+            async_client[self.config.mongo_database][self.collection.name]
+            if async_client is not None
+            else None
+        )
+
     def __len__(self) -> int:
-        """Returns the total number of entries in the collection."""
-        return self.collection.estimated_document_count()
+        """Returns the total number of entries in the collection.
+
+        The number is cached for `mongo_count_cache_ttl` seconds, if configured.
+
+        """
+        data_available = self._count_cache.get(None)
+        if data_available is None:
+            data_available = self.collection.estimated_document_count()
+            self._count_cache.set(None, data_available)
+        return data_available
 
     def count(self, **kwargs: Any) -> int | None:
         """Returns the number of entries matching the query specified
         by the keyword arguments, or `None` if the count timed out.
 
+        Counts are cached for `mongo_count_cache_ttl` seconds, if configured.
+
         Parameters:
             **kwargs: Query parameters as keyword arguments. The keys
                 'filter', 'skip', 'limit', 'hint' and 'maxTimeMS' will be passed
@@ -115,14 +251,84 @@ class MongoCollection(EntryCollection):
             if k not in ("filter", "skip", "limit", "hint", "maxTimeMS"):
                 del kwargs[k]
         if "filter" not in kwargs:
-            return self.collection.estimated_document_count()
-        else:
-            if "maxTimeMS" not in kwargs:
-                kwargs["maxTimeMS"] = int(1000 * self.config.mongo_count_timeout)
-            try:
-                return self.collection.count_documents(**kwargs)
-            except ExecutionTimeout:
-                return None
+            return len(self)
+
+        cache_key = self._count_cache_key(kwargs)
+        cached_count = self._count_cache.get(cache_key)
+        if cached_count is not None:
+            return cached_count
+
+        if "maxTimeMS" not in kwargs:
+            kwargs["maxTimeMS"] = int(1000 * self.config.mongo_count_timeout)
+        try:
+            with timed("count"):
+                cached_count = self.collection.count_documents(**kwargs)
+        except ExecutionTimeout:
+            count("count_timeouts")
+            return None
+        self._count_cache.set(cache_key, cached_count)
+        return cached_count
+
+    async def len_async(self) -> int:
+        """Returns the total number of entries in the collection, without blocking
+        the event loop.
+
+        The number is cached for `mongo_count_cache_ttl` seconds, if configured.
+
+        """
+        if self.async_collection is None:
+            return await super().len_async()
+        data_available = self._count_cache.get(None)
+        if data_available is None:
+            data_available = await self.async_collection.estimated_document_count()
+            self._count_cache.set(None, data_available)
+        return data_available
+
+    async def count_async(self, **kwargs: Any) -> int | None:
+        """Asynchronous version of
+        [`count()`][optimade.server.entry_collections.mongo.MongoCollection.count].
+
+        Parameters:
+            **kwargs: Query parameters as keyword arguments. The keys
+                'filter', 'skip', 'limit', 'hint' and 'maxTimeMS' will be passed
+                to the `count_documents` method of the asynchronous client.
+
+        """
+        if self.async_collection is None:
+            return await super().count_async(**kwargs)
+        for k in list(kwargs.keys()):
+            if k not in ("filter", "skip", "limit", "hint", "maxTimeMS"):
+                del kwargs[k]
+        if "filter" not in kwargs:
+            return await self.len_async()
+
+        cache_key = self._count_cache_key(kwargs)
+        cached_count = self._count_cache.get(cache_key)
+        if cached_count is not None:
+            return cached_count
+
+        if "maxTimeMS" not in kwargs:
+            kwargs["maxTimeMS"] = int(1000 * self.config.mongo_count_timeout)
+        try:
+            with timed("count"):
+                cached_count = await self.async_collection.count_documents(**kwargs)
+        except ExecutionTimeout:
+            count("count_timeouts")
+            return None
+        self._count_cache.set(cache_key, cached_count)
+        return cached_count
+
+    @staticmethod
+    def _count_cache_key(kwargs: dict[str, Any]) -> str:
+        """Normalize the count query parameters into a key for the count cache."""
+        return json_util.dumps(
+            {
+                k: v
+                for k, v in kwargs.items()
+                if k in ("filter", "skip", "limit", "hint")
+            },
+            sort_keys=True,
+        )
 
     def insert(self, data: list[EntryResource | dict]) -> None:
         """Add the given entries to the underlying database.
@@ -137,8 +343,11 @@ class MongoCollection(EntryCollection):
 
         """
         self.collection.insert_many(data, ordered=False)
+        self._count_cache.clear()
 
-    def create_index(self, field: str, unique: bool = False) -> None:
+    def create_index(
+        self, field: str | list[tuple[str, int]], unique: bool = False
+    ) -> None:
         """Create an index on the given field, as stored in the database.
 
         If any error is raised during index creation, this method should faithfully
@@ -146,11 +355,13 @@ class MongoCollection(EntryCollection):
 
         Arguments:
             field: The database field to index (i.e., if different from the OPTIMADE field,
-                the mapper should be used to convert between the two).
+                the mapper should be used to convert between the two), or, for a compound
+                index, a list of database fields and their sort directions.
             unique: Whether or not the index should be unique.
 
         """
         self.collection.create_index(field, unique=unique, background=True)
+        self._indexed_fields = None
 
     def create_default_index(self) -> None:
         """Create the default index for the collection.
@@ -162,6 +373,97 @@ class MongoCollection(EntryCollection):
         """
         self.create_index(self.resource_mapper.get_backend_field("id"), unique=True)
 
+    def get_recommended_indexes(self) -> list[list[tuple[str, int]]]:
+        """Return the indexes recommended for serving typical OPTIMADE queries,
+        as lists of database fields and their sort directions.
+
+        The recommendations are:
+
+        - A single-field index on each property that MUST be queryable according to
+          the specification (e.g., `elements`, `nelements`, `chemical_formula_reduced`,
+          `nsites` and `last_modified` for structures), or that is described as such in
+          the `provider_fields` config option. List fields, such as `elements`, are
+          indexed with multikey indexes by MongoDB.
+        - For each field of the `mongo_index_sort_fields` config option, compound
+          indexes of the field with `id` in both sort directions, matching the sort used
+          for (`page_above`) pagination, and replacing its single-field index.
+
+        The constant `type` field and `id`, which has the default index
+        (see [`create_default_index()`][optimade.server.entry_collections.mongo.MongoCollection.create_default_index]),
+        are not included. Fields are converted to their (aliased) database names.
+
+        """
+        from optimade.models.utils import SupportLevel
+        from optimade.server.schemas import retrieve_queryable_properties
+
+        properties = retrieve_queryable_properties(
+            self.resource_cls,
+            ("id", "type", "attributes"),
+            entry_type=self.resource_mapper.ENDPOINT,
+            config=self.config,
+        )
+        fields = [
+            field
+            for field, info in properties.items()
+            if info.get("queryable") in (SupportLevel.MUST, SupportLevel.MUST.value)
+            and field not in ("id", "type")
+        ]
+
+        id_field = self.resource_mapper.get_backend_field("id")
+        indexes: list[list[tuple[str, int]]] = []
+        for field in fields:
+            backend_field = self.resource_mapper.get_backend_field(field)
+            if field in self.config.mongo_index_sort_fields:
+                indexes.append([(backend_field, 1), (id_field, 1)])
+                indexes.append([(backend_field, -1), (id_field, 1)])
+            else:
+                indexes.append([(backend_field, 1)])
+        return indexes
+
+    def create_recommended_indexes(self) -> list[list[tuple[str, int]]]:
+        """Create the indexes recommended by
+        [`get_recommended_indexes()`][optimade.server.entry_collections.mongo.MongoCollection.get_recommended_indexes]
+        that do not exist yet.
+
+        Returns:
+            The indexes that were created.
+
+        """
+        existing = [
+            list(index["key"]) for index in self.collection.index_information().values()
+        ]
+        created = []
+        for index in self.get_recommended_indexes():
+            if index not in existing:
+                self.create_index(index)
+                created.append(index)
+        return created
+
+    def get_unindexed_fields(self, filter_: str) -> set[str]:
+        """Return the database fields used in an OPTIMADE filter that do not lead any
+        index of the collection, i.e., that would require a collection scan.
+
+        Parameters:
+            filter_: The OPTIMADE filter string.
+
+        """
+        fields: set[str] = set()
+        self._collect_query_fields(self.transform_filter(filter_), fields)
+        return fields - self.indexed_fields
+
+    @classmethod
+    def _collect_query_fields(cls, query: Any, fields: set[str]) -> None:
+        """Collect the fields queried in a MongoDB query into `fields`."""
+        if isinstance(query, list):
+            for subquery in query:
+                cls._collect_query_fields(subquery, fields)
+        elif isinstance(query, dict):
+            for key, value in query.items():
+                if key in ("$and", "$or", "$nor", "$not"):
+                    cls._collect_query_fields(value, fields)
+                elif not key.startswith("$"):
+                    fields.add(key)
+
     def handle_query_params(
         self, params: EntryListingQueryParams | SingleEntryQueryParams
     ) -> dict[str, Any]:
@@ -169,7 +471,8 @@ class MongoCollection(EntryCollection):
         that can be used by MongoDB.
 
         This Mongo-specific method calls the base `EntryCollection.handle_query_params` method
-        and adds additional handling of the MongoDB ObjectID type.
+        and adds additional handling of the MongoDB ObjectID type and of value-based
+        (`page_above`) pagination.
 
         Parameters:
             params: The initialized query parameter model from the server.
@@ -177,7 +480,8 @@ class MongoCollection(EntryCollection):
         Raises:
             Forbidden: If too large of a page limit is provided.
             BadRequest: If an invalid request is made, e.g., with incorrect fields
-                or response format.
+                or response format, or a `page_above` value that cannot be used
+                with the requested sort.
 
         Returns:
             A dictionary representation of the query parameters.
@@ -190,16 +494,171 @@ class MongoCollection(EntryCollection):
         if "_id" not in criteria.get("projection", {}):
             criteria["projection"]["_id"] = False
 
-        if "page_above" in criteria:
-            raise NotImplementedError(
-                "`page_above` is not implemented for this backend."
-            )
-
         if criteria.get("projection", {}).get("_id"):
             criteria["projection"]["_id"] = {"$toString": "$_id"}
 
+        # Handle value-based pagination:
+        # - If `page_above` was passed, replace it with the corresponding keyset filter
+        # - If it is the default pagination mechanism, make sure the first page is
+        #   sorted consistently with the following pages
+        page_above = criteria.pop("page_above", None)
+        if page_above is not None:
+            keyset_sort = self._get_keyset_sort(criteria.get("sort"))
+            if keyset_sort is None:
+                raise BadRequest(
+                    detail="`page_above` can only be used when sorting on `id` or on indexed fields."
+                )
+            criteria["sort"] = keyset_sort
+            criteria["page_above"] = self._get_keyset_filter(page_above, keyset_sort)
+
+        elif (
+            isinstance(params, EntryListingQueryParams)
+            and self.pagination_mechanism == PaginationMechanism.ABOVE
+            and not criteria.get("skip")
+        ):
+            keyset_sort = self._get_keyset_sort(criteria.get("sort"))
+            if keyset_sort is not None:
+                criteria["sort"] = keyset_sort
+
+        # Sort fields are needed to generate the `page_above` value for the next page;
+        # they are removed from the response if not requested
+        for field, _ in criteria.get("sort") or []:
+            criteria["projection"].setdefault(field, True)
+
         return criteria
 
+    def _get_ids_filter(self, ids: list[str]) -> dict[str, Any]:
+        """Return the MongoDB query matching all entries with the given IDs."""
+        return {self.resource_mapper.get_backend_field("id"): {"$in": ids}}
+
+    @property
+    def indexed_fields(self) -> set[str]:
+        """The database fields that lead an index of the collection, and can
+        therefore be used for keyset pagination.
+
+        The set is lazily retrieved from the database and reset whenever an index
+        is created through [`create_index()`][optimade.server.entry_collections.mongo.MongoCollection.create_index].
+
+        """
+        if self._indexed_fields is None:
+            self._indexed_fields = {
+                index["key"][0][0]
+                for index in self.collection.index_information().values()
+            }
+        return self._indexed_fields
+
+    def _get_keyset_sort(
+        self, sort: list[tuple[str, int]] | None
+    ) -> list[tuple[str, int]] | None:
+        """Return the total ordering used for keyset pagination for the requested sort,
+        i.e., the requested sort with the (unique) `id` field appended as a tie-breaker.
+
+        Returns:
+            The sort specification to use, or `None` if any of the requested sort
+            fields is not indexed (in which case keyset pagination is not possible).
+
+        """
+        id_field = self.resource_mapper.get_backend_field("id")
+        keyset_sort: list[tuple[str, int]] = []
+        for field, sort_dir in sort or []:
+            keyset_sort.append((field, sort_dir))
+            if field == id_field:
+                # `id` is unique, so any further sort fields are redundant
+                return keyset_sort
+            if field not in self.indexed_fields:
+                return None
+        keyset_sort.append((id_field, 1))
+        return keyset_sort
+
+    def _get_keyset_filter(
+        self, page_above: str, keyset_sort: list[tuple[str, int]]
+    ) -> dict[str, Any]:
+        """Construct the filter selecting all documents strictly after the `page_above`
+        value in the given keyset ordering.
+
+        When sorting on `id` only, `page_above` is the `id` of the last document
+        of the previous page. Otherwise, it is a JSON (MongoDB extended JSON) array
+        of the values of each of the sort fields for that document, as generated by
+        [`get_page_above_value()`][optimade.server.entry_collections.mongo.MongoCollection.get_page_above_value].
+
+        Raises:
+            BadRequest: If the `page_above` value cannot be interpreted for this sort.
+
+        """
+        values: list[Any]
+        if len(keyset_sort) == 1:
+            values = [page_above]
+        else:
+            try:
+                loaded = json_util.loads(page_above)
+            except Exception:
+                # The extended JSON decoders raise many different exceptions
+                loaded = None
+            if (
+                not isinstance(loaded, list)
+                or len(loaded) != len(keyset_sort)
+                # Sub-documents could inject query operators into the filter
+                or not all(isinstance(value, _KEYSET_VALUE_TYPES) for value in loaded)
+            ):
+                raise BadRequest(
+                    detail=f"Unable to interpret `page_above={page_above}` for the requested sort."
+                )
+            values = loaded
+
+        # Lexicographic comparison over the sort fields, taking into account that
+        # MongoDB sorts null/missing values before any other value
+        clauses = []
+        for ind, ((field, sort_dir), value) in enumerate(zip(keyset_sort, values)):
+            after: dict[str, Any]
+            if sort_dir == 1:
+                after = (
+                    {field: {"$ne": None}} if value is None else {field: {"$gt": value}}
+                )
+            elif value is not None:
+                after = {"$or": [{field: {"$lt": value}}, {field: None}]}
+            else:
+                continue
+            equal = [
+                {prev_field: prev_value}
+                for (prev_field, _), prev_value in zip(keyset_sort[:ind], values)
+            ]
+            clauses.append({"$and": equal + [after]} if equal else after)
+
+        return {"$or": clauses} if len(clauses) > 1 else clauses[0]
+
+    def get_page_above_value(
+        self, params: EntryListingQueryParams, last_result: dict[str, Any]
+    ) -> str | None:
+        """Provides the `page_above` value for the next page of results.
+
+        When sorting on `id` only, this is the `id` of the last result. When sorting
+        on other indexed fields, this is a JSON array of the values of all sort fields
+        (with `id` as tie-breaker) of the last result.
+
+        Arguments:
+            params: The parsed request params produced by handle_query_params.
+            last_result: The last (mapped) result of the current page.
+
+        Returns:
+            The `page_above` value, or `None` if any of the sort fields is not indexed.
+
+        """
+        sort = list(self.parse_sort_params(params.sort)) if params.sort else None
+        keyset_sort = self._get_keyset_sort(sort)
+        if keyset_sort is None:
+            return None
+        if len(keyset_sort) == 1:
+            return str(last_result["id"])
+
+        values = []
+        for field, _ in keyset_sort:
+            optimade_field = self.resource_mapper.get_optimade_field(field)
+            if optimade_field in self.resource_mapper.TOP_LEVEL_NON_ATTRIBUTES_FIELDS:
+                values.append(last_result.get(optimade_field))
+            else:
+                values.append(last_result.get("attributes", {}).get(optimade_field))
+        return json_util.dumps(values, separators=(",", ":"))
+
     def _run_db_query(
         self, criteria: dict[str, Any], single_entry: bool = False
     ) -> tuple[list[dict[str, Any]], int | None, bool]:
@@ -214,7 +673,139 @@ class MongoCollection(EntryCollection):
             entries matching the query and a boolean for whether or not there is more data available.
 
         """
-        results = list(self.collection.find(**criteria))
+        find_criteria, fetch_extra = self._get_find_criteria(criteria, single_entry)
+        with timed("find"):
+            documents = list(self.collection.find(**find_criteria))
+        results, more_data_after_page = self._handle_found_documents(
+            documents, criteria, fetch_extra
+        )
+        if single_entry:
+            # SingleEntryQueryParams, e.g., /structures/{entry_id}
+            return results, len(results), False
+
+        data_returned, count_criteria = self._get_data_returned(
+            criteria, len(results), more_data_after_page
+        )
+        if count_criteria is not None:
+            data_returned = self.count(**count_criteria)
+
+        return (
+            results,
+            data_returned,
+            self._get_more_data_available(
+                criteria, len(results), data_returned, fetch_extra, more_data_after_page
+            ),
+        )
+
+    async def _run_db_query_async(
+        self, criteria: dict[str, Any], single_entry: bool = False
+    ) -> tuple[list[dict[str, Any]], int | None, bool]:
+        """Run the query on the backend with the asynchronous client and collect the results.
+
+        Arguments:
+            criteria: A dictionary representation of the query parameters.
+            single_entry: Whether or not the caller is expecting a single entry response.
+
+        Returns:
+            The list of entries from the database (without any re-mapping), the total number of
+            entries matching the query and a boolean for whether or not there is more data available.
+
+        """
+        if self.async_collection is None:
+            return await super()._run_db_query_async(criteria, single_entry)
+
+        find_criteria, fetch_extra = self._get_find_criteria(criteria, single_entry)
+        with timed("find"):
+            documents = await self.async_collection.find(**find_criteria).to_list(None)
+        results, more_data_after_page = self._handle_found_documents(
+            documents, criteria, fetch_extra
+        )
+        if single_entry:
+            # SingleEntryQueryParams, e.g., /structures/{entry_id}
+            return results, len(results), False
+
+        data_returned, count_criteria = self._get_data_returned(
+            criteria, len(results), more_data_after_page
+        )
+        if count_criteria is not None:
+            data_returned = await self.count_async(**count_criteria)
+
+        return (
+            results,
+            data_returned,
+            self._get_more_data_available(
+                criteria, len(results), data_returned, fetch_extra, more_data_after_page
+            ),
+        )
+
+    def explain(self, criteria: dict[str, Any]) -> Any:
+        """Return MongoDB's `explain` output for the `find` query of the given criteria.
+
+        Only the `queryPlanner` verbosity is requested, which does not run the query,
+        unlike the default of `Cursor.explain()`.
+
+        Arguments:
+            criteria: A dictionary representation of the query parameters.
+
+        """
+        find_criteria, _ = self._get_find_criteria(criteria, single_entry=False)
+        find_command: dict[str, Any] = {"find": self.collection.name}
+        for key in ("filter", "projection", "sort", "skip", "limit", "hint"):
+            if find_criteria.get(key):
+                find_command[key] = find_criteria[key]
+        if "sort" in find_command:
+            find_command["sort"] = dict(find_command["sort"])
+        return self.collection.database.command(
+            "explain", find_command, verbosity="queryPlanner"
+        )
+
+    def _get_find_criteria(
+        self, criteria: dict[str, Any], single_entry: bool
+    ) -> tuple[dict[str, Any], bool]:
+        """Construct the keyword arguments for `find` from the query criteria.
+
+        Returns:
+            The keyword arguments, and whether one extra document is requested
+            to determine whether more data is available.
+
+        """
+        find_criteria = criteria.copy()
+        keyset_filter = find_criteria.pop("page_above", None)
+        if keyset_filter is not None:
+            find_criteria["filter"] = (
+                {"$and": [criteria["filter"], keyset_filter]}
+                if criteria.get("filter")
+                else keyset_filter
+            )
+
+        # Request one extra document to know whether there is more data available,
+        # when the number of documents before this page is unknown (keyset pagination),
+        # or the matching documents should not be counted
+        limit = criteria.get("limit", 0)
+        fetch_extra = bool(limit) and (
+            keyset_filter is not None
+            or (self.config.mongo_skip_count and not single_entry)
+        )
+        if fetch_extra:
+            find_criteria["limit"] = limit + 1
+
+        return find_criteria, fetch_extra
+
+    def _handle_found_documents(
+        self, results: list[dict[str, Any]], criteria: dict[str, Any], fetch_extra: bool
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Remove any extra requested document from the results and cast MongoDB
+        ObjectIDs to strings where needed.
+
+        Returns:
+            The results, and whether there are more documents after this page
+            (only known if `fetch_extra` is `True`).
+
+        """
+        more_data_after_page = False
+        if fetch_extra and len(results) > criteria["limit"]:
+            results = results[: criteria["limit"]]
+            more_data_after_page = True
 
         if self.config.database_backend == SupportedBackend.MONGOMOCK and criteria.get(
             "projection", {}
@@ -223,27 +814,63 @@ class MongoCollection(EntryCollection):
             for ind, doc in enumerate(results):
                 results[ind]["_id"] = str(doc["_id"])
 
-        nresults_now = len(results)
-        if not single_entry:
-            criteria_nolimit = criteria.copy()
-            criteria_nolimit.pop("limit", None)
-            skip = criteria_nolimit.pop("skip", 0)
-            # If we're on the first page, set a much higher timeout for counting the results (10 s)
-            if skip == 0:
-                criteria_nolimit["maxTimeMS"] = 1000 * 10
-            data_returned = self.count(**criteria_nolimit)
-            # Only correct most of the time: if the total number of remaining results is exactly the page limit
-            # then this will incorrectly say there is more_data_available
-            if data_returned is None:
-                more_data_available = nresults_now == criteria.get("limit", 0)
-            else:
-                more_data_available = nresults_now + skip < data_returned
-        else:
-            # SingleEntryQueryParams, e.g., /structures/{entry_id}
-            data_returned = nresults_now
-            more_data_available = False
+        return results, more_data_after_page
+
+    def _get_data_returned(
+        self, criteria: dict[str, Any], nresults_now: int, more_data_after_page: bool
+    ) -> tuple[int | None, dict[str, Any] | None]:
+        """Determine `data_returned` without querying the database, if possible.
 
-        return results, data_returned, more_data_available
+        Returns:
+            `data_returned` (if known), or the keyword arguments with which to count it.
+
+        """
+        count_criteria = criteria.copy()
+        count_criteria.pop("limit", None)
+        count_criteria.pop("page_above", None)
+        skip = count_criteria.pop("skip", 0)
+
+        # Without a filter, all entries of the collection match; they are still counted
+        # exactly, as the estimated size of the collection may be off
+        count_criteria["filter"] = count_criteria.get("filter") or {}
+
+        if self.config.mongo_skip_count:
+            # Only use an already cached count, unless it follows from this page.
+            # An empty page beyond the first one may lie past the end of the results,
+            # in which case the count cannot be derived from its offset.
+            cache_key = self._count_cache_key(count_criteria)
+            data_returned = self._count_cache.get(cache_key)
+            if (
+                data_returned is None
+                and not more_data_after_page
+                and "page_above" not in criteria
+                and (nresults_now > 0 or skip == 0)
+            ):
+                data_returned = skip + nresults_now
+                self._count_cache.set(cache_key, data_returned)
+            return data_returned, None
+
+        # If we're on the first page, set a much higher timeout for counting the results (10 s)
+        if skip == 0 and "page_above" not in criteria:
+            count_criteria["maxTimeMS"] = 1000 * 10
+        return None, count_criteria
+
+    @staticmethod
+    def _get_more_data_available(
+        criteria: dict[str, Any],
+        nresults_now: int,
+        data_returned: int | None,
+        fetch_extra: bool,
+        more_data_after_page: bool,
+    ) -> bool:
+        """Determine whether there is more data available after this page."""
+        if fetch_extra:
+            return more_data_after_page
+        # Only correct most of the time: if the total number of remaining results is exactly the page limit
+        # then this will incorrectly say there is more_data_available
+        if data_returned is None:
+            return nresults_now == criteria.get("limit", 0)
+        return nresults_now + criteria.get("skip", 0) < data_returned
 
     def _check_aliases(self, aliases):
         """Check that aliases do not clash with mongo keywords."""
@@ -0,0 +1,146 @@
+"""This module implements the `optimade-index` command-line tool, which reports and
+creates the MongoDB indexes recommended for serving typical OPTIMADE queries, and
+reports the filters of a query log that would not be served by any index.
+
+"""
+
+import re
+import urllib.parse
+from collections.abc import Iterable
+from pathlib import Path
+
+__all__ = ("index", "read_query_log")
+
+_QUERY_LOG_REQUEST = re.compile(
+    r"/(?P<entry_type>links|references|structures|files)\?(?P<query>[^\s\"']+)"
+)
+
+
+def read_query_log(lines: Iterable[str]) -> Iterable[tuple[str, str]]:
+    """Extract the entry type and filter of every entry listing request in a query log,
+    e.g., an access log of the server.
+
+    Parameters:
+        lines: The lines of the log, in which requests appear as URLs or paths such as
+            `/v1/structures?filter=nelements=2`.
+
+    Yields:
+        The entry type and the (URL-decoded) filter of each request with a filter.
+
+    """
+    for line in lines:
+        for match in _QUERY_LOG_REQUEST.finditer(line):
+            query = urllib.parse.parse_qs(match.group("query"))
+            for filter_ in query.get("filter", []):
+                yield match.group("entry_type"), filter_
+
+
+def index(argv: list[str] | None = None) -> int:
+    """Run the `optimade-index` command-line tool.
+
+    Parameters:
+        argv: The command-line arguments, defaults to `sys.argv[1:]`.
+
+    Returns:
+        The exit code.
+
+    """
+    import argparse
+    import os
+    from collections import Counter
+
+    parser = argparse.ArgumentParser(
+        prog="optimade-index",
+        description="""Report and create the recommended indexes of the MongoDB collections of the configured server backend.
+
+    The database backend and collection names are read from the server configuration,
+    as for `optimade.server.main`.
+
+    - To list the recommended indexes that do not exist yet:
+
+        $ optimade-index
+
+    - To create them:
+
+        $ optimade-index --create
+
+    - To report the filters of an access log that would not be served by an index:
+
+        $ optimade-index --query-log access.log
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        help=(
+            "The path to the server configuration file to use, otherwise the one given "
+            "by the `OPTIMADE_CONFIG_FILE` environment variable or the default is used."
+        ),
+    )
+    parser.add_argument(
+        "--create",
+        action="store_true",
+        help="Create the recommended indexes that do not exist yet.",
+    )
+    parser.add_argument(
+        "--query-log",
+        type=Path,
+        help=(
+            "The path to a log of requests, e.g., a server access log, whose filters "
+            "are checked for fields that do not lead any index."
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    if args.config is not None:
+        os.environ["OPTIMADE_CONFIG_FILE"] = str(args.config)
+
+    from optimade.server.config import ServerConfig
+    from optimade.server.entry_collections import create_entry_collections
+    from optimade.server.logger import create_logger
+
+    config = ServerConfig()
+    logger = create_logger(config=config)
+
+    if config.database_backend.value not in ("mongodb", "mongomock"):
+        logger.error("Index recommendations are only implemented for MongoDB.")
+        return 1
+
+    if args.query_log is not None and not args.query_log.is_file():
+        logger.error("Requested query log does not exist: %s", args.query_log)
+        return 1
+
+    entry_collections = create_entry_collections(config)
+
+    for entry_type, collection in entry_collections.items():
+        if args.create:
+            for keys in collection.create_recommended_indexes():
+                logger.info("Created index on %s: %s", entry_type, keys)
+        else:
+            existing = [
+                list(info["key"])
+                for info in collection.collection.index_information().values()
+            ]
+            for keys in collection.get_recommended_indexes():
+                if keys not in existing:
+                    print(f"{entry_type}: {keys}")
+
+    if args.query_log is None:
+        return 0
+
+    unindexed: Counter[tuple[str, str, tuple[str, ...]]] = Counter()
+    with open(args.query_log, encoding="utf-8", errors="replace") as handle:
+        for entry_type, filter_ in read_query_log(handle):
+            try:
+                fields = entry_collections[entry_type].get_unindexed_fields(filter_)
+            except Exception as exc:
+                logger.warning("Could not check filter %r: %r", filter_, exc)
+                continue
+            if fields:
+                unindexed[(entry_type, filter_, tuple(sorted(fields)))] += 1
+
+    for (entry_type, filter_, fields), count in unindexed.most_common():
+        print(f"{count}\t{entry_type}\t{', '.join(fields)}\t{filter_}")
+
+    return 0
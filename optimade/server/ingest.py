@@ -0,0 +1,169 @@
+"""This module implements the `optimade-ingest` command-line tool, which loads an
+OPTIMADE JSONL file into the database of the configured server backend.
+
+Loading the data once with this tool, rather than with the `insert_from_jsonl`
+server configuration option, means that (multiple) server workers can start
+immediately against an already populated database.
+
+"""
+
+from pathlib import Path
+
+__all__ = ("ingest",)
+
+
+def ingest(argv: list[str] | None = None) -> int:
+    """Run the `optimade-ingest` command-line tool.
+
+    Parameters:
+        argv: The command-line arguments, defaults to `sys.argv[1:]`.
+
+    Returns:
+        The exit code.
+
+    """
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(
+        prog="optimade-ingest",
+        description="""Load an OPTIMADE JSONL file into the database of the configured server backend.
+
+    The database backend and collection names are read from the server configuration,
+    as for `optimade.server.main`.
+
+    - To load a file with the default server configuration:
+
+        $ optimade-ingest data.jsonl
+
+    - To load a file with a given server configuration, parsing with 4 processes:
+
+        $ optimade-ingest data.jsonl --config optimade_config.json --processes 4
+
+    - To load a file such that a failed load can be resumed by running the same command again:
+
+        $ optimade-ingest data.jsonl --checkpoint data.checkpoint.json
+
+    - To validate the entries while loading them, reporting the invalid ones:
+
+        $ optimade-ingest data.jsonl --validate --validation-report invalid.jsonl
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "jsonl_path", type=Path, help="The path to the OPTIMADE JSONL file to load."
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        help=(
+            "The path to the server configuration file to use, otherwise the one given "
+            "by the `OPTIMADE_CONFIG_FILE` environment variable or the default is used."
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="The number of lines that are parsed and inserted together.",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="The number of processes used to parse the file (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--writers",
+        type=int,
+        help="The number of batches that are inserted concurrently.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        help=(
+            "The path to a checkpoint file recording the progress of the load. "
+            "If it exists, a previous failed load is resumed from it."
+        ),
+    )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Do not create the default indices before inserting the data.",
+    )
+    parser.add_argument(
+        "--append",
+        action="store_true",
+        help="Insert the data even if the collections already contain data.",
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help=(
+            "Validate the entries while loading them, and stamp the valid ones such that "
+            "the server can skip validating them (see `trust_validation_stamp`)."
+        ),
+    )
+    parser.add_argument(
+        "--validation-report",
+        type=Path,
+        help=(
+            "The path to a JSON lines file to which the entries that fail validation "
+            "are reported (implies --validate)."
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    if args.config is not None:
+        os.environ["OPTIMADE_CONFIG_FILE"] = str(args.config)
+
+    from optimade.server.config import ServerConfig
+    from optimade.server.entry_collections import create_entry_collections
+    from optimade.server.logger import create_logger
+    from optimade.utils import insert_from_jsonl
+
+    config = ServerConfig()
+    logger = create_logger(config=config)
+
+    if config.database_backend.value == "mongomock":
+        logger.warning(
+            "The mongomock backend only exists in memory, the data will not be "
+            "available to the server."
+        )
+
+    if not args.jsonl_path.is_file():
+        logger.error("Requested JSONL file does not exist: %s", args.jsonl_path)
+        return 1
+
+    entry_collections = create_entry_collections(config)
+    populated = sorted(
+        entry_type
+        for entry_type, collection in entry_collections.items()
+        if len(collection) > 0
+    )
+    resume = args.checkpoint is not None and args.checkpoint.exists()
+    if populated and not (args.append or resume):
+        logger.error(
+            "The %s collection(s) already contain data, use --append to insert anyway.",
+            ", ".join(populated),
+        )
+        return 1
+
+    try:
+        insert_from_jsonl(
+            args.jsonl_path,
+            entry_collections,
+            create_default_index=not args.no_index,
+            batch_size=args.batch_size or config.insert_from_jsonl_batch_size,
+            processes=args.processes,
+            writers=args.writers or config.insert_from_jsonl_writers,
+            checkpoint_path=args.checkpoint,
+            validate=args.validate or args.validation_report is not None,
+            validation_report_path=args.validation_report,
+        )
+    except Exception as exc:
+        logger.error("Could not load %s: %r", args.jsonl_path, exc)
+        if args.checkpoint is not None:
+            logger.error("The load can be resumed from %s", args.checkpoint)
+        return 1
+
+    return 0
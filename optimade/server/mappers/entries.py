@@ -97,6 +97,30 @@ class BaseResourceMapper:
             self.config.length_aliases.get(self.ENDPOINT, {}).items()
         )
 
+    @cached_property
+    def _backend_fields(self) -> dict[str, str]:
+        """Lookup table from OPTIMADE field to backend field."""
+        return dict(self.all_aliases)
+
+    @cached_property
+    def _optimade_fields(self) -> dict[str, str]:
+        """Lookup table from backend field to OPTIMADE field."""
+        return {alias: real for real, alias in self.all_aliases}
+
+    @cached_property
+    def _length_aliases(self) -> dict[str, str]:
+        """Lookup table from a field to the field holding its length."""
+        return dict(self.all_length_aliases)
+
+    @cached_property
+    def _map_back_plan(self) -> tuple[frozenset[str], tuple[tuple[str, str], ...]]:
+        """The set of aliased backend fields, and the `(backend, OPTIMADE)` field
+        pairs to rename, as used by `map_back()` for every document."""
+        return (
+            frozenset(real for _, real in self.all_aliases),
+            tuple((real, alias) for alias, real in self.all_aliases),
+        )
+
     @cached_property
     def ENTRY_RESOURCE_ATTRIBUTES_MAP(self) -> dict[str, Any]:
         from optimade.server.schemas import retrieve_queryable_properties
@@ -123,19 +147,17 @@ class BaseResourceMapper:
 
     # ---- Instance methods that use the cached properties ----
     def length_alias_for(self, field: str) -> str | None:
-        return dict(self.all_length_aliases).get(field)
+        return self._length_aliases.get(field)
 
     def get_backend_field(self, optimade_field: str) -> str:
-        split = optimade_field.split(".")
-        alias = dict(self.all_aliases).get(split[0])
+        field, dot, nested = optimade_field.partition(".")
+        alias = self._backend_fields.get(field)
         if alias is not None:
-            return alias + ("." + ".".join(split[1:]) if len(split) > 1 else "")
+            return alias + dot + nested
         return optimade_field
 
     def get_optimade_field(self, backend_field: str) -> str:
-        return {alias: real for real, alias in self.all_aliases}.get(
-            backend_field, backend_field
-        )
+        return self._optimade_fields.get(backend_field, backend_field)
 
     def alias_for(self, field: str) -> str:
         warnings.warn(
@@ -155,28 +177,26 @@ class BaseResourceMapper:
         return self.TOP_LEVEL_NON_ATTRIBUTES_FIELDS
 
     def map_back(self, doc: dict) -> dict:
-        mapping = ((real, alias) for alias, real in self.all_aliases)
-        newdoc = {}
-        reals = {real for _, real in self.all_aliases}
-
-        for key in doc:
-            if key not in reals:
-                newdoc[key] = doc[key]
+        reals, mapping = self._map_back_plan
+        top_level_fields = self.TOP_LEVEL_NON_ATTRIBUTES_FIELDS
+
+        newdoc: dict[str, Any] = {}
+        attributes: dict[str, Any] = {}
+        for field, value in doc.items():
+            if field not in reals:
+                if field in top_level_fields:
+                    newdoc[field] = value
+                else:
+                    attributes[field] = value
         for real, alias in mapping:
             if real in doc:
-                newdoc[alias] = doc[real]
+                if alias in top_level_fields:
+                    newdoc[alias] = doc[real]
+                else:
+                    attributes[alias] = doc[real]
 
-        if "attributes" in newdoc:
+        if "attributes" in attributes:
             raise Exception("Will overwrite doc field!")
-        attributes = newdoc.copy()
-
-        for field in self.TOP_LEVEL_NON_ATTRIBUTES_FIELDS:
-            value = attributes.pop(field, None)
-            if value is not None:
-                newdoc[field] = value
-        for field in list(newdoc.keys()):
-            if field not in self.TOP_LEVEL_NON_ATTRIBUTES_FIELDS:
-                del newdoc[field]
 
         newdoc["type"] = self.ENDPOINT
         newdoc["attributes"] = attributes
@@ -0,0 +1,220 @@
+"""Runtime metrics of an OPTIMADE server in the Prometheus text exposition format.
+
+The metrics are collected by the [`AddMetrics`][optimade.server.middleware.AddMetrics]
+middleware and served at `/extensions/metrics`, if the `metrics` config option is
+enabled.
+
+"""
+
+import bisect
+import threading
+from collections.abc import Iterable, Mapping
+
+from optimade.server.entry_collections import FilterCacheInfo
+from optimade.server.timing import RequestTimings
+
+__all__ = ("Metrics",)
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""The upper bounds (in seconds) of the buckets of the duration histograms."""
+
+_COUNTERS: dict[str, str] = {
+    "documents_returned": "Number of entries returned in responses.",
+    "bytes_serialized": "Number of bytes of serialized JSON responses.",
+    "warnings": "Number of OPTIMADE warnings added to responses.",
+    "count_timeouts": "Number of database counts that timed out.",
+}
+"""The request events (see [`count()`][optimade.server.timing.count]) that are
+exported as counters, with their descriptions."""
+
+
+class _Histogram:
+    """The (non-cumulative) bucket counts, including the overflow bucket, and the
+    sum and count of observed values."""
+
+    __slots__ = ("buckets", "sum", "count")
+
+    def __init__(self, nbuckets: int) -> None:
+        self.buckets = [0] * (nbuckets + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class Metrics:
+    """Thread-safe counters and histograms of the requests handled by an app.
+
+    The metrics are:
+
+    - `optimade_requests_total`: the number of requests, by method, endpoint
+      (the path of the matched route) and status code;
+    - `optimade_request_duration_seconds`: a histogram of the request latency,
+      by method and endpoint;
+    - `optimade_step_duration_seconds`: a histogram of the duration of the timed
+      steps of the requests (e.g., `parse`, `transform`, `find`, `count`,
+      `map_back` and `serialize`, see [`timed()`][optimade.server.timing.timed]);
+    - counters of the request events, e.g., `optimade_documents_returned_total`
+      and `optimade_count_timeouts_total`;
+    - `optimade_filter_cache_hits_total` and `optimade_filter_cache_misses_total`:
+      the hits and misses of the cache of transformed filters, by entry collection.
+
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._requests: dict[tuple[str, str, str], int] = {}
+        self._latencies: dict[tuple[str, str], _Histogram] = {}
+        self._steps: dict[str, _Histogram] = {}
+        self._counters: dict[str, int] = dict.fromkeys(_COUNTERS, 0)
+
+    def _observe(self, histogram: _Histogram, value: float) -> None:
+        histogram.buckets[bisect.bisect_left(self.buckets, value)] += 1
+        histogram.sum += value
+        histogram.count += 1
+
+    def observe_request(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: int,
+        duration: float,
+        timings: RequestTimings | None = None,
+    ) -> None:
+        """Record a handled request.
+
+        Parameters:
+            method: The HTTP method of the request.
+            endpoint: The endpoint of the request, i.e., the path of the matched route.
+            status_code: The status code of the response.
+            duration: The duration of the request in seconds.
+            timings: The timed steps and counted events of the request.
+
+        """
+        nbuckets = len(self.buckets)
+        with self._lock:
+            key = (method, endpoint, str(status_code))
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+            latency = self._latencies.get((method, endpoint))
+            if latency is None:
+                latency = self._latencies[(method, endpoint)] = _Histogram(nbuckets)
+            self._observe(latency, duration)
+
+            if timings is None:
+                return
+            for step, step_duration in timings.durations.items():
+                if step == "total":
+                    continue
+                histogram = self._steps.get(step)
+                if histogram is None:
+                    histogram = self._steps[step] = _Histogram(nbuckets)
+                self._observe(histogram, step_duration)
+            for event, value in timings.counts.items():
+                if event in self._counters:
+                    self._counters[event] += value
+
+    def render(self, filter_caches: Mapping[str, FilterCacheInfo] | None = None) -> str:
+        """Return the metrics in the Prometheus text exposition format.
+
+        Parameters:
+            filter_caches: The statistics of the caches of transformed filters,
+                by entry collection, as reported by
+                [`filter_cache_info()`][optimade.server.entry_collections.entry_collections.EntryCollection.filter_cache_info].
+
+        """
+        lines: list[str] = []
+        with self._lock:
+            lines += [
+                "# HELP optimade_requests_total Number of handled requests.",
+                "# TYPE optimade_requests_total counter",
+            ]
+            for (method, endpoint, status), value in sorted(self._requests.items()):
+                labels = _labels(method=method, endpoint=endpoint, status=status)
+                lines.append(f"optimade_requests_total{{{labels}}} {value}")
+
+            lines += [
+                "# HELP optimade_request_duration_seconds Request latency.",
+                "# TYPE optimade_request_duration_seconds histogram",
+            ]
+            for (method, endpoint), histogram in sorted(self._latencies.items()):
+                lines += self._render_histogram(
+                    "optimade_request_duration_seconds",
+                    _labels(method=method, endpoint=endpoint),
+                    histogram,
+                )
+
+            lines += [
+                "# HELP optimade_step_duration_seconds Duration of the steps of handling requests.",
+                "# TYPE optimade_step_duration_seconds histogram",
+            ]
+            for step, histogram in sorted(self._steps.items()):
+                lines += self._render_histogram(
+                    "optimade_step_duration_seconds", _labels(step=step), histogram
+                )
+
+            for event, description in _COUNTERS.items():
+                name = f"optimade_{event}_total"
+                lines += [
+                    f"# HELP {name} {description}",
+                    f"# TYPE {name} counter",
+                    f"{name} {self._counters[event]}",
+                ]
+
+        for field, description in (
+            ("hits", "Number of filters found in the cache of transformed filters."),
+            (
+                "misses",
+                "Number of filters missing from the cache of transformed filters.",
+            ),
+        ):
+            name = f"optimade_filter_cache_{field}_total"
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+            for collection, cache_info in sorted((filter_caches or {}).items()):
+                lines.append(
+                    f"{name}{{{_labels(collection=collection)}}} {getattr(cache_info, field)}"
+                )
+
+        return "\n".join(lines) + "\n"
+
+    def _render_histogram(
+        self, name: str, labels: str, histogram: _Histogram
+    ) -> list[str]:
+        separator = "," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, histogram.buckets):
+            cumulative += count
+            lines.append(
+                f'{name}_bucket{{{labels}{separator}le="{bound}"}} {cumulative}'
+            )
+        lines += [
+            f'{name}_bucket{{{labels}{separator}le="+Inf"}} {histogram.count}',
+            f"{name}_sum{{{labels}}} {histogram.sum!r}",
+            f"{name}_count{{{labels}}} {histogram.count}",
+        ]
+        return lines
+
+
+def _labels(**labels: str) -> str:
+    """Format label values, escaping them as required by the exposition format."""
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in labels.items()
+    )
@@ -8,10 +8,11 @@ information on it's middleware implementation.
 
 import json
 import re
+import time
 import urllib.parse
 import warnings
 from collections.abc import Generator, Iterable
-from typing import TextIO
+from typing import Any, TextIO
 
 from starlette.datastructures import URL as StarletteURL
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -21,7 +22,14 @@ from starlette.responses import RedirectResponse, StreamingResponse
 from optimade.exceptions import BadRequest, VersionNotSupported
 from optimade.models import Warnings
 from optimade.server.config import ServerConfig
-from optimade.server.routers.utils import BASE_URL_PREFIXES, get_base_url
+from optimade.server.logger import get_logger
+from optimade.server.routers.utils import (
+    BASE_URL_PREFIXES,
+    REQUEST_WARNINGS,
+    CollectedWarnings,
+    get_base_url,
+)
+from optimade.server.timing import REQUEST_TIMINGS, RequestTimings, count
 from optimade.warnings import (
     FieldValueNotRecognized,
     LocalOptimadeWarning,
@@ -288,7 +296,16 @@ class AddWarnings(BaseHTTPMiddleware):
     accumulated warnings to the JSON response under the
     [`meta.warnings`][optimade.models.optimade_json.ResponseMeta.warnings] field.
 
-    To make sure the last part happens correctly and a Starlette `StreamingResponse`
+    The accumulated warnings are exposed to the request handler through the
+    [`REQUEST_WARNINGS`][optimade.server.routers.utils.REQUEST_WARNINGS] context
+    variable, so that [`meta_values()`][optimade.server.routers.utils.meta_values]
+    adds them to the response _before_ it is serialized.
+    In this case, the response body is passed through untouched, chunk by chunk.
+
+    Only if warnings were raised that did not make it into the serialized response
+    (e.g., for responses not created via `meta_values()`), is the response body
+    buffered and re-written.
+    To make sure this happens correctly and a Starlette `StreamingResponse`
     is returned, as is expected from a `BaseHTTPMiddleware` sub-class, one is
     instantiated with the updated `Content-Length` header, as well as making sure
     the response's body content is actually streamable, by breaking it down into
@@ -307,12 +324,12 @@ class AddWarnings(BaseHTTPMiddleware):
         [`OPTIMADE_MIDDLEWARE`][optimade.server.middleware.OPTIMADE_MIDDLEWARE].
 
     Attributes:
-        _warnings (List[Warnings]): List of [`Warnings`][optimade.models.optimade_json.Warnings]
-            added through usages of `warnings.warn()` via [`showwarning`][optimade.server.middleware.AddWarnings.showwarning].
+        _warnings (List[Dict[str, Any]]): List of [`Warnings`][optimade.models.optimade_json.Warnings]
+            (as dictionaries) added through usages of `warnings.warn()` via [`showwarning`][optimade.server.middleware.AddWarnings.showwarning].
 
     """
 
-    _warnings: list[Warnings]
+    _warnings: list[dict[str, Any]]
 
     def __init__(self, app, config: ServerConfig | None = None):
         super().__init__(app)
@@ -411,8 +428,14 @@ class AddWarnings(BaseHTTPMiddleware):
         else:
             new_warning = Warnings(title=title, detail=detail)
 
-        # Add new warning to self._warnings
-        self._warnings.append(new_warning.model_dump(exclude_unset=True))
+        # Add new warning to the current request's warnings (or self._warnings)
+        collected_warnings = REQUEST_WARNINGS.get()
+        warnings_list = (
+            collected_warnings.warnings
+            if collected_warnings is not None
+            else self._warnings
+        )
+        warnings_list.append(new_warning.model_dump(exclude_unset=True))
 
         # Show warning message as normal in sys.stderr
         warnings._showwarnmsg_impl(  # type: ignore[attr-defined]
@@ -436,7 +459,8 @@ class AddWarnings(BaseHTTPMiddleware):
         return (content[i : chunk_size + i] for i in range(0, len(content), chunk_size))
 
     async def dispatch(self, request: Request, call_next):
-        self._warnings = []
+        collected_warnings = CollectedWarnings()
+        self._warnings = collected_warnings.warnings
 
         # Stash config so self.showwarning() can reach it
         self._config = request.app.state.config
@@ -444,7 +468,16 @@ class AddWarnings(BaseHTTPMiddleware):
         warnings.simplefilter(action="default", category=OptimadeWarning)
         warnings.showwarning = self.showwarning
 
-        response = await call_next(request)
+        token = REQUEST_WARNINGS.set(collected_warnings)
+        try:
+            response = await call_next(request)
+        finally:
+            REQUEST_WARNINGS.reset(token)
+        count("warnings", len(collected_warnings.warnings))
+
+        if len(collected_warnings.warnings) == collected_warnings.serialized:
+            # All warnings (if any) are already part of the response body
+            return response
 
         status = response.status_code
         headers = response.headers
@@ -459,17 +492,16 @@ class AddWarnings(BaseHTTPMiddleware):
             if not isinstance(chunk, bytes):
                 chunk = chunk.encode(charset)
             body += chunk
-        body_str = body.decode(charset)
 
-        if self._warnings:
-            response = json.loads(body_str)
-            response.get("meta", {})["warnings"] = self._warnings
-            body_str = json.dumps(response)
+        if body:
+            content = json.loads(body)
+            content.get("meta", {})["warnings"] = collected_warnings.warnings
+            body = json.dumps(content).encode(charset)
             if "content-length" in headers:
-                headers["content-length"] = str(len(body_str))
+                headers["content-length"] = str(len(body))
 
         response = StreamingResponse(
-            content=self.chunk_it_up(body_str, chunk_size),
+            content=self.chunk_it_up(body, chunk_size),
             status_code=status,
             headers=headers,
             media_type=media_type,
@@ -479,6 +511,74 @@ class AddWarnings(BaseHTTPMiddleware):
         return response
 
 
+class AddServerTiming(BaseHTTPMiddleware):
+    """Collect the durations of the steps of handling the request, and report them
+    in the `Server-Timing` header of the response and in the debug logs.
+
+    The steps are timed with [`timed()`][optimade.server.timing.timed] through the
+    [`REQUEST_TIMINGS`][optimade.server.timing.REQUEST_TIMINGS] context variable,
+    and the total duration of the request is added as `total`.
+
+    This middleware is only added if the `server_timing` config option is enabled.
+
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        timings = REQUEST_TIMINGS.get()
+        token = None
+        if timings is None:
+            timings = RequestTimings()
+            token = REQUEST_TIMINGS.set(timings)
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            if token is not None:
+                REQUEST_TIMINGS.reset(token)
+        timings.add("total", time.perf_counter() - start)
+
+        response.headers["Server-Timing"] = timings.header_value()
+        get_logger().debug(
+            "Timings for %s %s: %s", request.method, request.url, timings
+        )
+        return response
+
+
+class AddMetrics(BaseHTTPMiddleware):
+    """Record the latency, timed steps and counted events of each request in the
+    [`Metrics`][optimade.server.metrics.Metrics] of the app (`app.state.metrics`).
+
+    The steps and events are collected through the
+    [`REQUEST_TIMINGS`][optimade.server.timing.REQUEST_TIMINGS] context variable,
+    shared with the [`AddServerTiming`][optimade.server.middleware.AddServerTiming]
+    middleware if both are enabled. Requests are labelled by the path of the matched
+    route, rather than the requested URL, to bound the number of metrics.
+
+    This middleware is only added if the `metrics` config option is enabled.
+
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        timings = RequestTimings()
+        token = REQUEST_TIMINGS.set(timings)
+        start = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+        finally:
+            REQUEST_TIMINGS.reset(token)
+            route = request.scope.get("route")
+            request.app.state.metrics.observe_request(
+                request.method,
+                getattr(route, "path", None) or "unmatched",
+                status_code,
+                time.perf_counter() - start,
+                timings,
+            )
+        return response
+
+
 OPTIMADE_MIDDLEWARE: Iterable[BaseHTTPMiddleware] = (
     EnsureQueryParamIntegrity,
     CheckWronglyVersionedBaseUrls,
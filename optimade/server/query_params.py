@@ -226,7 +226,7 @@ class EntryListingQueryParams(BaseQueryParams):
                 description="RECOMMENDED for use with _offset-based_ pagination: using `page_offset` and `page_limit` is RECOMMENDED.\nExample: Skip 50 structures and fetch up to 100: `/structures?page_offset=50&page_limit=100`.",
                 ge=0,
             ),
-        ] = 0,
+        ] = None,  # type: ignore[assignment]
         page_number: Annotated[
             int,
             Query(
@@ -1,6 +1,7 @@
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, Request
+from fastapi.responses import Response
 
 from optimade.models import (
     FileResponseMany,
@@ -8,7 +9,7 @@ from optimade.models import (
 )
 from optimade.server.config import ServerConfig
 from optimade.server.query_params import EntryListingQueryParams, SingleEntryQueryParams
-from optimade.server.routers.utils import get_entries, get_single_entry
+from optimade.server.routers.utils import get_entries_async, get_single_entry_async
 from optimade.server.schemas import ERROR_RESPONSES
 
 router = APIRouter(redirect_slashes=True)
@@ -23,11 +24,11 @@ CONFIG = ServerConfig()
     tags=["Files"],
     responses=ERROR_RESPONSES,
 )
-def get_files(
+async def get_files(
     request: Request, params: Annotated[EntryListingQueryParams, Depends()]
-) -> dict[str, Any]:
+) -> dict[str, Any] | Response:
     files_coll = request.app.state.entry_collections.get("files")
-    return get_entries(
+    return await get_entries_async(
         collection=files_coll,
         request=request,
         params=params,
@@ -41,13 +42,13 @@ def get_files(
     tags=["Files"],
     responses=ERROR_RESPONSES,
 )
-def get_single_file(
+async def get_single_file(
     request: Request,
     entry_id: str,
     params: Annotated[SingleEntryQueryParams, Depends()],
-) -> dict[str, Any]:
+) -> dict[str, Any] | Response:
     files_coll = request.app.state.entry_collections.get("files")
-    return get_single_entry(
+    return await get_single_entry_async(
         collection=files_coll,
         entry_id=entry_id,
         request=request,
@@ -1,12 +1,20 @@
-import functools
+import threading
+from collections import OrderedDict
 
 from fastapi import APIRouter, Request
 from fastapi.exceptions import StarletteHTTPException
+from fastapi.responses import Response
 
 from optimade import __api_version__
-from optimade.models import EntryInfoResource, EntryInfoResponse, InfoResponse
+from optimade.models import (
+    EntryInfoResource,
+    EntryInfoResponse,
+    InfoResponse,
+    ResponseMeta,
+)
 from optimade.models.baseinfo import BaseInfoAttributes, BaseInfoResource, Link
-from optimade.server.routers.utils import get_base_url, meta_values
+from optimade.server.config import ServerConfig
+from optimade.server.routers.utils import JSONAPIResponse, get_base_url, meta_values
 from optimade.server.schemas import (
     ENTRY_INFO_SCHEMAS,
     ERROR_RESPONSES,
@@ -16,6 +24,128 @@ from optimade.server.schemas import (
 router = APIRouter(redirect_slashes=True)
 
 
+class _InfoCache:
+    """A thread-safe LRU cache of serialized info resources.
+
+    It maps `("info", base_url)` and `("info/<entry>", None)` to the JSON-serialized
+    `data` of the respective info response, such that only the `meta` of the response
+    needs to be generated for each request.
+    Unless it is fixed in the server configuration, the `base_url` is derived from the
+    (client-controlled) request URL, hence the bounded size of the cache.
+
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[tuple[str, str | None], bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str | None]) -> bytes | None:
+        with self._lock:
+            data = self._data.get(key)
+            if data is not None:
+                self._data.move_to_end(key)
+            return data
+
+    def set(self, key: tuple[str, str | None], data: bytes) -> None:
+        with self._lock:
+            self._data[key] = data
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _get_info_cache(request: Request) -> _InfoCache:
+    """Return the app-scoped cache of serialized info resources, creating it if needed."""
+    state = request.app.state
+    if not hasattr(state, "info_cache"):
+        state.info_cache = _InfoCache()
+    return state.info_cache
+
+
+def _serialize_data(response: InfoResponse | EntryInfoResponse) -> bytes:
+    """JSON-serialize the `data` of a freshly built (and thereby validated) info response.
+
+    Cached data is returned directly as a `Response`, bypassing the validation of the
+    `response_model` of the endpoint, so the full response model is instead validated
+    once, when the data is built.
+
+    """
+    return response.data.model_dump_json(exclude_unset=True, by_alias=True).encode()
+
+
+def _render_info_response(meta: ResponseMeta, data: bytes) -> Response:
+    """Assemble a JSON:API response from a freshly generated `meta` and pre-serialized `data`."""
+    return Response(
+        content=b'{"data":'
+        + data
+        + b',"meta":'
+        + meta.model_dump_json(exclude_unset=True, by_alias=True).encode()
+        + b"}",
+        media_type=JSONAPIResponse.media_type,
+    )
+
+
+def generate_info_resource(config: ServerConfig, base_url: str) -> BaseInfoResource:
+    """Generate the info resource for the implementation.
+
+    Parameters:
+        config: The server configuration.
+        base_url: The base URL of the server.
+
+    """
+    return BaseInfoResource(
+        id=BaseInfoResource.model_fields["id"].default,
+        type=BaseInfoResource.model_fields["type"].default,
+        attributes=BaseInfoAttributes(
+            api_version=__api_version__,
+            available_api_versions=[
+                {
+                    "url": f"{base_url}/v{__api_version__.split('.')[0]}",
+                    "version": __api_version__,
+                }
+            ],
+            formats=["json"],
+            available_endpoints=["info", "links"] + list(ENTRY_INFO_SCHEMAS.keys()),
+            entry_types_by_format={"json": list(ENTRY_INFO_SCHEMAS.keys())},
+            is_index=False,
+            license=Link(href=config.license) if config.license else None,
+            available_licenses=[str(config.license).split("/")[-1]]
+            if "https://spdx.org" in str(config.license)
+            else None,
+        ),
+    )
+
+
+def generate_entry_info_resource(config: ServerConfig, entry: str) -> EntryInfoResource:
+    """Generate the entry info resource for the given type.
+
+    Parameters:
+        config: The server configuration.
+        entry: The OPTIMADE type to generate the info response for, e.g.,
+            `"structures"`. Must be a key in `ENTRY_INFO_SCHEMAS`.
+
+    """
+    schema = ENTRY_INFO_SCHEMAS[entry]
+    queryable_properties = {"id", "type", "attributes"}
+    properties = retrieve_queryable_properties(
+        schema, queryable_properties, entry_type=entry, config=config
+    )
+
+    output_fields_by_format = {"json": list(properties)}
+
+    return EntryInfoResource(
+        id=entry,
+        formats=list(output_fields_by_format),
+        description=getattr(schema, "__doc__", "Entry Resources"),
+        properties=properties,
+        output_fields_by_format=output_fields_by_format,
+    )
+
+
 @router.get(
     "/info",
     response_model=InfoResponse,
@@ -23,46 +153,29 @@ router = APIRouter(redirect_slashes=True)
     tags=["Info"],
     responses=ERROR_RESPONSES,
 )
-def get_info(request: Request) -> InfoResponse:
+def get_info(request: Request) -> Response:
     config = request.app.state.config
+    base_url = get_base_url(config, request.url)
+
+    meta = meta_values(
+        config,
+        request.url,
+        1,
+        1,
+        more_data_available=False,
+        schema=config.schema_url,
+    )
 
-    @functools.lru_cache(maxsize=1)
-    def _generate_info_response() -> BaseInfoResource:
-        """Cached closure that generates the info response for the implementation."""
-
-        return BaseInfoResource(
-            id=BaseInfoResource.model_fields["id"].default,
-            type=BaseInfoResource.model_fields["type"].default,
-            attributes=BaseInfoAttributes(
-                api_version=__api_version__,
-                available_api_versions=[
-                    {
-                        "url": f"{get_base_url(config, request.url)}/v{__api_version__.split('.')[0]}",
-                        "version": __api_version__,
-                    }
-                ],
-                formats=["json"],
-                available_endpoints=["info", "links"] + list(ENTRY_INFO_SCHEMAS.keys()),
-                entry_types_by_format={"json": list(ENTRY_INFO_SCHEMAS.keys())},
-                is_index=False,
-                license=Link(href=config.license) if config.license else None,
-                available_licenses=[str(config.license).split("/")[-1]]
-                if "https://spdx.org" in str(config.license)
-                else None,
-            ),
+    info_cache = _get_info_cache(request)
+    key = ("info", base_url)
+    data = info_cache.get(key)
+    if data is None:
+        data = _serialize_data(
+            InfoResponse(meta=meta, data=generate_info_resource(config, base_url))
         )
+        info_cache.set(key, data)
 
-    return InfoResponse(
-        meta=meta_values(
-            config,
-            request.url,
-            1,
-            1,
-            more_data_available=False,
-            schema=config.schema_url,
-        ),
-        data=_generate_info_response(),
-    )
+    return _render_info_response(meta, data)
 
 
 @router.get(
@@ -72,52 +185,37 @@ def get_info(request: Request) -> InfoResponse:
     tags=["Info"],
     responses=ERROR_RESPONSES,
 )
-def get_entry_info(request: Request, entry: str) -> EntryInfoResponse:
+def get_entry_info(request: Request, entry: str) -> Response:
     config = request.app.state.config
 
-    @functools.lru_cache(maxsize=len(ENTRY_INFO_SCHEMAS))
-    def _generate_entry_info_response(entry: str) -> EntryInfoResource:
-        """Cached closure that generates the entry info response for the given type.
-
-        Parameters:
-            entry: The OPTIMADE type to generate the info response for, e.g.,
-                `"structures"`. Must be a key in `ENTRY_INFO_SCHEMAS`.
-
-        """
-        valid_entry_info_endpoints = ENTRY_INFO_SCHEMAS.keys()
-        if entry not in valid_entry_info_endpoints:
-            raise StarletteHTTPException(
-                status_code=404,
-                detail=(
-                    f"Entry info not found for {entry}, valid entry info endpoints "
-                    f"are: {', '.join(valid_entry_info_endpoints)}"
-                ),
-            )
-
-        schema = ENTRY_INFO_SCHEMAS[entry]
-        queryable_properties = {"id", "type", "attributes"}
-        properties = retrieve_queryable_properties(
-            schema, queryable_properties, entry_type=entry, config=config
+    valid_entry_info_endpoints = ENTRY_INFO_SCHEMAS.keys()
+    if entry not in valid_entry_info_endpoints:
+        raise StarletteHTTPException(
+            status_code=404,
+            detail=(
+                f"Entry info not found for {entry}, valid entry info endpoints "
+                f"are: {', '.join(valid_entry_info_endpoints)}"
+            ),
         )
 
-        output_fields_by_format = {"json": list(properties)}
+    meta = meta_values(
+        config,
+        request.url,
+        1,
+        1,
+        more_data_available=False,
+        schema=config.schema_url,
+    )
 
-        return EntryInfoResource(
-            id=entry,
-            formats=list(output_fields_by_format),
-            description=getattr(schema, "__doc__", "Entry Resources"),
-            properties=properties,
-            output_fields_by_format=output_fields_by_format,
+    info_cache = _get_info_cache(request)
+    key = (f"info/{entry}", None)
+    data = info_cache.get(key)
+    if data is None:
+        data = _serialize_data(
+            EntryInfoResponse(
+                meta=meta, data=generate_entry_info_resource(config, entry)
+            )
         )
+        info_cache.set(key, data)
 
-    return EntryInfoResponse(
-        meta=meta_values(
-            config,
-            request.url,
-            1,
-            1,
-            more_data_available=False,
-            schema=config.schema_url,
-        ),
-        data=_generate_entry_info_response(entry),
-    )
+    return _render_info_response(meta, data)
@@ -1,11 +1,12 @@
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, Request
+from fastapi.responses import Response
 
 from optimade.models import LinksResponse
 from optimade.server.config import ServerConfig
 from optimade.server.query_params import EntryListingQueryParams
-from optimade.server.routers.utils import get_entries
+from optimade.server.routers.utils import get_entries_async
 from optimade.server.schemas import ERROR_RESPONSES
 
 router = APIRouter(redirect_slashes=True)
@@ -20,9 +21,11 @@ CONFIG = ServerConfig()
     tags=["Links"],
     responses=ERROR_RESPONSES,
 )
-def get_links(
+async def get_links(
     request: Request, params: Annotated[EntryListingQueryParams, Depends()]
-) -> dict[str, Any]:
+) -> dict[str, Any] | Response:
     links_coll = request.app.state.entry_collections.get("links")
 
-    return get_entries(collection=links_coll, request=request, params=params)
+    return await get_entries_async(
+        collection=links_coll, request=request, params=params
+    )
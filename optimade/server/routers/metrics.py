@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+
+router = APIRouter(redirect_slashes=True)
+
+
+class PrometheusResponse(Response):
+    media_type = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get(
+    "/extensions/metrics",
+    tags=["Metrics"],
+    response_class=PrometheusResponse,
+    include_in_schema=False,
+)
+def get_metrics(request: Request) -> PrometheusResponse:
+    """Respond with the runtime metrics of the server in the Prometheus text format."""
+    entry_collections = getattr(request.app.state, "entry_collections", {})
+    return PrometheusResponse(
+        content=request.app.state.metrics.render(
+            filter_caches={
+                name: collection.filter_cache_info()
+                for name, collection in entry_collections.items()
+            }
+        )
+    )
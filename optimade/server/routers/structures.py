@@ -1,6 +1,7 @@
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, Request
+from fastapi.responses import Response
 
 from optimade.models import (
     StructureResponseMany,
@@ -8,7 +9,7 @@ from optimade.models import (
 )
 from optimade.server.config import ServerConfig
 from optimade.server.query_params import EntryListingQueryParams, SingleEntryQueryParams
-from optimade.server.routers.utils import get_entries, get_single_entry
+from optimade.server.routers.utils import get_entries_async, get_single_entry_async
 from optimade.server.schemas import ERROR_RESPONSES
 
 router = APIRouter(redirect_slashes=True)
@@ -25,11 +26,11 @@ CONFIG = ServerConfig()
     tags=["Structures"],
     responses=ERROR_RESPONSES,
 )
-def get_structures(
+async def get_structures(
     request: Request, params: Annotated[EntryListingQueryParams, Depends()]
-) -> dict[str, Any]:
+) -> dict[str, Any] | Response:
     structures_coll = request.app.state.entry_collections.get("structures")
-    return get_entries(
+    return await get_entries_async(
         collection=structures_coll,
         request=request,
         params=params,
@@ -45,13 +46,13 @@ def get_structures(
     tags=["Structures"],
     responses=ERROR_RESPONSES,
 )
-def get_single_structure(
+async def get_single_structure(
     request: Request,
     entry_id: str,
     params: Annotated[SingleEntryQueryParams, Depends()],
-) -> dict[str, Any]:
+) -> dict[str, Any] | Response:
     structures_coll = request.app.state.entry_collections.get("structures")
-    return get_single_entry(
+    return await get_single_entry_async(
         collection=structures_coll,
         entry_id=entry_id,
         request=request,
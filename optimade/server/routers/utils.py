@@ -1,28 +1,43 @@
+import random
 import re
 import urllib.parse
+import warnings
+from collections.abc import Iterable
+from contextvars import ContextVar
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
 from starlette.datastructures import URL as StarletteURL
 
-from optimade import __api_version__
+from optimade import __api_version__, __version__
 from optimade.exceptions import BadRequest, InternalServerError
 from optimade.models import EntryResource, ResponseMeta, ToplevelLinks
 from optimade.server.config import ServerConfig
-from optimade.server.entry_collections import EntryCollection
+from optimade.server.entry_collections import VALIDATION_STAMP_FIELD, EntryCollection
 from optimade.server.query_params import EntryListingQueryParams, SingleEntryQueryParams
+from optimade.server.timing import count, timed
 from optimade.utils import PROVIDER_LIST_URLS, get_providers, mongo_id_for_database
+from optimade.warnings import TooManyValues
 
 __all__ = (
     "BASE_URL_PREFIXES",
+    "JSONAPIResponse",
+    "ORJSONAPIResponse",
+    "get_response_class",
     "meta_values",
     "handle_response_fields",
     "get_included_relationships",
+    "get_included_relationships_async",
     "get_base_url",
     "get_entries",
+    "get_entries_async",
     "get_single_entry",
+    "get_single_entry_async",
     "mongo_id_for_database",
     "get_providers",
     "PROVIDER_LIST_URLS",
@@ -37,14 +52,112 @@ BASE_URL_PREFIXES = {
 }
 
 
+class CollectedWarnings:
+    """Accumulator for the warnings raised while handling a single request.
+
+    Attributes:
+        warnings: The OPTIMADE warning objects (as dictionaries) raised so far.
+        serialized: The number of `warnings` that have already been added to the
+            response's `meta` by [`meta_values()`][optimade.server.routers.utils.meta_values].
+
+    """
+
+    __slots__ = ("warnings", "serialized")
+
+    def __init__(self) -> None:
+        self.warnings: list[dict[str, Any]] = []
+        self.serialized: int = 0
+
+
+REQUEST_WARNINGS: ContextVar[CollectedWarnings | None] = ContextVar(
+    "optimade_request_warnings", default=None
+)
+"""The warnings collected for the request currently being handled.
+
+This is set by the [`AddWarnings`][optimade.server.middleware.AddWarnings] middleware,
+such that [`meta_values()`][optimade.server.routers.utils.meta_values] can include the
+warnings in the response _before_ it is serialized.
+
+"""
+
+
 class JSONAPIResponse(JSONResponse):
-    """This class simply patches `fastapi.responses.JSONResponse` to use the
-    JSON:API 'application/vnd.api+json' MIME type.
+    """This class patches `fastapi.responses.JSONResponse` to use the
+    JSON:API 'application/vnd.api+json' MIME type, and times its serialization
+    (see [`timed()`][optimade.server.timing.timed]).
 
     """
 
     media_type = "application/vnd.api+json"
 
+    def render(self, content: Any) -> bytes:
+        with timed("serialize"):
+            body = super().render(content)
+        count("bytes_serialized", len(body))
+        return body
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize the types that `orjson` does not support natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", exclude_unset=True, by_alias=True)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    try:
+        from bson import ObjectId
+    except ImportError:  # pragma: no cover
+        pass
+    else:
+        if isinstance(obj, ObjectId):
+            return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONAPIResponse(JSONAPIResponse):
+    """A [`JSONAPIResponse`][optimade.server.routers.utils.JSONAPIResponse] that is
+    serialized with `orjson`.
+
+    The content does not need to be made JSON-compatible beforehand: datetimes are
+    emitted in ISO 8601 format, `ObjectId`s as strings, pydantic models as their
+    aliased, unset-excluded dump, and non-finite floats (e.g., `NaN`) as `null`.
+
+    """
+
+    def render(self, content: Any) -> bytes:
+        import orjson
+
+        with timed("serialize"):
+            body = orjson.dumps(
+                content,
+                default=_orjson_default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        count("bytes_serialized", len(body))
+        return body
+
+
+_UNVALIDATED_RESPONSE_ADAPTER = TypeAdapter(dict[str, Any])
+"""Serializes entry responses that are not validated against their response model."""
+
+
+def get_response_class(config: ServerConfig) -> type[JSONAPIResponse]:
+    """Return the response class for the configured `response_serializer`.
+
+    Raises:
+        ImportError: If `orjson` is requested but not installed.
+
+    """
+    if config.response_serializer == "orjson":
+        try:
+            import orjson  # noqa: F401
+        except ImportError as exc:
+            raise ImportError(
+                "The `orjson` response serializer requires the `orjson` package, "
+                "please install it or set `response_serializer` to `json`."
+            ) from exc
+        return ORJSONAPIResponse
+    return JSONAPIResponse
+
 
 def meta_values(
     config: ServerConfig,
@@ -55,7 +168,13 @@ def meta_values(
     schema: str | None = None,
     **kwargs,
 ) -> ResponseMeta:
-    """Helper to initialize the meta values"""
+    """Helper to initialize the meta values
+
+    Any warnings collected for the current request by the
+    [`AddWarnings`][optimade.server.middleware.AddWarnings] middleware are added
+    under `warnings`, unless explicitly passed.
+
+    """
     from optimade.models import ResponseMetaQuery
 
     if isinstance(url, str):
@@ -74,6 +193,15 @@ def meta_values(
         # Double-guard against the server setting an adversarially large request delay
         kwargs["request_delay"] = min(config.request_delay, 10.0)
 
+    collected_warnings = REQUEST_WARNINGS.get()
+    if (
+        collected_warnings is not None
+        and collected_warnings.warnings
+        and "warnings" not in kwargs
+    ):
+        kwargs["warnings"] = list(collected_warnings.warnings)
+        collected_warnings.serialized = len(collected_warnings.warnings)
+
     return ResponseMeta(
         query=ResponseMetaQuery(representation=f"{url_path}?{url.query}"),
         api_version=__api_version__,
@@ -134,24 +262,18 @@ def handle_response_fields(
     return new_results
 
 
-def get_included_relationships(
+def _get_included_ids(
     results: EntryResource | list[EntryResource] | dict | list[dict],
     ENTRY_COLLECTIONS: dict[str, EntryCollection],
     include_param: list[str],
-) -> list[EntryResource | dict[str, Any]]:
-    """Filters the included relationships and makes the appropriate compound request
-    to include them in the response.
+) -> dict[str, dict[str, Any]]:
+    """Collect the unique IDs of the related resources to include, by entry type.
 
-    Parameters:
-        results: list of returned documents.
-        ENTRY_COLLECTIONS: dictionary containing collections to query, with key
-            based on endpoint type.
-        include_param: list of queried related resources that should be included in
-            `included`.
+    At most `page_limit_max` related resources are included in total; if more are
+    referenced, the remaining ones are left out with a warning.
 
-    Returns:
-        Dictionary with the same keys as ENTRY_COLLECTIONS, each containing the list
-            of resource objects for that entry type.
+    Raises:
+        BadRequest: If an unknown relationship type is requested.
 
     """
     from collections import defaultdict
@@ -166,10 +288,10 @@ def get_included_relationships(
                 f"Known relationship types: {sorted(ENTRY_COLLECTIONS.keys())}"
             )
 
-    endpoint_includes: dict[Any, dict] = defaultdict(dict)
+    endpoint_includes: dict[str, dict[str, Any]] = defaultdict(dict)
 
     if not include_param:
-        return []
+        return endpoint_includes
 
     for doc in results:
         # convert list of references into dict by ID to only included unique IDs
@@ -199,33 +321,89 @@ def get_included_relationships(
                     if ref["id"] not in endpoint_includes[entry_type]:
                         endpoint_includes[entry_type][ref["id"]] = ref
 
+    max_included = min(
+        (
+            ENTRY_COLLECTIONS[entry_type].config.page_limit_max
+            for entry_type in endpoint_includes
+        ),
+        default=0,
+    )
+    n_included = sum(len(ids) for ids in endpoint_includes.values())
+    if n_included > max_included:
+        warnings.warn(
+            TooManyValues(
+                detail=f"Only {max_included} of the {n_included} related resources "
+                "are included in the response."
+            )
+        )
+        remaining = max_included
+        for entry_type, ids in endpoint_includes.items():
+            endpoint_includes[entry_type] = dict(list(ids.items())[:remaining])
+            remaining -= len(endpoint_includes[entry_type])
+
+    return endpoint_includes
+
+
+def get_included_relationships(
+    results: EntryResource | list[EntryResource] | dict | list[dict],
+    ENTRY_COLLECTIONS: dict[str, EntryCollection],
+    include_param: list[str],
+) -> list[EntryResource | dict[str, Any]]:
+    """Filters the included relationships and makes the appropriate compound request
+    to include them in the response.
+
+    Parameters:
+        results: list of returned documents.
+        ENTRY_COLLECTIONS: dictionary containing collections to query, with key
+            based on endpoint type.
+        include_param: list of queried related resources that should be included in
+            `included`.
+
+    Returns:
+        Dictionary with the same keys as ENTRY_COLLECTIONS, each containing the list
+            of resource objects for that entry type.
+
+    """
+    endpoint_includes = _get_included_ids(results, ENTRY_COLLECTIONS, include_param)
+
     included: dict[
         str,
         list[EntryResource] | list[dict[str, Any]],
     ] = {}
     for entry_type in endpoint_includes:
-        compound_filter = " OR ".join(
-            [f'id="{ref_id}"' for ref_id in endpoint_includes[entry_type]]
-        )
-        params = EntryListingQueryParams(
-            filter=compound_filter,
-            response_format="json",
-            response_fields="",
-            sort="",
-            page_limit=0,
-            page_offset=0,
+        included[entry_type] = ENTRY_COLLECTIONS[entry_type].find_by_ids(
+            endpoint_includes[entry_type]
         )
 
-        # still need to handle pagination
-        ref_results, _, _, _, _ = ENTRY_COLLECTIONS[entry_type].find(params)
-        if ref_results is None:
-            ref_results = []
-        included[entry_type] = ref_results  # type: ignore[assignment]
-
     # flatten dict by endpoint to list
     return [obj for endp in included.values() for obj in endp]
 
 
+async def get_included_relationships_async(
+    results: EntryResource | list[EntryResource] | dict | list[dict],
+    ENTRY_COLLECTIONS: dict[str, EntryCollection],
+    include_param: list[str],
+) -> list[EntryResource | dict[str, Any]]:
+    """Asynchronous variant of
+    [`get_included_relationships()`][optimade.server.routers.utils.get_included_relationships],
+    where the related resources of each type are retrieved concurrently.
+
+    """
+    import asyncio
+
+    endpoint_includes = _get_included_ids(results, ENTRY_COLLECTIONS, include_param)
+
+    included = await asyncio.gather(
+        *(
+            ENTRY_COLLECTIONS[entry_type].find_by_ids_async(ids)
+            for entry_type, ids in endpoint_includes.items()
+        )
+    )
+
+    # flatten list by endpoint
+    return [obj for endp in included for obj in endp]
+
+
 def get_base_url(
     config: ServerConfig,
     parsed_url_request: (
@@ -248,14 +426,185 @@ def get_base_url(
     )
 
 
+def _get_include_param(
+    params: EntryListingQueryParams | SingleEntryQueryParams,
+) -> list[str]:
+    """Return the list of requested relationship types from the `include` query parameter."""
+    include = []
+    if getattr(params, "include", False):
+        include.extend(params.include.split(","))
+    return include
+
+
+def _get_next_link(
+    collection: EntryCollection,
+    request: Request,
+    params: EntryListingQueryParams,
+    results: dict[str, Any] | list[dict[str, Any]] | None,
+) -> ToplevelLinks:
+    """Deduce the `next` link from the current request."""
+    config = request.app.state.config
+
+    query = urllib.parse.parse_qs(request.url.query)
+    query.update(collection.get_next_query_params(params, results))
+
+    urlencoded = urllib.parse.urlencode(query, doseq=True)
+    base_url = get_base_url(config, request.url)
+
+    # if base_url contains a subpath, it is already included in request.url.path
+    # so remove it from base_url
+    parsed_base = urllib.parse.urlparse(base_url)
+    base_url = f"{parsed_base.scheme}://{parsed_base.netloc}"
+
+    return ToplevelLinks(next=f"{base_url}{request.url.path}?{urlencoded}")
+
+
+def _entries_response(
+    collection: EntryCollection,
+    request: Request,
+    links: ToplevelLinks,
+    data: list[dict[str, Any]]
+    | dict[str, Any]
+    | list[EntryResource]
+    | EntryResource
+    | None,
+    data_returned: int | None,
+    data_available: int,
+    more_data_available: bool,
+    included: list[EntryResource | dict[str, Any]],
+) -> dict[str, Any] | Response:
+    """Assemble the response for an entry endpoint.
+
+    The response is returned already rendered, bypassing FastAPI's handling of the
+    endpoint's response model, such that it can be built in a worker thread by the
+    asynchronous endpoints. If it is sampled for validation (see
+    `validate_api_response_sample_rate`), it is first validated against the response
+    model of the endpoint that is being handled.
+    Entries are validated with the collection's cache of validated entries, if enabled
+    (see `validation_cache_size`), and not at all if they were all stamped as valid on
+    ingestion and `trust_validation_stamp` is enabled.
+
+    """
+    config = request.app.state.config
+    count(
+        "documents_returned",
+        len(data) if isinstance(data, list) else int(data is not None),
+    )
+
+    response = {
+        "links": links,
+        "data": data,
+        "meta": meta_values(
+            config=config,
+            url=request.url,
+            data_returned=data_returned,
+            data_available=data_available,
+            more_data_available=more_data_available,
+            schema=config.schema_url
+            if not config.is_index
+            else config.index_schema_url,
+        ),
+        "included": included,
+    }
+
+    stamped = False
+    if config.trust_validation_stamp:
+        entries: list[dict[str, Any]] | list[EntryResource]
+        if data is None:
+            entries = []
+        elif isinstance(data, list):
+            entries = data
+        else:
+            entries = [data]
+        stamped = _pop_validation_stamps((*entries, *included))
+
+    validate = (
+        config.validate_api_response
+        and not stamped
+        and random.random() < config.validate_api_response_sample_rate
+    )
+    adapter = _UNVALIDATED_RESPONSE_ADAPTER
+    if validate:
+        response_model = getattr(request.scope.get("route"), "response_model", None)
+        if response_model is None:
+            # Not handled by an endpoint: leave the validation to the caller
+            return response
+        adapter = _get_response_adapter(response_model)
+        with timed("validate"):
+            if config.validation_cache_size:
+                response["data"] = _get_validated_entries(collection, data)
+            response = adapter.validate_python(response, from_attributes=True)
+    elif config.response_serializer == "orjson":
+        return ORJSONAPIResponse(response)
+
+    with timed("serialize"):
+        content = adapter.dump_json(response, by_alias=True, exclude_unset=True)
+    count("bytes_serialized", len(content))
+    return Response(content=content, media_type=JSONAPIResponse.media_type)
+
+
+@lru_cache(maxsize=None)
+def _get_response_adapter(response_model: Any) -> TypeAdapter:
+    """Return the (shared) adapter that validates and serializes responses against the
+    response model of an endpoint."""
+    return TypeAdapter(response_model)
+
+
+def _pop_validation_stamps(
+    entries: Iterable[dict[str, Any] | EntryResource],
+) -> bool:
+    """Remove the stamps of the entries that were validated on ingestion
+    (see [`VALIDATION_STAMP_FIELD`][optimade.server.entry_collections.entry_collections.VALIDATION_STAMP_FIELD]),
+    which are mapped to their attributes.
+
+    Returns:
+        Whether all entries were stamped by the current version of `optimade`.
+
+    """
+    all_stamped = True
+    for entry in entries:
+        if isinstance(entry, EntryResource):
+            continue
+        stamp = entry.get("attributes", {}).pop(VALIDATION_STAMP_FIELD, None)
+        all_stamped = all_stamped and stamp == __version__
+    return all_stamped
+
+
+def _get_validated_entries(
+    collection: EntryCollection,
+    data: list[dict[str, Any]]
+    | dict[str, Any]
+    | list[EntryResource]
+    | EntryResource
+    | None,
+) -> list[EntryResource] | EntryResource | list[dict[str, Any]] | dict[str, Any] | None:
+    """Replace the entries by their (possibly cached) validated resources, such that the
+    endpoint's response model does not need to validate them again.
+
+    As the response models fall back to plain dictionaries if any entry is not a valid
+    resource, the entries are left untouched in that case.
+
+    """
+    if data is None:
+        return None
+
+    if isinstance(data, list):
+        resources = [collection.validate_entry(entry) for entry in data]
+        if any(resource is None for resource in resources):
+            return data
+        return resources  # type: ignore[return-value]
+
+    resource = collection.validate_entry(data)
+    return data if resource is None else resource
+
+
 def get_entries(
     collection: EntryCollection,
     request: Request,
     params: EntryListingQueryParams,
-) -> dict[str, Any]:
+) -> dict[str, Any] | Response:
     """Generalized /{entry} endpoint getter"""
 
-    config = request.app.state.config
     entry_collections = request.app.state.entry_collections
     base_resource_mapper = request.app.state.base_resource_mapper
 
@@ -268,49 +617,98 @@ def get_entries(
         include_fields,
     ) = collection.find(params)
 
-    include = []
-    if getattr(params, "include", False):
-        include.extend(params.include.split(","))
-
     included = []
     if results is not None:
-        included = get_included_relationships(results, entry_collections, include)
+        included = get_included_relationships(
+            results, entry_collections, _get_include_param(params)
+        )
 
     if more_data_available:
-        # Deduce the `next` link from the current request
-        query = urllib.parse.parse_qs(request.url.query)
-        query.update(collection.get_next_query_params(params, results))
+        links = _get_next_link(collection, request, params, results)
+    else:
+        links = ToplevelLinks(next=None)
 
-        urlencoded = urllib.parse.urlencode(query, doseq=True)
-        base_url = get_base_url(config, request.url)
+    if results is not None and (fields or include_fields):
+        with timed("response_fields"):
+            results = handle_response_fields(results, fields, include_fields)  # type: ignore[assignment]
+
+    return _entries_response(
+        collection,
+        request,
+        links,
+        results if results else [],
+        data_returned,
+        len(collection),
+        more_data_available,
+        included,
+    )
 
-        # if base_url contains a subpath, it is already included in request.url.path
-        # so remove it from base_url
-        parsed_base = urllib.parse.urlparse(base_url)
-        base_url = f"{parsed_base.scheme}://{parsed_base.netloc}"
 
-        links = ToplevelLinks(next=f"{base_url}{request.url.path}?{urlencoded}")
+async def get_entries_async(
+    collection: EntryCollection,
+    request: Request,
+    params: EntryListingQueryParams,
+) -> dict[str, Any] | Response:
+    """Asynchronous variant of [`get_entries()`][optimade.server.routers.utils.get_entries]"""
+
+    entry_collections = request.app.state.entry_collections
+    base_resource_mapper = request.app.state.base_resource_mapper
+
+    params.check_params(request.query_params, base_resource_mapper)
+    (
+        results,
+        data_returned,
+        more_data_available,
+        fields,
+        include_fields,
+    ) = await collection.find_async(params)
+
+    included = []
+    if results is not None:
+        included = await get_included_relationships_async(
+            results, entry_collections, _get_include_param(params)
+        )
+
+    if more_data_available:
+        links = _get_next_link(collection, request, params, results)
     else:
         links = ToplevelLinks(next=None)
 
     if results is not None and (fields or include_fields):
-        results = handle_response_fields(results, fields, include_fields)  # type: ignore[assignment]
+        results = await run_in_threadpool(
+            _handle_response_fields_timed, results, fields, include_fields
+        )
 
-    return {
-        "links": links,
-        "data": results if results else [],
-        "meta": meta_values(
-            config=config,
-            url=request.url,
-            data_returned=data_returned,
-            data_available=len(collection),
-            more_data_available=more_data_available,
-            schema=config.schema_url
-            if not config.is_index
-            else config.index_schema_url,
-        ),
-        "included": included,
-    }
+    # Validating and serializing the response is CPU-bound
+    return await run_in_threadpool(
+        _entries_response,
+        collection,
+        request,
+        links,
+        results if results else [],
+        data_returned,
+        await collection.len_async(),
+        more_data_available,
+        included,
+    )
+
+
+def _handle_response_fields_timed(
+    results: dict[str, Any] | list[dict[str, Any]],
+    exclude_fields: set[str],
+    include_fields: set[str],
+) -> list[dict[str, Any]]:
+    """Run [`handle_response_fields()`][optimade.server.routers.utils.handle_response_fields]
+    as the timed `response_fields` step."""
+    with timed("response_fields"):
+        return handle_response_fields(results, exclude_fields, include_fields)
+
+
+def _check_single_entry_results(more_data_available: bool) -> None:
+    if more_data_available:
+        raise InternalServerError(
+            detail=f"more_data_available MUST be False for single entry response, however it is {more_data_available}",
+        )
 
 
 def get_single_entry(
@@ -318,8 +716,7 @@ def get_single_entry(
     entry_id: str,
     request: Request,
     params: SingleEntryQueryParams,
-) -> dict[str, Any]:
-    config = request.app.state.config
+) -> dict[str, Any] | Response:
     entry_collections = request.app.state.entry_collections
     base_resource_mapper = request.app.state.base_resource_mapper
 
@@ -333,36 +730,75 @@ def get_single_entry(
         include_fields,
     ) = collection.find(params)
 
-    if more_data_available:
-        raise InternalServerError(
-            detail=f"more_data_available MUST be False for single entry response, however it is {more_data_available}",
+    _check_single_entry_results(more_data_available)
+
+    included = []
+    if results is not None:
+        included = get_included_relationships(
+            results, entry_collections, _get_include_param(params)
         )
 
-    include = []
-    if getattr(params, "include", False):
-        include.extend(params.include.split(","))
+    if results is not None and (fields or include_fields):
+        with timed("response_fields"):
+            results = handle_response_fields(results, fields, include_fields)[0]  # type: ignore[assignment]
+
+    return _entries_response(
+        collection,
+        request,
+        ToplevelLinks(next=None),
+        results if results else None,
+        data_returned,
+        len(collection),
+        more_data_available,
+        included,
+    )
+
+
+async def get_single_entry_async(
+    collection: EntryCollection,
+    entry_id: str,
+    request: Request,
+    params: SingleEntryQueryParams,
+) -> dict[str, Any] | Response:
+    """Asynchronous variant of
+    [`get_single_entry()`][optimade.server.routers.utils.get_single_entry]"""
+    entry_collections = request.app.state.entry_collections
+    base_resource_mapper = request.app.state.base_resource_mapper
+
+    params.check_params(request.query_params, base_resource_mapper)
+    params.filter = f'id="{entry_id}"'  # type: ignore[attr-defined]
+    (
+        results,
+        data_returned,
+        more_data_available,
+        fields,
+        include_fields,
+    ) = await collection.find_async(params)
+
+    _check_single_entry_results(more_data_available)
 
     included = []
     if results is not None:
-        included = get_included_relationships(results, entry_collections, include)
-
-    links = ToplevelLinks(next=None)
+        included = await get_included_relationships_async(
+            results, entry_collections, _get_include_param(params)
+        )
 
     if results is not None and (fields or include_fields):
-        results = handle_response_fields(results, fields, include_fields)[0]  # type: ignore[assignment]
-
-    return {
-        "links": links,
-        "data": results if results else None,
-        "meta": meta_values(
-            config=config,
-            url=request.url,
-            data_returned=data_returned,
-            data_available=len(collection),
-            more_data_available=more_data_available,
-            schema=config.schema_url
-            if not config.is_index
-            else config.index_schema_url,
-        ),
-        "included": included,
-    }
+        results = (
+            await run_in_threadpool(
+                _handle_response_fields_timed, results, fields, include_fields
+            )
+        )[0]
+
+    # Validating and serializing the response is CPU-bound
+    return await run_in_threadpool(
+        _entries_response,
+        collection,
+        request,
+        ToplevelLinks(next=None),
+        results if results else None,
+        data_returned,
+        await collection.len_async(),
+        more_data_available,
+        included,
+    )
@@ -1,4 +1,6 @@
-from collections.abc import Iterable
+import copy
+import json
+from collections.abc import Hashable, Iterable
 from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import BaseModel, TypeAdapter
@@ -27,7 +29,12 @@ if TYPE_CHECKING:  # pragma: no cover
         ],
     ]
 
-__all__ = ("ENTRY_INFO_SCHEMAS", "ERROR_RESPONSES", "retrieve_queryable_properties")
+__all__ = (
+    "ENTRY_INFO_SCHEMAS",
+    "ERROR_RESPONSES",
+    "retrieve_queryable_properties",
+    "precompute_queryable_properties",
+)
 
 ENTRY_INFO_SCHEMAS: dict[str, type[EntryResource]] = {
     "structures": StructureResource,
@@ -52,6 +59,40 @@ try:
 except ModuleNotFoundError:
     ERROR_RESPONSES = None
 
+_QUERYABLE_PROPERTIES_CACHE: dict[Hashable, "QueryableProperties"] = {}
+"""Memoized results of `retrieve_queryable_properties()`, see `_queryable_properties_key()`."""
+
+
+def _queryable_properties_key(
+    schema: type[EntryResource],
+    queryable_properties: Iterable[str] | None,
+    entry_type: str | None,
+    config: ServerConfig | None,
+) -> Hashable:
+    """Return the key under which the queryable properties for the given arguments are memoized.
+
+    Only the parts of the config that are used, i.e., the provider prefix and the
+    provider fields of the given entry type, are part of the key.
+
+    """
+    provider_fields = None
+    if entry_type and config:
+        provider_fields = (
+            config.provider.prefix,
+            json.dumps(
+                config.provider_fields.get(entry_type, []),  # type: ignore[call-overload]
+                sort_keys=True,
+                default=str,
+            ),
+        )
+
+    return (
+        schema,
+        frozenset(queryable_properties) if queryable_properties else None,
+        entry_type,
+        provider_fields,
+    )
+
 
 def retrieve_queryable_properties(
     schema: type[EntryResource],
@@ -62,6 +103,9 @@ def retrieve_queryable_properties(
     """Recursively loops through a pydantic model, returning a dictionary of all the
     OPTIMADE-queryable properties of that model.
 
+    As generating the JSON schemas of all fields is slow, the results are memoized
+    for the lifetime of the process, and a copy is returned.
+
     Parameters:
         schema: The pydantic model.
         queryable_properties: The list of properties to find in the schema.
@@ -74,6 +118,35 @@ def retrieve_queryable_properties(
         and type, where provided.
 
     """
+    if queryable_properties is not None:
+        queryable_properties = frozenset(queryable_properties)
+
+    key = _queryable_properties_key(schema, queryable_properties, entry_type, config)
+    if key not in _QUERYABLE_PROPERTIES_CACHE:
+        _QUERYABLE_PROPERTIES_CACHE[key] = _retrieve_queryable_properties(
+            schema, queryable_properties, entry_type, config
+        )
+    return copy.deepcopy(_QUERYABLE_PROPERTIES_CACHE[key])
+
+
+def precompute_queryable_properties(config: ServerConfig) -> None:
+    """Populate the memoized queryable properties of the `/info/<entry_type>` endpoints
+    and of the entry resource mappers, e.g., at server startup."""
+    for entry_type, schema in ENTRY_INFO_SCHEMAS.items():
+        retrieve_queryable_properties(
+            schema, ("id", "type", "attributes"), entry_type=entry_type, config=config
+        )
+        retrieve_queryable_properties(schema)
+
+
+def _retrieve_queryable_properties(
+    schema: type[EntryResource],
+    queryable_properties: Iterable[str] | None = None,
+    entry_type: str | None = None,
+    config: ServerConfig | None = None,
+) -> "QueryableProperties":
+    """The uncached implementation of
+    [`retrieve_queryable_properties()`][optimade.server.schemas.retrieve_queryable_properties]."""
     properties: "QueryableProperties" = {}
     for name, value in schema.model_fields.items():
         # Proceed if the field (name) is given explicitly in the queryable_properties
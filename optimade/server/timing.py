@@ -0,0 +1,87 @@
+"""Per-request timing of the steps of handling a request, e.g., parsing the filter,
+querying the database and serializing the response, and counting of its events,
+e.g., the number of documents returned.
+
+The timings are collected by the
+[`AddServerTiming`][optimade.server.middleware.AddServerTiming] middleware, if the
+`server_timing` config option is enabled, and reported in the `Server-Timing` header
+of the response and in the debug logs.
+They are also collected by the [`AddMetrics`][optimade.server.middleware.AddMetrics]
+middleware, if the `metrics` config option is enabled, and aggregated into the
+[`Metrics`][optimade.server.metrics.Metrics] of the app.
+
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+__all__ = ("REQUEST_TIMINGS", "RequestTimings", "timed", "count")
+
+
+class RequestTimings:
+    """The accumulated durations (in seconds) of the named steps of handling a request,
+    and the accumulated counts of its named events.
+
+    Steps that occur multiple times during a request, e.g., database queries for the
+    entries and for the included resources, are summed.
+
+    """
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+
+    def add(self, name: str, duration: float) -> None:
+        """Add the duration (in seconds) of a step."""
+        self.durations[name] = self.durations.get(name, 0.0) + duration
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Add `value` to the count of an event."""
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def header_value(self) -> str:
+        """Return the timings in the format of the `Server-Timing` header,
+        with durations in milliseconds."""
+        return ", ".join(
+            f"{name};dur={1000 * duration:.3f}"
+            for name, duration in self.durations.items()
+        )
+
+    def __str__(self) -> str:
+        return ", ".join(
+            f"{name}={1000 * duration:.3f}ms"
+            for name, duration in self.durations.items()
+        )
+
+
+REQUEST_TIMINGS: ContextVar[RequestTimings | None] = ContextVar(
+    "optimade_request_timings", default=None
+)
+"""The timings collected for the request currently being handled, or `None` if timings
+are not collected."""
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Add the duration of the enclosed block as the step `name` to the timings of the
+    current request, if they are being collected."""
+    timings = REQUEST_TIMINGS.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - start)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Add `value` to the count of the event `name` of the current request,
+    if its timings are being collected."""
+    timings = REQUEST_TIMINGS.get()
+    if timings is not None:
+        timings.increment(name, value)
@@ -5,16 +5,22 @@ with OPTIMADE providers that can be used in server or client code.
 
 import contextlib
 import json
-from collections.abc import Container, Iterable
+import time
+from collections.abc import Container, Generator, Iterable
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import requests
 from requests.exceptions import SSLError
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     import rich.progress
 
+    from optimade.models import EntryResource
+    from optimade.server.mappers import BaseResourceMapper
+
 from pydantic import ValidationError
 
 from optimade.models.links import LinksResource
@@ -25,27 +31,349 @@ PROVIDER_LIST_URLS = (
 )
 
 
+def _loads_jsonl_line(line: bytes) -> dict:
+    """Parse a single JSONL line, only using the (slow) BSON extended JSON parser if the
+    line may contain extended JSON types such as `{"$oid": ...}` or `{"$date": ...}`.
+
+    Raises:
+        json.JSONDecodeError: If the line could not be parsed.
+
+    """
+    import bson.json_util
+
+    if b'"$' not in line:
+        try:
+            import orjson
+        except ImportError:
+            return json.loads(line)
+
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the standard library, e.g., regarding `NaN` values
+            pass
+
+    return bson.json_util.loads(line)
+
+
+def _parse_jsonl_chunk(
+    lines: list[bytes],
+    first_line_no: int,
+    validators: dict[str, tuple[type["EntryResource"], "BaseResourceMapper"]]
+    | None = None,
+) -> tuple[dict[str, list[dict]], int, int, list[str], list[dict[str, Any]]]:
+    """Parse a chunk of JSONL lines into the documents to insert for each entry type.
+
+    This function may run in a separate process, so any warnings are returned
+    rather than logged.
+
+    Arguments:
+        lines: The raw lines of the chunk.
+        first_line_no: The line number of the first line, used in warnings.
+        validators: If given, the entry resource class and resource mapper by entry type,
+            with which each document is mapped back and validated. Valid documents are
+            stamped with the `optimade` version in the
+            [`VALIDATION_STAMP_FIELD`][optimade.server.entry_collections.entry_collections.VALIDATION_STAMP_FIELD].
+
+    Returns:
+        The documents to insert by entry type, the numbers of good and bad rows,
+        the warning messages and the validation failures.
+
+    """
+    from collections import defaultdict
+
+    if validators:
+        from optimade import __version__
+        from optimade.server.entry_collections.entry_collections import (
+            VALIDATION_STAMP_FIELD,
+        )
+
+    batch: dict[str, list[dict]] = defaultdict(list)
+    good_rows = bad_rows = 0
+    messages: list[str] = []
+    failures: list[dict[str, Any]] = []
+
+    for line_no, json_str in enumerate(lines, start=first_line_no):
+        try:
+            if json_str.strip():
+                entry = _loads_jsonl_line(json_str)
+            else:
+                messages.append(f"Could not read any data from L{line_no}")
+                bad_rows += 1
+                continue
+        except json.JSONDecodeError:
+            messages.append(
+                f"Could not read entry L{line_no} JSON: '{json_str.decode(errors='replace')}'"
+            )
+            bad_rows += 1
+            continue
+        try:
+            id = entry.get("id", None)
+            _type = entry.get("type", None)
+            if id is None or _type == "info":
+                # assume this is an info endpoint for pre-1.2
+                continue
+            if not isinstance(_type, str):
+                raise ValueError("Entry has no `type`")
+
+            inp_data = entry["attributes"]
+            inp_data["id"] = id
+            if "relationships" in entry:
+                inp_data["relationships"] = entry["relationships"]
+            if "links" in entry:
+                inp_data["links"] = entry["links"]
+            batch[_type].append(inp_data)
+        except Exception as exc:
+            messages.append(f"Error with entry at L{line_no} -- {entry} -- {exc}")
+            bad_rows += 1
+            continue
+
+        if validators and _type in validators:
+            failure = _validate_jsonl_document(inp_data, *validators[_type])
+            if failure is None:
+                inp_data[VALIDATION_STAMP_FIELD] = __version__
+            else:
+                failures.append({"line": line_no, "id": id, "type": _type, **failure})
+
+        good_rows += 1
+
+    return dict(batch), good_rows, bad_rows, messages, failures
+
+
+def _validate_jsonl_document(
+    document: dict[str, Any],
+    resource_cls: type["EntryResource"],
+    resource_mapper: "BaseResourceMapper",
+) -> dict[str, Any] | None:
+    """Map back and validate a document as it will be stored in the database.
+
+    Returns:
+        `None` if the document is valid, otherwise a compact description of the errors.
+
+    """
+    try:
+        resource_cls.model_validate(resource_mapper.map_back(document))
+    except ValidationError as exc:
+        return {
+            "errors": [
+                {
+                    "loc": ".".join(str(_) for _ in error["loc"]),
+                    "msg": error["msg"],
+                }
+                for error in exc.errors(include_url=False, include_input=False)
+            ]
+        }
+    except Exception as exc:
+        return {"errors": [{"loc": "", "msg": repr(exc)}]}
+    return None
+
+
+_WORKER_VALIDATORS: (
+    dict[str, tuple[type["EntryResource"], "BaseResourceMapper"]] | None
+) = None
+"""The validators used by `_parse_jsonl_chunk_in_worker()`, set once per worker process."""
+
+
+def _init_jsonl_worker(
+    validators: dict[str, tuple[type["EntryResource"], "BaseResourceMapper"]] | None,
+) -> None:
+    """Set the validators of a worker process of the JSONL parsing pool."""
+    global _WORKER_VALIDATORS
+    _WORKER_VALIDATORS = validators
+
+
+def _parse_jsonl_chunk_in_worker(
+    lines: list[bytes], first_line_no: int
+) -> tuple[dict[str, list[dict]], int, int, list[str], list[dict[str, Any]]]:
+    """Run `_parse_jsonl_chunk()` in a worker process, with the validators it was
+    initialized with, avoiding sending them along with every chunk."""
+    return _parse_jsonl_chunk(lines, first_line_no, _WORKER_VALIDATORS)
+
+
+def _read_jsonl_chunks(
+    handle, chunk_size: int, first_line_no: int
+) -> Iterable[tuple[int, int, int, list[bytes]]]:
+    """Read chunks of `chunk_size` lines from a JSONL file opened in binary mode.
+
+    Yields:
+        The byte offsets of the start and end of the chunk, the line number of its
+        first line, and its lines.
+
+    """
+    line_no = first_line_no
+    while True:
+        start = handle.tell()
+        lines = []
+        for _ in range(chunk_size):
+            line = handle.readline()
+            if not line:
+                break
+            lines.append(line)
+        if not lines:
+            return
+        yield start, handle.tell(), line_no, lines
+        line_no += len(lines)
+
+
+class _JSONLCheckpoint:
+    """A resumable checkpoint of the chunks of a JSONL file that have been inserted.
+
+    The checkpoint records the byte offset (and line number) up to which all chunks
+    have been inserted, the start offsets of any chunks beyond that offset that have
+    also been inserted (e.g., by concurrent writers before a failure), the start offsets
+    of the chunks whose insert has been started but not completed (and which may thus
+    have been partially inserted), and the running totals of good and bad rows.
+    As chunks are identified by their start offsets, it also records the number of
+    lines per chunk with which they were read.
+
+    """
+
+    def __init__(
+        self, path: Path | None, jsonl_path: Path, offset: int, batch_size: int
+    ) -> None:
+        self.path = path
+        self.jsonl_path = jsonl_path
+        self.offset = offset
+        self.batch_size = batch_size
+        self.line_no = 0
+        self.completed: set[int] = set()
+        self.started: set[int] = set()
+        self.good_rows = 0
+        self.bad_rows = 0
+
+        if path is not None and path.exists():
+            data = json.loads(path.read_text())
+            if data["jsonl_path"] != str(jsonl_path):
+                raise ValueError(
+                    f"Checkpoint {path} was created for {data['jsonl_path']}, not {jsonl_path}"
+                )
+            self.offset = data["offset"]
+            self.batch_size = data["batch_size"]
+            self.line_no = data["line"]
+            self.completed = set(data["completed"])
+            self.started = set(data.get("started", []))
+            self.good_rows = data["good_rows"]
+            self.bad_rows = data["bad_rows"]
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "jsonl_path": str(self.jsonl_path),
+                    "offset": self.offset,
+                    "batch_size": self.batch_size,
+                    "line": self.line_no,
+                    "completed": sorted(self.completed),
+                    "started": sorted(self.started),
+                    "good_rows": self.good_rows,
+                    "bad_rows": self.bad_rows,
+                }
+            )
+        )
+        tmp_path.replace(self.path)
+
+    def remove(self) -> None:
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+
+class _JSONLChunk:
+    """The state of a chunk of lines of a JSONL file that is being inserted."""
+
+    __slots__ = ("start", "end", "next_line_no", "parse", "insert", "rows", "skip")
+
+    def __init__(self, start: int, end: int, next_line_no: int) -> None:
+        self.start = start
+        self.end = end
+        self.next_line_no = next_line_no
+        self.parse: Future | None = None
+        self.insert: Future | None = None
+        self.rows: tuple[int, int] = (0, 0)
+        self.skip: bool = False
+
+
+class _IngestProgress:
+    """Periodically logs the number of rows inserted and the insertion rate."""
+
+    def __init__(self, logger, interval: float | None, initial_rows: int = 0) -> None:
+        self.logger = logger
+        self.interval = interval
+        self.initial_rows = initial_rows
+        self.start = self.last_report = time.monotonic()
+
+    def rate(self, rows: int) -> float:
+        elapsed = time.monotonic() - self.start
+        return (rows - self.initial_rows) / elapsed if elapsed > 0 else 0.0
+
+    def update(self, rows: int) -> None:
+        if not self.interval:
+            return
+        now = time.monotonic()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.logger.info(
+                "Inserted %d rows from the JSONL file (%.0f rows/s)",
+                rows,
+                self.rate(rows),
+            )
+
+
 def insert_from_jsonl(
-    jsonl_path: Path, entry_collections, create_default_index: bool = False
+    jsonl_path: Path,
+    entry_collections,
+    create_default_index: bool = False,
+    batch_size: int = 1000,
+    processes: int = 0,
+    writers: int = 1,
+    checkpoint_path: Path | None = None,
+    progress_interval: float | None = 10.0,
+    validate: bool = False,
+    validation_report_path: Path | None = None,
 ) -> None:
     """Insert OPTIMADE JSON lines data into the database.
 
+    The file is read in chunks of `batch_size` lines, which are parsed (optionally by a
+    pool of `processes` worker processes) and inserted into the corresponding entry
+    collections (optionally by `writers` concurrent threads).
+    Lines without BSON extended JSON types are parsed with a fast JSON parser.
+
+    If `validate` is set, each document is also mapped back with the resource mapper of
+    its entry collection and validated against its entry resource model by the parsing
+    processes. Valid documents are stamped with the `optimade` version in the
+    [`VALIDATION_STAMP_FIELD`][optimade.server.entry_collections.entry_collections.VALIDATION_STAMP_FIELD],
+    such that the server can skip validating them (see `trust_validation_stamp`).
+    Invalid documents are still inserted, without a stamp.
+
     Arguments:
         jsonl_path: Path to the JSON lines file.
         create_default_index: Whether to create a default index on the `id` field.
+        batch_size: The number of lines per chunk, i.e., the maximum number of
+            documents per insert.
+        processes: The number of processes used to parse the file, or 0 to parse
+            it in the current process.
+        writers: The number of chunks that are inserted concurrently.
+        checkpoint_path: An optional path to a checkpoint file recording the chunks
+            that have been inserted. If it exists, a previous (failed) insert is
+            resumed from it, with the `batch_size` of that insert; it is removed once
+            the whole file has been inserted.
+        progress_interval: The interval (in seconds) at which to log the progress,
+            or `None` to only log the final result.
+        validate: Whether to validate and stamp the documents before inserting them.
+        validation_report_path: An optional path to a JSON lines file to which the
+            line, ID, type and errors of each document that failed validation
+            are written.
 
     """
-    from collections import defaultdict
-
-    import bson.json_util
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
     from optimade.server.logger import get_logger
 
     LOGGER = get_logger()
 
-    batch = defaultdict(list)
-    batch_size: int = 1000
-
     # Attempt to treat path as absolute, otherwise join with root directory
     if not jsonl_path.is_file():
         _jsonl_path = Path(__file__).parent.joinpath(jsonl_path)
@@ -63,63 +391,225 @@ def insert_from_jsonl(
             except NotImplementedError:
                 pass
 
-    bad_rows: int = 0
-    good_rows: int = 0
-    with open(jsonl_path) as handle:
+    validators = (
+        {
+            entry_type: (collection.resource_cls, collection.resource_mapper)
+            for entry_type, collection in entry_collections.items()
+        }
+        if validate
+        else None
+    )
+    invalid_rows = 0
+
+    def insert_chunk(batch: dict[str, list[dict]], deduplicate: bool) -> None:
+        for entry_type, documents in batch.items():
+            collection = entry_collections[entry_type]
+            if documents and deduplicate:
+                # The chunk may have been partially inserted before a previous insert
+                # failed, so skip the documents whose IDs are already present
+                existing = {
+                    entry["id"]
+                    for entry in collection.find_by_ids(doc["id"] for doc in documents)
+                }
+                documents = [doc for doc in documents if doc["id"] not in existing]
+            if documents:
+                collection.insert(documents)
+
+    with open(jsonl_path, "rb") as handle:
         header = handle.readline()
         header_jsonl = json.loads(header)
         assert header_jsonl.get("x-optimade"), (
             "No x-optimade header, not sure if this is a JSONL file"
         )
 
-        for line_no, json_str in enumerate(handle):
-            try:
-                if json_str.strip():
-                    entry = bson.json_util.loads(json_str)
-                else:
-                    LOGGER.warning("Could not read any data from L%s", line_no)
-                    bad_rows += 1
-                    continue
-            except json.JSONDecodeError:
-                LOGGER.warning("Could not read entry L%s JSON: '%s'", line_no, json_str)
-                bad_rows += 1
-                continue
-            try:
-                id = entry.get("id", None)
-                _type = entry.get("type", None)
-                if id is None or _type == "info":
-                    # assume this is an info endpoint for pre-1.2
-                    continue
+        header_offset = handle.tell()
+        checkpoint = _JSONLCheckpoint(
+            checkpoint_path, jsonl_path, header_offset, batch_size
+        )
+        if checkpoint.batch_size != batch_size:
+            # Chunks of a different size would not line up with the recorded ones
+            LOGGER.warning(
+                "Resuming insert with the batch size of the checkpoint (%d), not %d",
+                checkpoint.batch_size,
+                batch_size,
+            )
+            batch_size = checkpoint.batch_size
+        if checkpoint.offset != header_offset:
+            LOGGER.info(
+                "Resuming insert from the JSONL file at L%d (%d rows already inserted)",
+                checkpoint.line_no,
+                checkpoint.good_rows,
+            )
+            handle.seek(checkpoint.offset)
+        progress = _IngestProgress(LOGGER, progress_interval, checkpoint.good_rows)
+
+        report = None
+        if validation_report_path is not None:
+            # Append to the report of the failed insert that is being resumed
+            report = open(
+                validation_report_path,
+                "a" if checkpoint.offset != header_offset else "w",
+            )
 
-                inp_data = entry["attributes"]
-                inp_data["id"] = id
-                if "relationships" in entry:
-                    inp_data["relationships"] = entry["relationships"]
-                if "links" in entry:
-                    inp_data["links"] = entry["links"]
-                # Append the data to the batch
-                batch[_type].append(inp_data)
-            except Exception as exc:
-                LOGGER.warning(f"Error with entry at L{line_no} -- {entry} -- {exc}")
-                bad_rows += 1
-                continue
+        pending: deque[_JSONLChunk] = deque()
+        max_pending = 2 * max(processes, writers, 1)
+
+        def submit_insert(chunk: _JSONLChunk, parsed) -> None:
+            nonlocal invalid_rows
+            batch, good, bad, messages, failures = parsed
+            for message in messages:
+                LOGGER.warning(message)
+            invalid_rows += len(failures)
+            if report is not None:
+                for failure in failures:
+                    report.write(json.dumps(failure) + "\n")
+            chunk.rows = (good, bad)
+            deduplicate = chunk.start in checkpoint.started
+            if not deduplicate:
+                checkpoint.started.add(chunk.start)
+                checkpoint.save()
+            chunk.insert = (
+                write_pool.submit(insert_chunk, batch, deduplicate)
+                if write_pool is not None
+                else _completed_future(insert_chunk, batch, deduplicate)
+            )
 
-            if len(batch[_type]) >= batch_size:
-                entry_collections[_type].insert(batch[_type])
-                batch[_type] = []
+        def complete_chunks(wait: bool) -> None:
+            """Insert the parsed chunks and advance the checkpoint over the inserted ones.
+
+            If `wait` is set, block until the oldest pending chunk has been inserted,
+            leaving the later chunks in flight.
+
+            """
+            oldest = next((chunk for chunk in pending if not chunk.skip), None)
+            for chunk in pending:
+                if chunk.parse is not None and (
+                    (wait and chunk is oldest) or chunk.parse.done()
+                ):
+                    parse, chunk.parse = chunk.parse, None
+                    submit_insert(chunk, parse.result())
+
+            while pending:
+                chunk = pending[0]
+                if not chunk.skip:
+                    if chunk.insert is None or not (
+                        (wait and chunk is oldest) or chunk.insert.done()
+                    ):
+                        break
+                    chunk.insert.result()
+                    checkpoint.good_rows += chunk.rows[0]
+                    checkpoint.bad_rows += chunk.rows[1]
+                pending.popleft()
+                checkpoint.completed.discard(chunk.start)
+                checkpoint.started.discard(chunk.start)
+                checkpoint.offset = chunk.end
+                checkpoint.line_no = chunk.next_line_no
+                checkpoint.save()
+                progress.update(checkpoint.good_rows)
+
+        try:
+            with contextlib.ExitStack() as stack:
+                if report is not None:
+                    stack.enter_context(report)
+                parse_pool = (
+                    stack.enter_context(
+                        ProcessPoolExecutor(
+                            processes,
+                            initializer=_init_jsonl_worker,
+                            initargs=(validators,),
+                        )
+                    )
+                    if processes > 0
+                    else None
+                )
+                write_pool = (
+                    stack.enter_context(ThreadPoolExecutor(writers))
+                    if writers > 1
+                    else None
+                )
+
+                try:
+                    for start, end, line_no, lines in _read_jsonl_chunks(
+                        handle, batch_size, checkpoint.line_no
+                    ):
+                        chunk = _JSONLChunk(start, end, line_no + len(lines))
+                        pending.append(chunk)
+                        if start in checkpoint.completed:
+                            # Already inserted before the previous insert failed
+                            chunk.skip = True
+                        elif parse_pool is not None:
+                            chunk.parse = parse_pool.submit(
+                                _parse_jsonl_chunk_in_worker, lines, line_no
+                            )
+                        else:
+                            submit_insert(
+                                chunk, _parse_jsonl_chunk(lines, line_no, validators)
+                            )
+
+                        complete_chunks(wait=len(pending) >= max_pending)
+
+                    while pending:
+                        complete_chunks(wait=True)
+
+                except BaseException:
+                    # Do not start any further work, but let running inserts finish
+                    for chunk in pending:
+                        for future in (chunk.parse, chunk.insert):
+                            if future is not None:
+                                future.cancel()
+                    raise
+
+        except BaseException:
+            # Record the chunks that have been inserted beyond the checkpoint offset,
+            # such that they are not inserted again when resuming
+            for chunk in pending:
+                if (
+                    not chunk.skip
+                    and chunk.insert is not None
+                    and chunk.insert.done()
+                    and not chunk.insert.cancelled()
+                    and chunk.insert.exception() is None
+                ):
+                    checkpoint.completed.add(chunk.start)
+                    checkpoint.started.discard(chunk.start)
+                    checkpoint.good_rows += chunk.rows[0]
+                    checkpoint.bad_rows += chunk.rows[1]
+                elif chunk.insert is not None and chunk.insert.cancelled():
+                    checkpoint.started.discard(chunk.start)
+            checkpoint.save()
+            raise
+
+    checkpoint.remove()
+
+    if checkpoint.bad_rows:
+        LOGGER.warning(
+            "Could not read %d rows from the JSONL file", checkpoint.bad_rows
+        )
+
+    if invalid_rows:
+        LOGGER.warning(
+            "%d rows from the JSONL file failed validation and were not stamped%s",
+            invalid_rows,
+            f", see {validation_report_path}" if validation_report_path else "",
+        )
 
-            good_rows += 1
+    LOGGER.info(
+        "Inserted %d rows from the JSONL file (%.0f rows/s)",
+        checkpoint.good_rows,
+        progress.rate(checkpoint.good_rows),
+    )
 
-        # Insert any remaining data
-        for entry_type in batch:
-            if batch[entry_type]:
-                entry_collections[entry_type].insert(batch[entry_type])
-                batch[entry_type] = []
 
-        if bad_rows:
-            LOGGER.warning("Could not read %d rows from the JSONL file", bad_rows)
+def _completed_future(fn, *args) -> "Future":
+    """Run `fn` immediately, returning its result or exception as a completed future."""
+    from concurrent.futures import Future
 
-        LOGGER.info("Inserted %d rows from the JSONL file", good_rows)
+    future: Future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
 
 
 def mongo_id_for_database(database_id: str, database_type: str) -> str:
@@ -216,6 +706,7 @@ def get_child_database_links(
     headers: dict | None = None,
     skip_ssl: bool = False,
     session: requests.Session | None = None,
+    timeout: float = 10,
 ) -> list[LinksResource]:
     """For a provider, return a list of available child databases.
 
@@ -226,6 +717,7 @@ def get_child_database_links(
         headers: Additional HTTP headers to pass to the provider.
         session: An optional `requests.Session` to use for the request, allowing custom
             HTTP configuration (e.g. proxies). Defaults to the module-level `requests`.
+        timeout: The timeout (in seconds) of the request to the provider.
 
     Returns:
         A list of the valid links entries from this provider that
@@ -246,10 +738,10 @@ def get_child_database_links(
 
     links_endp = base_url + "/v1/links"
     try:
-        links = _get(links_endp, timeout=10, headers=headers)
+        links = _get(links_endp, timeout=timeout, headers=headers)
     except SSLError as exc:
         if skip_ssl:
-            links = _get(links_endp, timeout=10, headers=headers, verify=False)
+            links = _get(links_endp, timeout=timeout, headers=headers, verify=False)
         else:
             raise RuntimeError(
                 f"SSL error when connecting to provider {provider['id']}. Use `skip_ssl` to ignore."
@@ -293,21 +785,32 @@ def get_all_databases(
     progress: "rich.progress.Progress | None" = None,
     skip_ssl: bool = False,
     session: requests.Session | None = None,
-) -> Iterable[str]:
+    max_workers: int = 8,
+    timeout: float = 10,
+) -> Generator[str, None, None]:
     """Iterate through all databases reported by registered OPTIMADE providers.
 
+    The index meta-databases of the providers are queried concurrently, and the
+    databases of each provider are yielded as soon as it has responded, such that
+    slow or unresponsive providers do not hold back the others.
+
     Parameters:
         include_providers: A set/container of provider IDs to include child databases for.
         exclude_providers: A set/container of provider IDs to exclude child databases for.
         exclude_databases: A set/container of specific database URLs to exclude.
         session: An optional `requests.Session` to use for the underlying requests,
             allowing custom HTTP configuration (e.g. proxies). Defaults to the
-            module-level `requests`.
+            module-level `requests`. As sessions are not thread-safe, the providers
+            are queried one at a time (by a single worker) with a given session.
+        max_workers: The maximum number of providers to query concurrently.
+        timeout: The timeout (in seconds) of the request to each provider.
 
     Returns:
         A generator of child database links that obey the given parameters.
 
     """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     if progress is not None:
         _progress = progress
         _task = _progress.add_task(
@@ -321,16 +824,38 @@ def get_all_databases(
         _task = None
 
     with _progress:
-        for provider in get_providers(session=session):
-            if exclude_providers and provider["id"] in exclude_providers:
-                continue
-            if include_providers and provider["id"] not in include_providers:
-                continue
+        providers = [
+            provider
+            for provider in get_providers(session=session)
+            if not (exclude_providers and provider["id"] in exclude_providers)
+            and not (include_providers and provider["id"] not in include_providers)
+        ]
+
+        executor = ThreadPoolExecutor(
+            max_workers=1 if session is not None else max_workers
+        )
+        futures = {
+            executor.submit(
+                get_child_database_links,
+                provider,
+                skip_ssl=skip_ssl,
+                session=session,
+                timeout=timeout,
+            ): provider
+            for provider in providers
+        }
+        try:
+            for future in as_completed(futures):
+                provider = futures[future]
+                try:
+                    links = future.result()
+                except RuntimeError as exc:
+                    if _progress is not None:
+                        _progress.print(
+                            f"Unable to retrieve databases from [bold red]{provider['id']}[/bold red]: {exc}",
+                        )
+                    continue
 
-            try:
-                links = get_child_database_links(
-                    provider, skip_ssl=skip_ssl, session=session
-                )
                 for link in links:
                     if link.attributes.base_url:
                         if (
@@ -344,9 +869,6 @@ def get_all_databases(
                     _progress.print(
                         f"Retrieved databases from [bold green]{provider['id']}[/bold green]"
                     )
-            except RuntimeError as exc:
-                if _progress is not None:
-                    _progress.print(
-                        f"Unable to retrieve databases from [bold red]{provider['id']}[/bold red]: {exc}",
-                    )
-                pass
+        finally:
+            # Don't wait for the remaining providers if the caller stops early
+            executor.shutdown(wait=False, cancel_futures=True)
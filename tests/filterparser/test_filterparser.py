@@ -12,10 +12,13 @@ class BaseTestFilterParser(abc.ABC):
 
     version: tuple[int, int, int]
     variant: str = "default"
+    parser_type: str = "lalr"
 
     @pytest.fixture(autouse=True)
     def set_up(self):
-        self.parser = LarkParser(version=self.version, variant=self.variant)
+        self.parser = LarkParser(
+            version=self.version, variant=self.variant, parser=self.parser_type
+        )
 
     def test_repr(self):
         assert repr(self.parser) is not None
@@ -292,3 +295,38 @@ class TestParserV1_2_0(TestParserV1_0_0):
             Tree,
         )
         assert isinstance(self.parse("_mp_stability.gga_gga+u_r2scan <= 0.0"), Tree)
+
+
+class TestEarleyParserV1_2_0(TestParserV1_2_0):
+    """Run all v1.2.0 tests with the Earley parsing algorithm."""
+
+    parser_type = "earley"
+
+
+@pytest.mark.parametrize(
+    "filter_",
+    [
+        "",
+        'elements HAS ALL "Si","O" AND nelements=2',
+        'NOT (chemical_formula_reduced = "H2O" OR nsites > 4) AND _exmpl_x IS KNOWN',
+        'elements:_exmpl_occ HAS ONLY "Si":>0.5, "O":<0.2',
+        "nelements LENGTH >= 3 AND 5 < nsites",
+        'a STARTS WITH "x" OR b ENDS "y" OR c CONTAINS "z" AND d = TRUE',
+    ],
+)
+def test_lalr_earley_equivalence(filter_):
+    """Check that the LALR and Earley parsers produce identical trees."""
+    lalr = LarkParser(version=(1, 2, 0), parser="lalr")
+    earley = LarkParser(version=(1, 2, 0), parser="earley")
+    assert lalr.parse(filter_) == earley.parse(filter_)
+
+
+def test_shared_grammar_cache():
+    """Check that the compiled grammar is shared between parser instances."""
+    from optimade.filterparser import ParserError
+
+    assert LarkParser().lark is LarkParser().lark
+    assert LarkParser(parser="earley").lark is not LarkParser().lark
+
+    with pytest.raises(ParserError):
+        LarkParser(parser="cyk")  # type: ignore[arg-type]
@@ -913,3 +913,28 @@ class TestMongoTransformer:
         assert self.transform("nelements != 5") == self.transform("5 != nelements")
         assert self.transform("nelements > 5") == self.transform("5 < nelements")
         assert self.transform("nelements <= 5") == self.transform("5 >= nelements")
+
+    def test_single_pass_postprocessing(self):
+        """Check that applying all post-processing rules in a single traversal
+        matches applying each rule in its own `recursive_postprocessing` pass."""
+        from lark import Transformer
+
+        from optimade.filtertransformers.mongo import (
+            MongoTransformer,
+            recursive_postprocessing,
+        )
+
+        parser = LarkParser(version=self.version, variant=self.variant)
+        transformer = MongoTransformer()
+        for filter_ in (
+            'NOT (nsites=1 OR (nelements IS KNOWN AND elements HAS ONLY "x"))',
+            'references.id HAS ONLY "a" AND NOT references.id IS KNOWN',
+            "elements LENGTH > 3 OR NOT (elements LENGTH <= 2 AND _id != 1)",
+            'last_modified > "2020-01-01T00:00:00Z" AND NOT nsites IS UNKNOWN',
+        ):
+            tree = parser.parse(filter_)
+            expected = Transformer.transform(transformer, tree)
+            for rule in transformer.postprocessing_rules:
+                expected = recursive_postprocessing(expected, *rule)
+
+            assert transformer.transform(tree) == expected
@@ -31,3 +31,495 @@ def test_get_attribute_fields():
             set(attributes_model.model_fields.keys())
             == entry_collections[entry_name].get_attribute_fields()
         )
+
+
+def test_filter_cache():
+    """Test that transformed filters are cached, copied and re-emit their warnings."""
+    import pytest
+
+    from optimade.server.config import ServerConfig
+    from optimade.server.entry_collections import create_entry_collections
+    from optimade.warnings import UnknownProviderProperty
+
+    config = ServerConfig(filter_cache_size=2)
+    structures = create_entry_collections(config)["structures"]
+
+    query = structures.transform_filter("nelements=2")
+    assert structures.filter_cache_info().misses == 1
+    query["nelements"] = "corrupted"
+
+    assert structures.transform_filter("nelements=2") == {"nelements": {"$eq": 2}}
+    assert structures.filter_cache_info().hits == 1
+
+    for _ in range(2):
+        with pytest.warns(UnknownProviderProperty):
+            structures.transform_filter("_unknown_field IS KNOWN")
+    assert structures.filter_cache_info().hits == 2
+
+    # Evict the least recently used filter
+    structures.transform_filter('elements HAS "Si"')
+    structures.transform_filter("nelements=2")
+    assert structures.filter_cache_info().misses == 4
+    assert structures.filter_cache_info().currsize == 2
+
+
+def test_single_entry_bypasses_filter_cache(client):
+    """Test that requesting single entries does not fill the cache of transformed
+    filters with one-off `id` filters."""
+    structures = client.app.state.entry_collections["structures"]
+    cache_info = structures.filter_cache_info()
+
+    for entry_id in ("mpf_1", "mpf_3"):
+        response = client.get(f"/structures/{entry_id}")
+        assert response.json()["data"]["id"] == entry_id
+    assert structures.filter_cache_info() == cache_info
+
+
+def test_count_cache_and_skip_count():
+    """Test that counts are cached and invalidated on insert, and that
+    `mongo_skip_count` determines `more_data_available` without counting."""
+    import pytest
+
+    from optimade.server.config import ServerConfig
+    from optimade.server.mappers import StructureMapper
+    from optimade.server.query_params import EntryListingQueryParams
+
+    config = ServerConfig(mongo_count_cache_ttl=60, mongo_skip_count=True)
+    if config.database_backend.value not in ("mongomock", "mongodb"):
+        pytest.skip("Count caching is only implemented for MongoDB.")
+
+    from optimade.models import StructureResource
+    from optimade.server.entry_collections.mongo import MongoCollection
+
+    collection = MongoCollection(
+        name="test_count_cache",
+        resource_cls=StructureResource,
+        resource_mapper=StructureMapper(config),
+        config=config,
+    )
+    collection.collection.drop()
+    collection.insert([{"id": f"test_{i}", "nelements": i % 2} for i in range(5)])
+    assert len(collection) == 5
+
+    # More data is available without having counted the results
+    _, data_returned, more_data_available, _, _ = collection.find(
+        EntryListingQueryParams(filter="nelements=0", page_limit=2)
+    )
+    assert more_data_available
+    assert data_returned is None
+
+    # The last page gives the exact count, which is then cached
+    _, data_returned, more_data_available, _, _ = collection.find(
+        EntryListingQueryParams(filter="nelements=0", page_limit=2, page_offset=2)
+    )
+    assert not more_data_available
+    assert data_returned == 3
+    _, data_returned, _, _, _ = collection.find(
+        EntryListingQueryParams(filter="nelements=0", page_limit=2)
+    )
+    assert data_returned == 3
+
+    # An empty page past the end of the results does not determine the count
+    collection._count_cache.clear()
+    _, data_returned, more_data_available, _, _ = collection.find(
+        EntryListingQueryParams(filter="nelements=0", page_limit=2, page_offset=10)
+    )
+    assert not more_data_available
+    assert data_returned is None
+
+    # Inserting data invalidates all cached counts
+    collection.insert([{"id": "test_5", "nelements": 0}])
+    assert len(collection) == 6
+    _, data_returned, _, _, _ = collection.find(
+        EntryListingQueryParams(filter="nelements=0", page_limit=2)
+    )
+    assert data_returned is None
+    assert collection.count(filter={"nelements": 0}) == 4
+    collection.collection.drop()
+
+
+def test_unfiltered_data_returned_is_exact(monkeypatch):
+    """Test that `data_returned` of an unfiltered listing is an exact (cached) count,
+    whereas `data_available` uses the estimated size of the collection."""
+    import pytest
+
+    from optimade.server.config import ServerConfig
+    from optimade.server.mappers import StructureMapper
+    from optimade.server.query_params import EntryListingQueryParams
+
+    config = ServerConfig(mongo_count_cache_ttl=60)
+    if config.database_backend.value not in ("mongomock", "mongodb"):
+        pytest.skip("Count caching is only implemented for MongoDB.")
+
+    from optimade.models import StructureResource
+    from optimade.server.entry_collections.mongo import MongoCollection
+
+    collection = MongoCollection(
+        name="test_unfiltered_count",
+        resource_cls=StructureResource,
+        resource_mapper=StructureMapper(config),
+        config=config,
+    )
+    collection.collection.drop()
+    collection.insert([{"id": f"test_{i}"} for i in range(5)])
+
+    counted = []
+    original_count_documents = collection.collection.count_documents
+
+    def count_documents(filter, **kwargs):
+        counted.append(filter)
+        return original_count_documents(filter, **kwargs)
+
+    monkeypatch.setattr(
+        collection.collection, "estimated_document_count", lambda **kwargs: 1000
+    )
+    monkeypatch.setattr(collection.collection, "count_documents", count_documents)
+
+    assert len(collection) == 1000
+    for _ in range(2):
+        _, data_returned, more_data_available, _, _ = collection.find(
+            EntryListingQueryParams(page_limit=2)
+        )
+        assert data_returned == 5
+        assert more_data_available
+    assert counted == [{}]
+    collection.collection.drop()
+
+
+def test_count_timeout(monkeypatch):
+    """Test that a count exceeding `mongo_count_timeout` returns `None`, is counted
+    as a timed out count of the request, and is not cached."""
+    import pytest
+
+    from optimade.server.config import ServerConfig
+    from optimade.server.mappers import StructureMapper
+
+    config = ServerConfig(mongo_count_cache_ttl=60)
+    if config.database_backend.value not in ("mongomock", "mongodb"):
+        pytest.skip("Count timeouts are only implemented for MongoDB.")
+
+    from pymongo.errors import ExecutionTimeout
+
+    from optimade.models import StructureResource
+    from optimade.server.entry_collections.mongo import MongoCollection
+    from optimade.server.timing import REQUEST_TIMINGS, RequestTimings
+
+    collection = MongoCollection(
+        name="test_count_timeout",
+        resource_cls=StructureResource,
+        resource_mapper=StructureMapper(config),
+        config=config,
+    )
+
+    def count_documents(**kwargs):
+        raise ExecutionTimeout("operation exceeded time limit")
+
+    monkeypatch.setattr(collection.collection, "count_documents", count_documents)
+
+    timings = RequestTimings()
+    token = REQUEST_TIMINGS.set(timings)
+    try:
+        assert collection.count(filter={"nelements": 0}) is None
+        assert collection.count(filter={"nelements": 0}) is None
+    finally:
+        REQUEST_TIMINGS.reset(token)
+    assert timings.counts["count_timeouts"] == 2
+
+    monkeypatch.undo()
+    collection.collection.drop()
+
+
+def test_response_fields_projection():
+    """Test that only the requested (and required) fields are retrieved from the database."""
+    from optimade.server.config import ServerConfig
+    from optimade.server.entry_collections import create_entry_collections
+    from optimade.server.query_params import EntryListingQueryParams
+
+    config = ServerConfig()
+    structures = create_entry_collections(config)["structures"]
+    mapper = structures.resource_mapper
+
+    criteria = structures.handle_query_params(
+        EntryListingQueryParams(response_fields="chemical_formula_reduced,_exmpl_foo")
+    )
+    projected = {field for field, include in criteria["projection"].items() if include}
+    assert projected == {
+        mapper.get_backend_field(field)
+        for field in mapper.get_required_fields() | {"chemical_formula_reduced"}
+    }
+    assert criteria["fields"] == mapper.get_required_fields() | {
+        "chemical_formula_reduced",
+        "_exmpl_foo",
+    }
+
+    criteria = structures.handle_query_params(EntryListingQueryParams())
+    projected = {field for field, include in criteria["projection"].items() if include}
+    assert projected == {
+        mapper.get_backend_field(field) for field in structures.all_fields
+    }
+
+
+def test_find_by_ids(client):
+    """Test that entries can be fetched in chunks by their IDs, both with the
+    backend-specific query and with the generic OPTIMADE filter fallback."""
+    from optimade.server.entry_collections import EntryCollection
+
+    structures = client.app.state.entry_collections["structures"]
+    ids = ["mpf_1", "mpf_3", "mpf_1", "mpf_23", "not_an_id"]
+
+    for chunk_size in (None, 2):
+        results = structures.find_by_ids(ids, chunk_size=chunk_size)
+        assert sorted(result["id"] for result in results) == [
+            "mpf_1",
+            "mpf_23",
+            "mpf_3",
+        ]
+        assert all("attributes" in result for result in results)
+
+    assert structures.find_by_ids([]) == []
+
+    # The generic fallback does not go through the cache of transformed filters
+    cache_info = structures.filter_cache_info()
+    ids_filter = EntryCollection._get_ids_filter(structures, ["mpf_1", "mpf_3"])
+    assert structures.filter_cache_info() == cache_info
+    assert ids_filter == structures.transform_filter('id="mpf_1" OR id="mpf_3"')
+
+
+def test_find_async(client):
+    """Test that the asynchronous query path returns the same results as `find()`."""
+    import asyncio
+
+    from optimade.server.query_params import EntryListingQueryParams
+
+    structures = client.app.state.entry_collections["structures"]
+    params = EntryListingQueryParams(
+        filter="nelements>=2", sort="-nelements", page_limit=3, include=""
+    )
+
+    assert asyncio.run(structures.find_async(params)) == structures.find(params)
+    assert asyncio.run(structures.len_async()) == len(structures)
+    assert asyncio.run(structures.count_async(filter={})) == structures.count(filter={})
+    assert sorted(
+        result["id"] for result in asyncio.run(structures.find_by_ids_async(["mpf_1"]))
+    ) == ["mpf_1"]
+
+
+def test_timings_and_slow_queries(client, monkeypatch):
+    """Test that the steps of a query are timed when timings are being collected,
+    and that queries above the slow query threshold are logged with their filter."""
+    from optimade.server.query_params import EntryListingQueryParams
+    from optimade.server.timing import REQUEST_TIMINGS, RequestTimings
+
+    structures = client.app.state.entry_collections["structures"]
+    monkeypatch.setattr(
+        structures,
+        "config",
+        structures.config.model_copy(update={"slow_query_threshold": 0.0}),
+    )
+    slow_queries = []
+    monkeypatch.setattr(
+        structures, "_log_slow_query", lambda *args: slow_queries.append(args)
+    )
+
+    filter_ = 'nelements>=2 AND elements HAS "Ac" AND nsites<1000'
+    timings = RequestTimings()
+    token = REQUEST_TIMINGS.set(timings)
+    try:
+        structures.find(EntryListingQueryParams(filter=filter_))
+    finally:
+        REQUEST_TIMINGS.reset(token)
+
+    assert {"parse", "transform", "find", "map_back"} <= set(timings.durations)
+    assert all(duration >= 0 for duration in timings.durations.values())
+    assert "parse;dur=" in timings.header_value()
+
+    assert len(slow_queries) == 1
+    params, criteria, duration = slow_queries[0]
+    assert params.filter == filter_
+    assert criteria["filter"] == structures.transform_filter(filter_)
+    assert duration >= 0
+
+
+def test_slow_query_plans_in_background(client, monkeypatch):
+    """Test that the query plans of slow queries are retrieved by a background thread,
+    at most once per `slow_query_explain_interval` for the same filter."""
+    import threading
+    from collections import OrderedDict
+
+    from optimade.server.entry_collections.entry_collections import (
+        _get_explain_executor,
+    )
+    from optimade.server.query_params import EntryListingQueryParams
+
+    structures = client.app.state.entry_collections["structures"]
+    monkeypatch.setattr(
+        structures,
+        "config",
+        structures.config.model_copy(
+            update={"slow_query_threshold": 0.0, "slow_query_explain_interval": 60.0}
+        ),
+    )
+    monkeypatch.setattr(structures, "_explained_filters", OrderedDict())
+    explained = []
+
+    def explain(criteria):
+        explained.append((criteria["filter"], threading.current_thread()))
+        return "query plan"
+
+    monkeypatch.setattr(structures, "explain", explain)
+
+    filters = ["nelements>=2", "nelements>=2", "nelements<2"]
+    for filter_ in filters:
+        structures.find(EntryListingQueryParams(filter=filter_))
+    # Wait for the (single) background thread to retrieve the query plans
+    _get_explain_executor().submit(lambda: None).result()
+
+    assert [filter_ for filter_, _ in explained] == [
+        structures.transform_filter("nelements>=2"),
+        structures.transform_filter("nelements<2"),
+    ]
+    assert all(thread is not threading.current_thread() for _, thread in explained)
+
+    # Once the interval has passed, the query plan is retrieved again
+    monkeypatch.setattr(
+        structures,
+        "config",
+        structures.config.model_copy(update={"slow_query_explain_interval": 0.0}),
+    )
+    structures.find(EntryListingQueryParams(filter="nelements>=2"))
+    _get_explain_executor().submit(lambda: None).result()
+    assert len(explained) == 3
+
+
+def test_next_query_params_explicit_page_offset(client, monkeypatch):
+    """Test that an explicit `page_offset=0` keeps offset-based pagination for the
+    next page, also when the collection defaults to value-based pagination."""
+    from optimade.server.entry_collections.entry_collections import (
+        PaginationMechanism,
+    )
+    from optimade.server.query_params import EntryListingQueryParams
+
+    structures = client.app.state.entry_collections["structures"]
+    monkeypatch.setattr(structures, "pagination_mechanism", PaginationMechanism.ABOVE)
+    results = [{"id": "mpf_1"}, {"id": "mpf_3"}]
+
+    assert structures.get_next_query_params(
+        EntryListingQueryParams(page_offset=0, page_limit=2), results
+    ) == {"page_offset": ["2"]}
+    assert structures.get_next_query_params(
+        EntryListingQueryParams(page_limit=2), results
+    ) == {"page_above": ["mpf_3"]}
+
+
+def test_keyset_filter_rejects_invalid_page_above(client):
+    """Test that `page_above` values that cannot be decoded, or that contain anything
+    but the values of the sort fields, are refused rather than put in the query."""
+    import datetime
+
+    import pytest
+    from bson import ObjectId
+
+    from optimade.exceptions import BadRequest
+    from optimade.server.entry_collections.mongo import MongoCollection
+
+    structures = client.app.state.entry_collections["structures"]
+    if not isinstance(structures, MongoCollection):  # pragma: no cover
+        pytest.skip("Value-based pagination is only implemented for MongoDB")
+
+    keyset_sort = [("last_modified", 1), ("id", 1)]
+    for page_above in (
+        '[{"$oid": "zz"}, "x"]',
+        '[{"$date": "x"}, "x"]',
+        '[{"$binary": 1}, "x"]',
+        '[{"$gt": ""}, "x"]',
+        '[["x"], "x"]',
+        '["x"]',
+        "not JSON",
+    ):
+        with pytest.raises(BadRequest):
+            structures._get_keyset_filter(page_above, keyset_sort)
+
+    last_modified = datetime.datetime(2020, 1, 1)
+    oid = ObjectId()
+    assert structures._get_keyset_filter(
+        f'[{{"$date": "2020-01-01T00:00:00Z"}}, {{"$oid": "{oid}"}}]', keyset_sort
+    ) == {
+        "$or": [
+            {"last_modified": {"$gt": last_modified}},
+            {"$and": [{"last_modified": last_modified}, {"id": {"$gt": oid}}]},
+        ]
+    }
+
+
+def test_close_async_on_shutdown(client, monkeypatch):
+    """Test that the asynchronous database clients of the entry collections are
+    closed when the app shuts down."""
+    from fastapi.testclient import TestClient
+
+    entry_collections = client.app.state.entry_collections
+    closed = []
+    for name, collection in entry_collections.items():
+
+        async def close_async(name=name):
+            closed.append(name)
+
+        monkeypatch.setattr(collection, "close_async", close_async)
+
+    with TestClient(client.app):
+        assert not closed
+    assert sorted(closed) == sorted(entry_collections)
+
+
+def test_async_mongo_client_per_app(client, index_client, monkeypatch):
+    """Test that each app creates its own asynchronous MongoDB client when it starts,
+    and only closes that client when it shuts down."""
+    import pytest
+    from fastapi.testclient import TestClient
+
+    from optimade.server.config import SupportedBackend
+    from optimade.server.entry_collections import mongo
+
+    apps = (client.app, index_client.app)
+    for app in apps:
+        if not isinstance(
+            app.state.entry_collections["links"], mongo.MongoCollection
+        ):  # pragma: no cover
+            pytest.skip("Requires a MongoDB backend")
+
+    class AsyncMongoClient:
+        closed = False
+
+        def __getitem__(self, name):
+            return self
+
+        async def close(self):
+            self.closed = True
+
+    created = []
+
+    def create_async_mongo_client(config):
+        created.append(AsyncMongoClient())
+        return created[-1]
+
+    monkeypatch.setattr(mongo, "create_async_mongo_client", create_async_mongo_client)
+    for app in apps:
+        monkeypatch.setattr(
+            app.state.config, "database_backend", SupportedBackend.MONGODB
+        )
+
+    def async_collections(app):
+        return {
+            collection.async_collection
+            for collection in app.state.entry_collections.values()
+        }
+
+    with TestClient(client.app):
+        with TestClient(index_client.app):
+            first, second = created
+            assert async_collections(client.app) == {first}
+            assert async_collections(index_client.app) == {second}
+        assert second.closed and not first.closed
+        assert async_collections(client.app) == {first}
+        assert async_collections(index_client.app) == {None}
+    assert first.closed
+    assert async_collections(client.app) == {None}
@@ -43,3 +43,54 @@ def test_indexes_are_created_where_appropriate(client):
         # Match either for "Duplicate" (mongomock) or "duplicate" (mongodb)
         with pytest.raises(pymongo.errors.BulkWriteError, match="uplicate"):
             entry_collections[_type].insert([canary])  # type: ignore
+
+
+@pytest.mark.skipif(
+    CONFIG.database_backend.value not in ("mongomock", "mongodb"),
+    reason="Skipping index test when testing the elasticsearch backend.",
+)
+def test_recommended_indexes():
+    """Test that the recommended indexes cover the mandatory queryable fields and
+    sort fields, and that filters are only reported as unindexed until they exist."""
+    from optimade.models import StructureResource
+    from optimade.server.entry_collections.mongo import MongoCollection
+    from optimade.server.indexes import read_query_log
+    from optimade.server.mappers import StructureMapper
+
+    collection = MongoCollection(
+        name="test_recommended_indexes",
+        resource_cls=StructureResource,
+        resource_mapper=StructureMapper(config=CONFIG),
+        config=CONFIG,
+    )
+    collection.collection.drop()
+
+    get_backend_field = collection.resource_mapper.get_backend_field
+    id_field = get_backend_field("id")
+    recommended = collection.get_recommended_indexes()
+    for field in ("elements", "nelements", "chemical_formula_reduced", "nsites"):
+        assert [(get_backend_field(field), 1)] in recommended
+    assert [(get_backend_field("last_modified"), -1), (id_field, 1)] in recommended
+    assert [(get_backend_field("type"), 1)] not in recommended
+
+    filter_ = 'nelements=2 AND elements HAS "Si"'
+    assert collection.get_unindexed_fields(filter_) == {
+        get_backend_field("nelements"),
+        get_backend_field("elements"),
+    }
+
+    assert collection.create_recommended_indexes() == recommended
+    assert collection.create_recommended_indexes() == []
+    assert collection.get_unindexed_fields(filter_) == set()
+    assert collection.get_unindexed_fields('_exmpl_chemsys = "Si"') == {
+        get_backend_field("_exmpl_chemsys")
+    }
+
+    log = [
+        '127.0.0.1 - "GET /v1/structures?filter=nelements%3D2&page_limit=5 HTTP/1.1" 200',
+        '127.0.0.1 - "GET /v1/info HTTP/1.1" 200',
+        '127.0.0.1 - "GET /v1/references?sort=id HTTP/1.1" 200',
+    ]
+    assert list(read_query_log(log)) == [("structures", "nelements=2")]
+
+    collection.collection.drop()
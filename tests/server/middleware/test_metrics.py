@@ -0,0 +1,85 @@
+"""Test the AddMetrics middleware and the metrics endpoint"""
+
+
+def test_metrics():
+    """Test that requests are recorded by route, with their timed steps and counted
+    events, and served in the Prometheus text format."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from optimade.server.metrics import Metrics
+    from optimade.server.middleware import AddMetrics
+    from optimade.server.routers import metrics
+    from optimade.server.timing import count, timed
+
+    app = FastAPI()
+    app.state.metrics = Metrics(buckets=(0.5, 1000.0))
+    app.add_middleware(AddMetrics)
+    app.include_router(metrics.router)
+
+    @app.get("/entries/{entry_id}")
+    def entry(entry_id: str):
+        with timed("find"):
+            count("documents_returned", 2)
+        return {}
+
+    client = TestClient(app)
+    for entry_id in ("a", "b"):
+        assert client.get(f"/entries/{entry_id}").status_code == 200
+    assert client.get("/missing").status_code == 404
+
+    response = client.get("/extensions/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    lines = response.text.splitlines()
+
+    assert (
+        'optimade_requests_total{method="GET",endpoint="/entries/{entry_id}",status="200"} 2'
+        in lines
+    )
+    assert (
+        'optimade_requests_total{method="GET",endpoint="unmatched",status="404"} 1'
+        in lines
+    )
+    assert 'optimade_step_duration_seconds_bucket{step="find",le="1000.0"} 2' in lines
+    assert 'optimade_step_duration_seconds_bucket{step="find",le="+Inf"} 2' in lines
+    assert 'optimade_step_duration_seconds_count{step="find"} 2' in lines
+    assert (
+        'optimade_request_duration_seconds_count{method="GET",endpoint="/entries/{entry_id}"} 2'
+        in lines
+    )
+    assert "optimade_documents_returned_total 4" in lines
+    assert "optimade_count_timeouts_total 0" in lines
+
+
+def test_filter_cache_metrics(client):
+    """Test that the hits and misses of the filter caches of the entry collections
+    are exported by the metrics endpoint."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from optimade.server.metrics import Metrics
+    from optimade.server.routers import metrics
+
+    entry_collections = client.app.state.entry_collections
+    structures = entry_collections["structures"]
+    structures.transform_filter('elements HAS "Si"')
+    structures.transform_filter('elements HAS "Si"')
+    cache_info = structures.filter_cache_info()
+
+    app = FastAPI()
+    app.state.metrics = Metrics()
+    app.state.entry_collections = entry_collections
+    app.include_router(metrics.router)
+
+    lines = TestClient(app).get("/extensions/metrics").text.splitlines()
+    assert "# TYPE optimade_filter_cache_hits_total counter" in lines
+    assert (
+        f'optimade_filter_cache_hits_total{{collection="structures"}} {cache_info.hits}'
+        in lines
+    )
+    assert (
+        f'optimade_filter_cache_misses_total{{collection="structures"}} {cache_info.misses}'
+        in lines
+    )
+    assert cache_info.hits >= 1
@@ -0,0 +1,32 @@
+"""Test the AddServerTiming middleware"""
+
+
+def test_server_timing_header():
+    """Test that the timed steps and the total duration of a request are reported
+    in the `Server-Timing` header, and that nothing is collected outside requests."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from optimade.server.middleware import AddServerTiming
+    from optimade.server.timing import REQUEST_TIMINGS, timed
+
+    app = FastAPI()
+    app.add_middleware(AddServerTiming)
+
+    @app.get("/timed")
+    def timed_endpoint():
+        for _ in range(2):
+            with timed("step"):
+                pass
+        return {}
+
+    response = TestClient(app).get("/timed")
+    assert response.status_code == 200
+    names = [
+        metric.split(";")[0] for metric in response.headers["Server-Timing"].split(", ")
+    ]
+    assert names == ["step", "total"]
+
+    with timed("step"):
+        pass
+    assert REQUEST_TIMINGS.get() is None
@@ -97,3 +97,36 @@ def test_empty_response_chunk_it_up(client_with_empty_extension_endpoint):
     response = client_with_empty_extension_endpoint.get("/extensions/test_empty_body")
     add_warning_middleware._warnings = []
     assert response.content == b""
+
+
+def test_meta_values_includes_collected_warnings():
+    """Make sure warnings collected for the current request are added to `meta`
+    before serialization, so the middleware need not re-write the response body."""
+    from optimade.server.config import ServerConfig
+    from optimade.server.routers.utils import (
+        REQUEST_WARNINGS,
+        CollectedWarnings,
+        meta_values,
+    )
+
+    collected_warnings = CollectedWarnings()
+    collected_warnings.warnings.append(
+        {"title": "OptimadeWarning", "detail": "It's all gone awry!"}
+    )
+
+    token = REQUEST_WARNINGS.set(collected_warnings)
+    try:
+        meta = meta_values(
+            ServerConfig(),
+            url="http://example.org/v1/structures",
+            data_returned=0,
+            data_available=0,
+            more_data_available=False,
+        )
+    finally:
+        REQUEST_WARNINGS.reset(token)
+
+    assert collected_warnings.serialized == 1
+    assert [
+        warning.model_dump(exclude_unset=True) for warning in meta.warnings
+    ] == collected_warnings.warnings
@@ -167,3 +167,43 @@ class TestIndexInfoEndpoint(IndexEndpointTests):
         relationships = ["default"]
         self.check_keys(relationships, self.json_response["data"]["relationships"])
         assert len(self.json_response["data"]["relationships"]["default"]) == 1
+
+
+def test_info_data_is_cached(client):
+    """Check that the info `data` is only generated once per app, while `meta` is
+    regenerated for every request."""
+    first = client.get("/info/structures")
+    assert first.status_code == 200
+    info_cache = client.app.state.info_cache
+    cached = info_cache.get(("info/structures", None))
+    assert cached is not None
+
+    second = client.get("/info/structures?response_format=json")
+    assert second.status_code == 200
+    assert info_cache.get(("info/structures", None)) is cached
+    assert second.json()["data"] == first.json()["data"]
+    assert second.json()["meta"]["query"] != first.json()["meta"]["query"]
+
+
+def test_info_is_cached_per_base_url(client, monkeypatch):
+    """Check that `/info` is cached per base URL when it is derived from the request
+    URL, for a bounded number of base URLs."""
+    from optimade.server.routers.info import _InfoCache
+
+    state = client.app.state
+    info_cache = _InfoCache(maxsize=2)
+    monkeypatch.setattr(state, "info_cache", info_cache)
+    monkeypatch.setattr(
+        state, "config", state.config.model_copy(update={"base_url": None})
+    )
+
+    for host in ("example.org", "example.com", "example.net", "example.com"):
+        response = client.get("/info", headers={"host": host})
+        assert response.status_code == 200
+        assert response.json()["data"]["attributes"]["available_api_versions"][0][
+            "url"
+        ].startswith(f"http://{host}/")
+
+    assert len(info_cache) == 2
+    assert info_cache.get(("info", "http://example.org")) is None
+    assert info_cache.get(("info", "http://example.com")) is not None
@@ -59,6 +59,55 @@ class TestStructuresEndpoint(RegularEndpointTests):
 
         assert len(cursor) == total_data
 
+    @pytest.mark.skipif(
+        CONFIG.database_backend == SupportedBackend.ELASTIC,
+        reason="Value-based pagination is only implemented for MongoDB.",
+    )
+    @pytest.mark.parametrize("sort", ["", "-id"])
+    def test_get_next_responses_page_above(self, get_good_response, sort):
+        """Check value-based pagination on `id`"""
+        total_data = self.json_response["meta"]["data_available"]
+        page_limit = 5
+
+        # Start from a value below (or, for descending order, above) all IDs
+        next_request = self.request_str + f"?page_limit={page_limit}"
+        if sort:
+            next_request += f"&sort={sort}&page_above=~"
+        else:
+            next_request += "&page_above="
+
+        cursor = []
+        more_data_available = True
+        while more_data_available:
+            next_response = get_good_response(next_request)
+            assert next_response["meta"]["data_returned"] == total_data
+            cursor.extend(next_response["data"])
+            more_data_available = next_response["meta"]["more_data_available"]
+            next_request = next_response["links"]["next"]
+            if more_data_available:
+                assert len(next_response["data"]) == page_limit
+                assert "page_above=" in next_request
+                assert "page_offset" not in next_request
+            else:
+                assert next_request is None
+
+        ids = [entry["id"] for entry in cursor]
+        assert ids == sorted(ids, reverse=bool(sort))
+        assert len(set(ids)) == total_data
+
+    @pytest.mark.skipif(
+        CONFIG.database_backend == SupportedBackend.ELASTIC,
+        reason="Value-based pagination is only implemented for MongoDB.",
+    )
+    def test_page_above_unindexed_sort(self, check_error_response):
+        """Check that value-based pagination is refused for unindexed sort fields"""
+        check_error_response(
+            self.request_str + "?sort=nelements&page_above=2",
+            expected_status=400,
+            expected_title="Bad Request",
+            expected_detail="`page_above` can only be used when sorting on `id` or on indexed fields.",
+        )
+
 
 class TestSingleStructureEndpoint(RegularEndpointTests):
     """Tests for /structures/<entry_id>"""
@@ -183,6 +183,41 @@ def test_get_all_databases_threads_session():
     assert mock_get_links.call_args.kwargs.get("session") is session
 
 
+def test_get_all_databases_concurrent():
+    """`get_all_databases` must yield the databases of fast providers without
+    waiting for slower ones."""
+    import time
+    from types import SimpleNamespace
+
+    from optimade import utils
+
+    def get_child_database_links(provider, **kwargs):
+        if provider["id"] == "slow":
+            time.sleep(1)
+        return [
+            SimpleNamespace(
+                attributes=SimpleNamespace(base_url=f"https://{provider['id']}.org")
+            )
+        ]
+
+    providers = [
+        {"id": "slow", "base_url": "https://slow.org"},
+        {"id": "fast", "base_url": "https://fast.org"},
+    ]
+
+    with (
+        mock.patch.object(utils, "get_providers", return_value=providers),
+        mock.patch.object(
+            utils, "get_child_database_links", side_effect=get_child_database_links
+        ),
+    ):
+        start = time.monotonic()
+        databases = iter(utils.get_all_databases(max_workers=2))
+        assert next(databases) == "https://fast.org"
+        assert time.monotonic() - start < 1
+        assert list(databases) == ["https://slow.org"]
+
+
 def test_get_providers_warning(caplog, top_dir):
     """Make sure a warning is logged as a last resort."""
     import copy
@@ -220,3 +255,310 @@ def test_get_providers_warning(caplog, top_dir):
             from optimade.server.data import providers
 
             assert providers == providers_cache
+
+
+def test_orjson_response():
+    """Check that the orjson response class handles the non-JSON types found in responses."""
+    from datetime import datetime, timezone
+
+    from bson import ObjectId
+
+    from optimade.models import ToplevelLinks
+    from optimade.server.routers.utils import ORJSONAPIResponse
+
+    orjson = pytest.importorskip("orjson")
+
+    response = ORJSONAPIResponse(
+        {
+            "links": ToplevelLinks(next=None),
+            "data": [
+                {
+                    "_id": ObjectId("5cfb441f053b174410700d02"),
+                    "last_modified": datetime(2020, 1, 1, tzinfo=timezone.utc),
+                    "value": float("nan"),
+                }
+            ],
+        }
+    )
+    assert response.media_type == "application/vnd.api+json"
+    assert orjson.loads(response.body) == {
+        "links": {"next": None},
+        "data": [
+            {
+                "_id": "5cfb441f053b174410700d02",
+                "last_modified": "2020-01-01T00:00:00Z",
+                "value": None,
+            }
+        ],
+    }
+
+
+@pytest.mark.parametrize("response_serializer", ["json", "orjson"])
+def test_sampled_response_validation(response_serializer, client, monkeypatch):
+    """Check that responses skipping validation are identical to validated ones."""
+    if response_serializer == "orjson":
+        pytest.importorskip("orjson")
+
+    config = client.app.state.config
+    request = "/structures?page_limit=5&include=references,files"
+
+    validated = client.get(request).json()
+
+    monkeypatch.setattr(config, "validate_api_response_sample_rate", 0.0)
+    monkeypatch.setattr(config, "response_serializer", response_serializer)
+    response = client.get(request)
+    assert response.headers["content-type"] == "application/vnd.api+json"
+    unvalidated = response.json()
+
+    for json_response in (validated, unvalidated):
+        json_response["meta"].pop("time_stamp")
+    assert unvalidated == validated
+
+
+def test_response_validated_off_event_loop(client, monkeypatch):
+    """Check that sampled responses of the asynchronous endpoints are validated against
+    their response model in a worker thread, rather than on the event loop."""
+    import asyncio
+
+    from optimade.models import StructureResponseMany, StructureResponseOne
+    from optimade.server.routers import utils
+
+    validated = []
+    original_get_response_adapter = utils._get_response_adapter
+
+    def get_response_adapter(response_model):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            on_event_loop = False
+        else:
+            on_event_loop = True
+        validated.append((response_model, on_event_loop))
+        return original_get_response_adapter(response_model)
+
+    monkeypatch.setattr(utils, "_get_response_adapter", get_response_adapter)
+
+    assert client.get("/structures?page_limit=5").status_code == 200
+    assert client.get("/structures/mpf_1").status_code == 200
+    assert validated == [(StructureResponseMany, False), (StructureResponseOne, False)]
+
+
+def test_validation_cache(client, monkeypatch):
+    """Check that unchanged entries are only validated once when the validation cache is
+    enabled, without changing the response."""
+    config = client.app.state.config
+    structures = client.app.state.entry_collections["structures"]
+    requests = (
+        "/structures?page_limit=5&include=references",
+        "/structures?page_limit=5&response_fields=nelements",
+        "/structures/mpf_1",
+    )
+
+    expected = []
+    for request in requests:
+        expected.append(client.get(request).json())
+        expected[-1]["meta"].pop("time_stamp")
+
+    monkeypatch.setattr(config, "validation_cache_size", 100)
+    validated_entries = []
+    original_validate = structures.resource_cls.model_validate
+
+    def model_validate(entry, *args, **kwargs):
+        validated_entries.append(entry["id"])
+        return original_validate(entry, *args, **kwargs)
+
+    monkeypatch.setattr(structures.resource_cls, "model_validate", model_validate)
+
+    for _ in range(2):
+        for request, expected_response in zip(requests, expected):
+            json_response = client.get(request).json()
+            json_response["meta"].pop("time_stamp")
+            assert json_response == expected_response
+
+    # Full entries are validated once (`mpf_1` is also in the first page), whereas
+    # entries pruned of `last_modified` cannot be cached
+    assert sorted(validated_entries) == sorted(
+        [entry["id"] for entry in expected[0]["data"]]
+        + 2 * [entry["id"] for entry in expected[1]["data"]]
+    )
+    assert structures.validate_entry(expected[1]["data"][0]) is None
+
+
+@pytest.mark.parametrize("processes,writers", [(0, 1), (2, 3)])
+def test_insert_from_jsonl(processes, writers, tmp_path):
+    """Check that a JSONL file is inserted completely with and without parsing and
+    inserting concurrently, and that a failed (partial) insert can be resumed from its
+    checkpoint without duplicating entries, also with another batch size."""
+    import json
+    from pathlib import Path
+
+    import optimade.server.data
+    from optimade.server.config import ServerConfig
+    from optimade.server.entry_collections import create_entry_collections
+    from optimade.utils import insert_from_jsonl
+
+    config = ServerConfig(
+        **{
+            f"{entry_type}_collection": f"test_insert_from_jsonl_{entry_type}"
+            for entry_type in ("links", "references", "structures", "files")
+        }
+    )
+    if config.database_backend.value not in ("mongomock", "mongodb"):
+        pytest.skip("Checking the inserted data is only implemented for MongoDB.")
+
+    entry_collections = create_entry_collections(config)
+    for collection in entry_collections.values():
+        collection.collection.drop()
+
+    jsonl_path = Path(optimade.server.data.__file__).parent / "test_data.jsonl"
+    checkpoint_path = tmp_path / "checkpoint.json"
+
+    structures = entry_collections["structures"]
+    original_insert = structures.insert
+    inserts = []
+
+    def failing_insert(data):
+        inserts.append(len(data))
+        if len(inserts) == 2:
+            # Fail after having inserted part of the chunk
+            original_insert(data[:2])
+            raise RuntimeError("Insert failed")
+        original_insert(data)
+
+    structures.insert = failing_insert
+    with pytest.raises(RuntimeError, match="Insert failed"):
+        insert_from_jsonl(
+            jsonl_path,
+            entry_collections,
+            batch_size=5,
+            processes=processes,
+            writers=writers,
+            checkpoint_path=checkpoint_path,
+        )
+    assert json.loads(checkpoint_path.read_text())["batch_size"] == 5
+    assert len(structures) < 17
+
+    # Chunks are resumed with the batch size of the checkpoint
+    structures.insert = original_insert
+    insert_from_jsonl(
+        jsonl_path,
+        entry_collections,
+        batch_size=3,
+        processes=processes,
+        writers=writers,
+        checkpoint_path=checkpoint_path,
+    )
+    assert not checkpoint_path.exists()
+
+    expected = {"structures": 17, "references": 4, "files": 3, "links": 0}
+    for entry_type, collection in entry_collections.items():
+        ids = [doc["id"] for doc in collection.collection.find({}, {"id": 1})]
+        assert len(ids) == len(set(ids)) == expected[entry_type]
+        collection.collection.drop()
+
+
+def test_insert_from_jsonl_validate(tmp_path):
+    """Check that valid entries are stamped on insertion and invalid ones reported."""
+    import json
+    from pathlib import Path
+
+    import optimade.server.data
+    from optimade import __version__
+    from optimade.server.config import ServerConfig
+    from optimade.server.entry_collections import (
+        VALIDATION_STAMP_FIELD,
+        create_entry_collections,
+    )
+    from optimade.utils import insert_from_jsonl
+
+    config = ServerConfig(
+        **{
+            f"{entry_type}_collection": f"test_insert_from_jsonl_validate_{entry_type}"
+            for entry_type in ("links", "references", "structures", "files")
+        }
+    )
+    if config.database_backend.value not in ("mongomock", "mongodb"):
+        pytest.skip("Checking the inserted data is only implemented for MongoDB.")
+
+    entry_collections = create_entry_collections(config)
+    for collection in entry_collections.values():
+        collection.collection.drop()
+
+    # Break the first structure
+    lines = (
+        (Path(optimade.server.data.__file__).parent / "test_data.jsonl")
+        .read_text()
+        .splitlines()
+    )
+    invalid_id = None
+    for i, line in enumerate(lines):
+        entry = json.loads(line)
+        if entry.get("type") == "structures":
+            invalid_id = entry["id"]
+            entry["attributes"]["nsites"] = "many"
+            lines[i] = json.dumps(entry)
+            break
+    jsonl_path = tmp_path / "data.jsonl"
+    jsonl_path.write_text("\n".join(lines) + "\n")
+
+    report_path = tmp_path / "report.jsonl"
+    insert_from_jsonl(
+        jsonl_path,
+        entry_collections,
+        batch_size=5,
+        validate=True,
+        validation_report_path=report_path,
+    )
+
+    report = [json.loads(line) for line in report_path.read_text().splitlines()]
+    assert invalid_id in {failure["id"] for failure in report}
+    assert all(failure["errors"] for failure in report)
+
+    for entry_type, collection in entry_collections.items():
+        documents = list(collection.collection.find({}))
+        stamped = {
+            doc["id"]
+            for doc in documents
+            if doc.get(VALIDATION_STAMP_FIELD) == __version__
+        }
+        reported = {
+            failure["id"] for failure in report if failure["type"] == entry_type
+        }
+        assert stamped | reported == {doc["id"] for doc in documents}
+        assert not stamped & reported
+        collection.collection.drop()
+
+
+def test_included_relationships_are_capped(client, monkeypatch):
+    """Check that at most `page_limit_max` related resources are included,
+    with a warning if any are left out."""
+    from optimade.server.routers.utils import get_included_relationships
+    from optimade.warnings import TooManyValues
+
+    entry_collections = client.app.state.entry_collections
+    results = [
+        {
+            "id": "mpf_1",
+            "relationships": {
+                "references": {
+                    "data": [
+                        {"type": "references", "id": "dijkstra1968"},
+                        {"type": "references", "id": "maddox1988"},
+                    ]
+                },
+                "files": {"data": [{"type": "files", "id": "file_2"}]},
+            },
+        }
+    ]
+    include = ["references", "files"]
+    assert len(get_included_relationships(results, entry_collections, include)) == 3
+
+    for collection in entry_collections.values():
+        monkeypatch.setattr(
+            collection,
+            "config",
+            collection.config.model_copy(update={"page_limit_max": 2}),
+        )
+    with pytest.warns(TooManyValues, match="Only 2 of the 3 related resources"):
+        included = get_included_relationships(results, entry_collections, include)
+    assert sorted(entry["id"] for entry in included) == ["dijkstra1968", "maddox1988"]
@@ -613,3 +613,162 @@ def test_guardrail_sync(http_client):
     )
     assert len(result[TEST_URL].errors) == 1
     assert "infinite" in result[TEST_URL].errors[0]
+
+
+@pytest.mark.asyncio
+async def test_client_stream_async(async_http_client):
+    """Test that pages of results are streamed from all providers."""
+    cli = OptimadeClient(
+        base_urls=TEST_URLS,
+        http_client=async_http_client,
+        use_async=True,
+    )
+    num_results = {url: 0 for url in TEST_URLS}
+    async for base_url, page in cli.stream_async(filter='elements HAS "Ag"'):
+        assert not page["errors"]
+        num_results[base_url] += len(page["data"])
+    assert num_results == {url: 11 for url in TEST_URLS}
+
+
+@pytest.mark.parametrize("use_async", [True, False])
+def test_client_stream_to_sink(async_http_client, http_client, use_async, tmp_path):
+    """Test streaming results to JSON and JSON Lines sinks."""
+    from optimade.client.utils import JSONLinesSink, JSONSink
+
+    cli = OptimadeClient(
+        base_urls=TEST_URLS,
+        use_async=use_async,
+        http_client=async_http_client if use_async else http_client,
+    )
+
+    with JSONLinesSink(tmp_path / "results.jsonl") as sink:
+        num_results = cli.stream_to(sink, filter='elements HAS "Ag"')
+    assert num_results == {url: 11 for url in TEST_URLS}
+    with open(tmp_path / "results.jsonl") as f:
+        lines = [json.loads(line) for line in f]
+    for url in TEST_URLS:
+        assert len([_ for _ in lines if _["base_url"] == url and "data" in _]) == 11
+        assert len([_ for _ in lines if _["base_url"] == url and "included" in _]) == 2
+
+    with JSONSink(tmp_path / "results.json") as sink:
+        cli.stream_to(sink, filter='elements HAS "Ag"')
+    with open(tmp_path / "results.json") as f:
+        results = json.load(f)
+    expected = cli.get(filter='elements HAS "Ag"')["structures"]['elements HAS "Ag"']
+    for url in TEST_URLS:
+        streamed = results["structures"]['elements HAS "Ag"'][url]
+        assert streamed["data"] == expected[url]["data"]
+        assert len(streamed["included"]) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch_pages", [1, 3])
+async def test_client_prefetch_pages(async_http_client, prefetch_pages):
+    """Test that prefetching pages returns the same results as serial pagination,
+    including when a callback changes the next page."""
+    serial = OptimadeClient(
+        base_urls=[TEST_URL],
+        http_client=async_http_client,
+        use_async=True,
+    )
+    prefetching = OptimadeClient(
+        base_urls=[TEST_URL],
+        http_client=async_http_client,
+        use_async=True,
+        prefetch_pages=prefetch_pages,
+    )
+    expected = await serial.get_one_async(
+        endpoint="structures", filter="", base_url=TEST_URL, page_limit=5
+    )
+    result = await prefetching.get_one_async(
+        endpoint="structures", filter="", base_url=TEST_URL, page_limit=5
+    )
+    assert [_["id"] for _ in result[TEST_URL].data] == [
+        _["id"] for _ in expected[TEST_URL].data
+    ]
+    assert len(result[TEST_URL].data) == 17
+
+    def page_skip_callback(_: str, results: dict) -> dict | None:
+        """A test callback that skips to the final page of results."""
+        if results["links"].get("next"):
+            return {"next": f"{TEST_URL}/structures?page_offset=16"}
+        return None
+
+    prefetching.callbacks = [page_skip_callback]
+    result = await prefetching.get_one_async(
+        endpoint="structures", filter="", base_url=TEST_URL, page_limit=5
+    )
+    # the first page is followed by the final page only
+    assert len(result[TEST_URL].data) == 6
+
+
+@pytest.mark.parametrize("use_async", [True, False])
+def test_client_connection_pooling(async_http_client, http_client, use_async):
+    """Test that the same HTTP client is reused across queries until closed."""
+    with OptimadeClient(
+        base_urls=TEST_URLS,
+        use_async=use_async,
+        http_client=async_http_client if use_async else http_client,
+    ) as cli:
+        cli.get('elements HAS "Ag"')
+        pooled = cli._pooled_async_client if use_async else cli._pooled_client
+        assert pooled is not None
+        cli.count('elements HAS "Ag"')
+        cli.list_properties("structures")
+        assert (cli._pooled_async_client if use_async else cli._pooled_client) is pooled
+
+    assert cli._pooled_async_client is None
+    assert cli._pooled_client is None
+
+
+def test_token_bucket_and_backoff():
+    """Test the pacing of requests to a host and the retry delays."""
+    from optimade.client.utils import TokenBucket, backoff_delay
+
+    bucket = TokenBucket(delay=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 9 < bucket.reserve() <= 10
+    bucket.pause(100)
+    assert bucket.reserve() > 99
+
+    for attempt in range(1, 10):
+        delay = min(8, 2 ** (attempt - 1))
+        assert delay / 2 <= backoff_delay(attempt, base=1, cap=8) <= delay
+
+
+def test_client_max_concurrent_requests(async_http_client):
+    """Test that limiting the number of concurrent requests still returns all results."""
+    cli = OptimadeClient(
+        base_urls=TEST_URLS,
+        use_async=True,
+        http_client=async_http_client,
+        max_concurrent_requests=1,
+    )
+    results = cli.get('elements HAS "Ag"')
+    for url in TEST_URLS:
+        assert len(results["structures"]['elements HAS "Ag"'][url]["data"]) == 11
+
+
+def test_client_close_stops_discovery(monkeypatch):
+    """Check that the databases of the registered providers are discovered lazily,
+    and that closing the client stops any pending discovery."""
+    import optimade.client.client
+
+    state = {"closed": False}
+
+    def get_all_databases(**kwargs):
+        try:
+            yield from TEST_URLS
+        finally:
+            state["closed"] = True
+
+    monkeypatch.setattr(optimade.client.client, "get_all_databases", get_all_databases)
+
+    cli = OptimadeClient()
+    assert cli.base_urls == TEST_URLS[:1]
+    assert not state["closed"]
+
+    cli.close()
+    assert state["closed"]
+    assert list(cli._iter_base_urls()) == TEST_URLS[:1]
@@ -0,0 +1,48 @@
+"""Tests for the `optimade-ingest` command-line tool."""
+
+import json
+
+import pytest
+
+
+def test_ingest(tmp_path, top_dir):
+    """Test that a JSONL file is loaded into the configured collections, and that
+    populated collections are only appended to on request."""
+    from optimade.server.config import ServerConfig
+    from optimade.server.entry_collections import create_entry_collections
+    from optimade.server.ingest import ingest
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                f"{entry_type}_collection": f"test_ingest_{entry_type}"
+                for entry_type in ("links", "references", "structures", "files")
+            }
+        )
+    )
+    jsonl_path = top_dir / "optimade" / "server" / "data" / "test_data.jsonl"
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("OPTIMADE_CONFIG_FILE", str(config_path))
+        config = ServerConfig()
+        if config.database_backend.value not in ("mongomock", "mongodb"):
+            pytest.skip("Checking the inserted data is only implemented for MongoDB.")
+
+        entry_collections = create_entry_collections(config)
+        for collection in entry_collections.values():
+            collection.collection.drop()
+
+        args = [str(jsonl_path), "--config", str(config_path), "--processes", "0"]
+        assert ingest(args) == 0
+        assert len(entry_collections["structures"]) == 17
+        assert len(entry_collections["references"]) == 4
+
+        # Refuse to insert into populated collections
+        assert ingest(args) == 1
+        assert len(entry_collections["structures"]) == 17
+
+        assert ingest([str(tmp_path / "missing.jsonl"), "--append"]) == 1
+
+        for collection in entry_collections.values():
+            collection.collection.drop()
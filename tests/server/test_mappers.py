@@ -93,3 +93,35 @@ def test_cached_mapper_properties():
     assert m2.get_backend_field("a") == "b"
     assert m2.get_backend_field("a") == "b"
     assert m1.get_backend_field("a") == "a"
+
+
+def test_map_back():
+    """Test that `map_back` renames aliased fields and splits out the attributes."""
+
+    class MyMapper(BaseResourceMapper):
+        ENTRY_RESOURCE_CLASS = StructureResource
+        ALIASES = (("id", "task_id"), ("field", "completely_different_field"))
+
+    mapper = MyMapper()
+    doc = {
+        "task_id": "mpf_1",
+        "completely_different_field": 1,
+        "nsites": 2,
+        "relationships": None,
+        "last_modified": "2020-01-01T00:00:00Z",
+    }
+    assert mapper.map_back(doc) == {
+        "relationships": None,
+        "id": "mpf_1",
+        "type": "structures",
+        "attributes": {
+            "nsites": 2,
+            "last_modified": "2020-01-01T00:00:00Z",
+            "field": 1,
+        },
+    }
+    # The input document must be left untouched
+    assert "task_id" in doc
+
+    with pytest.raises(Exception, match="Will overwrite doc field!"):
+        mapper.map_back({"task_id": "mpf_1", "attributes": {}})
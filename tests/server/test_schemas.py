@@ -61,3 +61,41 @@ def test_provider_field_schemas() -> None:
         "description": "A string representing the chemical system in an ordered fashion",
         "sortable": True,
     }
+
+
+def test_retrieve_queryable_properties_memoized() -> None:
+    """Tests that the queryable properties are memoized per schema, properties,
+    entry type and provider fields, and that copies are returned."""
+    from optimade.server.config import ServerConfig
+    from optimade.server.schemas import (
+        _QUERYABLE_PROPERTIES_CACHE,
+        ENTRY_INFO_SCHEMAS,
+        retrieve_queryable_properties,
+    )
+
+    config = ServerConfig()
+    schema = ENTRY_INFO_SCHEMAS["structures"]
+    top_level_props = ("id", "type", "attributes")
+
+    properties = retrieve_queryable_properties(
+        schema, top_level_props, "structures", config
+    )
+    cache_size = len(_QUERYABLE_PROPERTIES_CACHE)
+
+    properties["_exmpl_chemsys"]["description"] = "corrupted"
+    assert retrieve_queryable_properties(
+        schema, reversed(top_level_props), "structures", config
+    )["_exmpl_chemsys"]["description"] == (
+        "A string representing the chemical system in an ordered fashion"
+    )
+    assert len(_QUERYABLE_PROPERTIES_CACHE) == cache_size
+
+    other_config = ServerConfig(
+        provider_fields={"structures": [{"name": "other", "type": "integer"}]}
+    )
+    other_properties = retrieve_queryable_properties(
+        schema, top_level_props, "structures", other_config
+    )
+    assert len(_QUERYABLE_PROPERTIES_CACHE) == cache_size + 1
+    assert "_exmpl_chemsys" not in other_properties
+    assert other_properties["_exmpl_other"] == {"type": "integer", "sortable": True}